@@ -0,0 +1,16 @@
+import os
+
+# Override with JOB_ANALYZER_HOME to keep caches and databases elsewhere
+DEFAULT_DATA_DIR = os.path.join(os.path.expanduser("~"), ".job_trend_analyzer")
+
+
+def get_data_dir():
+    """Return the per-user directory for caches and local data, creating it if needed"""
+    data_dir = os.environ.get("JOB_ANALYZER_HOME") or DEFAULT_DATA_DIR
+    os.makedirs(data_dir, exist_ok=True)
+    return data_dir
+
+
+def get_data_path(filename):
+    """Return the path of a file inside the data directory"""
+    return os.path.join(get_data_dir(), filename)
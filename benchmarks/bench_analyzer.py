@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Trend Analysis Benchmark
+========================
+
+Times JobDataAnalyzer.analyze_trends on synthetic job sets of growing size:
+the original one-pass-per-statistic counting (baseline), the fused single
+pass over job dicts and over JobRecords, and the vectorized JobTable path.
+
+Usage:
+    python benchmarks/bench_analyzer.py [--sizes 10000 1000000 10000000] [--repeat N]
+
+Per-job dicts need about 1 KB each, so the dict and record runs are skipped
+above --max-dict-jobs; the JobTable run covers every size.
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_analyzer import JobDataAnalyzer, parse_salary
+from job_records import JobTable, to_records
+from synthetic_data import SyntheticJobGenerator
+
+
+def multi_pass_trends(jobs_data):
+    """The counting analyze_trends did before the fused pass: one pass per statistic"""
+    Counter(job.get('title', 'Unknown') for job in jobs_data).most_common(20)
+    all_skills = []
+    for job in jobs_data:
+        skills = job.get('skills', [])
+        if isinstance(skills, list):
+            all_skills.extend(skills)
+    Counter(all_skills).most_common(25)
+    Counter(job.get('location', 'Unknown') for job in jobs_data).most_common(15)
+    Counter(job.get('company', 'Unknown') for job in jobs_data).most_common(15)
+    Counter(job.get('date_posted') for job in jobs_data)
+    Counter(job.get('job_type', 'Full-time') for job in jobs_data)
+    salaries = [job.get('salary') for job in jobs_data if job.get('salary')]
+    [parse_salary.__wrapped__(salary) for salary in salaries]  # every salary parsed, uncached
+    Counter(job.get('source', 'Unknown') for job in jobs_data)
+    Counter(job.get('data_quality', 'live') for job in jobs_data)
+    sum(1 for job in jobs_data if len(job.get('sources') or ()) > 1)
+    len([job for job in jobs_data if 'remote' in job.get('location', '').lower() or
+         'remote' in job.get('job_type', '').lower()])
+    len([job for job in jobs_data if job.get('salary')])
+
+
+def best_time(function, jobs, repeat):
+    """Fastest of `repeat` runs, in seconds (analyzer output suppressed)"""
+    times = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            function(jobs)
+            times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run_benchmark(sizes, repeat, max_dict_jobs, seed):
+    analyzer = JobDataAnalyzer()
+    print(f"{'Jobs':>12}  {'Configuration':<34} {'seconds':>9} {'jobs/s':>12}")
+    print('-' * 72)
+    for size in sizes:
+        block = SyntheticJobGenerator(seed=seed).columns(size)
+        results = []
+
+        if size <= max_dict_jobs:
+            jobs = block.to_jobs()
+            results.append(('one pass per statistic (baseline)', best_time(multi_pass_trends, jobs, repeat)))
+            results.append(('fused pass, dicts', best_time(analyzer.analyze_trends, jobs, repeat)))
+            jobs = to_records(jobs)
+            results.append(('fused pass, JobRecords', best_time(analyzer.analyze_trends, jobs, repeat)))
+            del jobs
+            gc.collect()
+        else:
+            results.append(('dicts and JobRecords', None))
+
+        table = JobTable.from_synthetic(block, text=False)
+        del block
+        results.append(('vectorized, JobTable', best_time(analyzer.analyze_trends, table, repeat)))
+        del table
+        gc.collect()
+
+        for label, seconds in results:
+            if seconds is None:
+                print(f"{size:>12,}  {label:<34} {'skipped (over --max-dict-jobs)':>22}")
+            else:
+                print(f"{size:>12,}  {label:<34} {seconds:>9.3f} {size / seconds:>12,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 1_000_000, 10_000_000],
+                        help='job set sizes to analyze')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per configuration (best is shown)')
+    parser.add_argument('--max-dict-jobs', type=int, default=1_000_000,
+                        help='largest set analyzed as dicts and records')
+    parser.add_argument('--seed', type=int, default=42, help='synthetic data seed')
+    args = parser.parse_args()
+
+    print(f"📊 Benchmarking analyze_trends, best of {args.repeat}\n")
+    run_benchmark(args.sizes, args.repeat, args.max_dict_jobs, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+HTML Parser Benchmark
+=====================
+
+Compares the original parsing path (html.parser, full document tree) with
+the lxml backend and card-only (restricted) parsing on saved result pages.
+
+Usage:
+    python benchmarks/bench_parsers.py PAGES_DIR [--repeat N]
+    python benchmarks/bench_parsers.py --synthetic [--repeat N]
+
+Saved pages must be named after their source, e.g. glassdoor_python_1.html,
+indeed_java_2.html or linkedin_react_1.html.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_parser import available_backends
+from job_sources import get_source
+
+CONFIGURATIONS = [
+    ('html.parser, full tree (baseline)', 'html.parser', False),
+    ('html.parser, cards only', 'html.parser', True),
+    ('lxml, full tree', 'lxml', False),
+    ('lxml, cards only', 'lxml', True),
+]
+
+
+def load_pages(pages_dir):
+    """Load saved pages as (source, html) pairs"""
+    pages = []
+    for path in sorted(glob.glob(os.path.join(pages_dir, '*.html'))):
+        source = os.path.basename(path).split('_')[0].lower()
+        if source in ('linkedin', 'glassdoor', 'indeed'):
+            with open(path, 'rb') as f:
+                pages.append((source, f.read()))
+    return pages
+
+
+def synthetic_pages(cards_per_page=30, filler_blocks=400, first=0):
+    """Build result pages with realistic amounts of non-card markup
+
+    Cards are numbered from `first`, so consecutive pages hold different jobs.
+    """
+    filler = ''.join(f'<div class="nav-item"><a href="/x/{i}"><span>Menu {i}</span></a>'
+                     f'<script>var x{i} = {i};</script></div>' for i in range(filler_blocks))
+    glassdoor = ''.join(
+        f'<li data-test="jobListing"><a href="/job-listing/{i}">'
+        f'<div data-test="job-title">Senior Python Developer {i}</div></a>'
+        f'<div data-test="employer-name">Company {i}</div>'
+        f'<div data-test="job-location">New York, NY</div>'
+        f'<div data-test="detailSalary">$120k - $150k</div></li>' for i in range(first, first + cards_per_page))
+    indeed = ''.join(
+        f'<div class="job_seen_beacon"><h2><a data-jk="{i}" href="/viewjob?jk={i}">'
+        f'Python Engineer {i}</a></h2><span class="companyName">Company {i}</span>'
+        f'<div class="companyLocation">Remote</div><span class="salaryText">$100k</span></div>'
+        for i in range(first, first + cards_per_page))
+    linkedin = ''.join(
+        f'<div class="job-search-card"><a href="https://www.linkedin.com/jobs/view/'
+        f'data-scientist-at-company-{i}-{4000000 + i}?trk=public_jobs"><h3>Data Scientist {i}</h3></a>'
+        f'<h4>Company {i}</h4>'
+        f'<span class="job-search-card__location">Seattle, WA</span></div>'
+        for i in range(first, first + cards_per_page))
+    page = '<html><head><title>Jobs</title></head><body>{filler}<ul>{cards}</ul>{filler}</body></html>'
+    return [(source, page.format(filler=filler, cards=cards).encode())
+            for source, cards in (('glassdoor', glassdoor), ('indeed', indeed), ('linkedin', linkedin))]
+
+
+SOURCE_NAMES = {'linkedin': 'LinkedIn', 'glassdoor': 'Glassdoor', 'indeed': 'Indeed'}
+
+
+def parse_saved_page(source, html, backend, restrict):
+    return get_source(SOURCE_NAMES[source]).parse_page(html, 'https://example.com/', '', backend, restrict)
+
+
+def run_benchmark(pages, repeat):
+    backends = available_backends()
+    baseline = None
+    baseline_counts = None
+
+    print(f"{'Configuration':<36} {'ms/page':>10} {'speedup':>9} {'jobs':>7}")
+    print('-' * 66)
+    for label, backend, restrict in CONFIGURATIONS:
+        if backend not in backends:
+            print(f"{label:<36} {'(backend not installed)':>28}")
+            continue
+
+        counts = [len(parse_saved_page(source, html, backend, restrict)) for source, html in pages]
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for source, html in pages:
+                parse_saved_page(source, html, backend, restrict)
+        elapsed = time.perf_counter() - start
+
+        per_page = elapsed / (repeat * len(pages)) * 1000
+        if baseline is None:
+            baseline, baseline_counts = per_page, counts
+        mismatch = '' if counts == baseline_counts else '  (job counts differ from baseline!)'
+        print(f"{label:<36} {per_page:>10.2f} {baseline / per_page:>8.1f}x {sum(counts):>7}{mismatch}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('pages_dir', nargs='?', help='directory of saved result pages')
+    parser.add_argument('--synthetic', action='store_true', help='use generated pages instead')
+    parser.add_argument('--repeat', type=int, default=20, help='passes over the page set')
+    args = parser.parse_args()
+
+    if args.synthetic:
+        pages = synthetic_pages()
+    elif args.pages_dir:
+        pages = load_pages(args.pages_dir)
+    else:
+        parser.error('give a PAGES_DIR or --synthetic')
+
+    if not pages:
+        print("❌ No pages found (expected files like glassdoor_*.html)")
+        return
+
+    print(f"📄 Benchmarking {len(pages)} pages x {args.repeat} passes\n")
+    run_benchmark(pages, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
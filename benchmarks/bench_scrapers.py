@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Scraper Benchmark
+=================
+
+Runs RealJobScraper end to end against recorded job-board responses, with
+no live site involved: once replaying the archive directly (no network at
+all), then through a local fixture server with added latency and injected
+errors. Inputs are the same on every run, so timings can be compared
+between versions of the scraper.
+
+Usage:
+    python benchmarks/bench_scrapers.py --archive ARCHIVE --skill SKILL [--location LOC]
+    python benchmarks/bench_scrapers.py --synthetic [--max-jobs N]
+
+Record an archive with RealJobScraper(record_to='session.sqlite3') or by
+running the app with JOB_ANALYZER_RECORD=session.sqlite3, then benchmark
+with the skill and location that were searched.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_parsers import synthetic_pages
+from fixture_server import FixtureServer
+from job_scraper import RealJobScraper
+from job_sources import available_sources, get_source
+from replay import RECORD, ResponseArchive
+
+
+def build_synthetic_archive(path, skill, location, max_jobs):
+    """Record generated result pages for every source, enough for max_jobs each"""
+    archive = ResponseArchive(path, RECORD)
+    try:
+        for name in available_sources():
+            source = get_source(name)
+            for page in range(-(-max_jobs // source.page_size)):
+                pages = dict(synthetic_pages(cards_per_page=source.page_size,
+                                             first=page * source.page_size))
+                archive.add_page(source.search_url(skill, location, page), pages[name.lower()])
+    finally:
+        archive.close()
+
+
+def scenarios(args):
+    """(label, scraper options, fixture server options or None for direct replay)"""
+    latency_ms = args.latency * 1000
+    return [
+        ('replay, no network', {}, None),
+        ('fixture, no latency', {}, {}),
+        (f'fixture, {latency_ms:.0f}±{latency_ms / 2:.0f} ms',
+         {}, {'latency': args.latency, 'jitter': args.latency / 2}),
+        (f'fixture, {latency_ms:.0f} ms, {args.error_rate:.0%} errors',
+         {}, {'latency': args.latency, 'error_rate': args.error_rate}),
+    ]
+
+
+def run_scenario(archive_path, scraper_options, server_options, args):
+    """Scrape every source once; returns the measurements of the run"""
+    rate_limits = None
+    if not args.polite:
+        # Politeness limits would dominate the timings of a local server
+        rate_limits = {get_source(name).host: (1000.0, 1000) for name in available_sources()}
+
+    archive = server = None
+    if server_options is None:
+        scraper = RealJobScraper(use_cache=False, track_seen=False, store_jobs=False,
+                                 replay_from=archive_path, rate_limits=rate_limits,
+                                 parse_workers=args.parse_workers,
+                                 **scraper_options)
+    else:
+        archive = ResponseArchive(archive_path)
+        server = FixtureServer(archive, seed=args.seed, **server_options).start()
+        scraper = RealJobScraper(use_cache=False, track_seen=False, store_jobs=False,
+                                 fixture_url=server.url, rate_limits=rate_limits,
+                                 parse_workers=args.parse_workers,
+                                 **scraper_options)
+
+    output = sys.stdout if args.verbose else io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            start = time.perf_counter()
+            first_batch = None
+            jobs = []
+            for source, batch in scraper.iter_sources(args.skill, args.location, args.max_jobs):
+                if first_batch is None:
+                    first_batch = time.perf_counter() - start
+                jobs.extend(batch)
+            elapsed = time.perf_counter() - start
+
+        stats = scraper.performance_stats()['sources'].values()
+        return {
+            'seconds': elapsed,
+            'first_batch': first_batch or 0.0,
+            'jobs': len(jobs),
+            'live': sum(1 for job in jobs if job.get('data_quality') != 'mock'),
+            'pages': sum(source['pages'] for source in stats),
+            'mock_fallbacks': sum(source['mock_fallbacks'] for source in stats),
+            'injected_errors': server.stats['errors'] if server else 0,
+        }
+    finally:
+        scraper.close()
+        if server:
+            server.stop()
+            archive.close()
+
+
+def run_benchmark(archive_path, args):
+    print(f"{'Scenario':<30} {'total s':>8} {'first s':>8} {'pages/s':>8} {'jobs':>6} "
+          f"{'errors':>7} {'mock':>5}")
+    print('-' * 78)
+    for label, scraper_options, server_options in scenarios(args):
+        runs = [run_scenario(archive_path, scraper_options, server_options, args)
+                for _ in range(args.repeat)]
+        best = min(runs, key=lambda run: run['seconds'])
+        pages_per_second = best['pages'] / best['seconds'] if best['seconds'] else 0.0
+        print(f"{label:<30} {best['seconds']:>8.3f} {best['first_batch']:>8.3f} "
+              f"{pages_per_second:>8.1f} {best['live']:>6} {best['injected_errors']:>7} "
+              f"{best['mock_fallbacks']:>5}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--archive', help='response archive recorded by the scraper')
+    parser.add_argument('--synthetic', action='store_true', help='use generated result pages instead')
+    parser.add_argument('--skill', default='Python', help='skill searched when recording')
+    parser.add_argument('--location', default='', help='location searched when recording')
+    parser.add_argument('--max-jobs', type=int, default=150, help='jobs requested per source')
+    parser.add_argument('--latency', type=float, default=0.1, help='fixture latency in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.1, help='share of fixture requests that fail')
+    parser.add_argument('--seed', type=int, default=42, help='seed for fixture latency and errors')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per scenario (best is shown)')
+    parser.add_argument('--parse-workers', type=int, default=None, help='0 parses inline')
+    parser.add_argument('--polite', action='store_true', help="keep the sources' rate limits")
+    parser.add_argument('--verbose', action='store_true', help='show scraper output')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if args.synthetic:
+            archive_path = os.path.join(temp_dir, 'synthetic.sqlite3')
+            build_synthetic_archive(archive_path, args.skill, args.location, args.max_jobs)
+        elif args.archive:
+            archive_path = args.archive
+        else:
+            parser.error('give an --archive or --synthetic')
+
+        archive = ResponseArchive(archive_path)
+        recorded = len(archive)
+        archive.close()
+        if not recorded:
+            print("❌ The archive has no recorded responses")
+            return
+
+        print(f"📼 Benchmarking {recorded} recorded responses, '{args.skill}' x {args.max_jobs} jobs "
+              f"per source, best of {args.repeat}\n")
+        run_benchmark(archive_path, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,82 @@
 from collections import Counter
 from datetime import datetime, timedelta
+from functools import lru_cache
 import re
 import json
 
-class JobDataAnalyzer:
+import numpy as np
+
+from job_records import JobTable
+
+@lru_cache(maxsize=4096)
+def parse_salary(salary):
+    """Yearly salary in a salary string ("$80k - $120k" -> 100000.0), or None"""
+    # Extract numbers from salary string
+    numbers = re.findall(r'\d+', str(salary))
+    if not numbers:
+        return None
+    if len(numbers) >= 2:
+        # Range like "$80k - $120k"
+        value = (int(numbers[0]) + int(numbers[1])) / 2
+    else:
+        # Single value like "$100k"
+        value = int(numbers[0])
+    
+    # Handle different formats (k, K, thousands)
+    if 'k' in str(salary).lower():
+        value *= 1000
+    return value
+
+class RunningTrends:
+    """Trend counters updated batch by batch while a search is still running
+    
+    Gives the GUI live top titles/skills/locations/companies without
+    re-analyzing every job; the full analysis still runs once at the end.
+    """
+    
     def __init__(self):
-        pass
+        self.total_jobs = 0
+        self.titles = Counter()
+        self.skills = Counter()
+        self.locations = Counter()
+        self.companies = Counter()
+        self.sources = Counter()
+    
+    def add(self, jobs):
+        """Count a batch of jobs"""
+        for job in jobs:
+            self.total_jobs += 1
+            self.titles[job.get('title', 'Unknown')] += 1
+            self.locations[job.get('location', 'Unknown')] += 1
+            self.companies[job.get('company', 'Unknown')] += 1
+            self.sources[job.get('source', 'Unknown')] += 1
+            skills = job.get('skills', [])
+            if isinstance(skills, str):
+                skills = skills.split(', ')
+            self.skills.update(skills)
+    
+    def snapshot(self):
+        """Current counts in the shape of analyze_trends() output"""
+        return {
+            'total_jobs': self.total_jobs,
+            'top_jobs': self.titles.most_common(20),
+            'top_skills': self.skills.most_common(25),
+            'top_cities': self.locations.most_common(15),
+            'top_companies': self.companies.most_common(15),
+            'sources': dict(self.sources),
+        }
+
+class JobDataAnalyzer:
+    def __init__(self, store=None):
+        # job_store.JobStore of every posting scraped so far (see analyze_history)
+        self.store = store
     
     def analyze_trends(self, jobs_data):
-        """Analyze job trends and generate comprehensive insights"""
+        """Analyze job trends and generate comprehensive insights
+        
+        Every statistic comes from one pass over the jobs (see _count_jobs),
+        or from whole-column NumPy counts for a job_records.JobTable.
+        """
         if not jobs_data:
             return {}
         
@@ -16,47 +84,161 @@ class JobDataAnalyzer:
         
         # Basic counts
         total_jobs = len(jobs_data)
+        if isinstance(jobs_data, JobTable):
+            counts = self._count_table(jobs_data)
+        else:
+            counts = self._count_jobs(jobs_data)
+        
+        top_jobs = counts['titles'].most_common(20)
+        top_skills = counts['skills'].most_common(25)
+        top_cities = counts['locations'].most_common(15)
+        top_companies = counts['companies'].most_common(15)
+        salary_analysis = self._analyze_salaries(counts['salaries'], counts['salary_counts'])
+        
+        # Generate insights
+        insights = self._generate_insights(total_jobs, top_jobs, top_skills, top_cities,
+                                           counts['remote'], salary_analysis['total_with_salary'])
+        
+        trends_data = {
+            'total_jobs': total_jobs,
+            'top_jobs': top_jobs,
+            'top_skills': top_skills,
+            'top_cities': top_cities,
+            'top_companies': top_companies,
+            'posting_trends': dict(counts['dates']),
+            'job_type_distribution': dict(counts['job_types']),
+            'salary_info': salary_analysis,
+            'sources': dict(counts['sources']),
+            # Live, degraded (partially scraped) and mock listings
+            'data_quality': dict(counts['data_quality']),
+            # Postings merged from several sources (see job_dedup)
+            'cross_posted': counts['cross_posted'],
+            'insights': insights,
+            'analysis_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
         
-        # Count job titles
-        job_titles = [job.get('title', 'Unknown') for job in jobs_data]
-        top_jobs = Counter(job_titles).most_common(20)
+        print(f"   ✅ Analysis complete!")
+        return trends_data
+    
+    def _count_jobs(self, jobs_data):
+        """Gather every statistic analyze_trends needs in a single pass over the jobs
+        
+        Each field is appended to its own list and counted with Counter at the
+        end, which is faster than updating eight Counters per job.
+        """
+        titles, locations, companies, dates, job_types, salaries, sources, quality = ([] for _ in range(8))
+        add_title, add_location, add_company, add_date = (titles.append, locations.append,
+                                                          companies.append, dates.append)
+        add_job_type, add_salary, add_source, add_quality = (job_types.append, salaries.append,
+                                                             sources.append, quality.append)
+        skills = []
+        add_skills = skills.extend
+        today = datetime.now().strftime('%Y-%m-%d')
+        cross_posted = remote = 0
         
-        # Count skills
-        all_skills = []
         for job in jobs_data:
-            skills = job.get('skills', [])
-            if isinstance(skills, list):
-                all_skills.extend(skills)
-            elif isinstance(skills, str):
-                all_skills.extend(skills.split(', '))
-        top_skills = Counter(all_skills).most_common(25)
+            get = job.get
+            add_title(get('title', 'Unknown'))
+            job_skills = get('skills', [])
+            if isinstance(job_skills, list):
+                add_skills(job_skills)
+            elif isinstance(job_skills, str):
+                add_skills(job_skills.split(', '))
+            location = get('location', 'Unknown')
+            add_location(location)
+            add_company(get('company', 'Unknown'))
+            add_date(get('date_posted', today))
+            job_type = get('job_type', 'Full-time')
+            add_job_type(job_type)
+            salary = get('salary')
+            if salary:
+                add_salary(salary)
+            add_source(get('source', 'Unknown'))
+            add_quality(get('data_quality', 'live'))
+            if len(get('sources') or ()) > 1:
+                cross_posted += 1
+            if 'remote' in (location or '').lower() or 'remote' in (job_type or '').lower():
+                remote += 1
         
-        # Count locations
-        locations = [job.get('location', 'Unknown') for job in jobs_data]
-        top_cities = Counter(locations).most_common(15)
+        return {
+            'titles': Counter(titles),
+            'skills': Counter(skills),
+            'locations': Counter(locations),
+            'companies': Counter(companies),
+            'dates': Counter(dates),
+            'job_types': Counter(job_types),
+            'sources': Counter(sources),
+            'data_quality': Counter(quality),
+            'salaries': salaries,
+            'salary_counts': Counter(salaries),
+            'cross_posted': cross_posted,
+            'remote': remote,
+        }
+    
+    def _count_table(self, table):
+        """_count_jobs() for a JobTable: bincount over each column's category codes"""
+        def code_counts(field):
+            codes, categories = table.codes(field)
+            counts = np.bincount(codes + 1, minlength=len(categories) + 1).tolist()
+            found = Counter({categories[code]: count for code, count in enumerate(counts[1:]) if count})
+            if counts[0]:
+                found[None] += counts[0]  # jobs without the field
+            return found
+        
+        def category_mask(field, test):
+            # One flag per category plus a trailing False that code -1 (None) indexes
+            _, categories = table.codes(field)
+            return np.array([bool(test(value)) for value in categories] + [False])
+        
+        is_remote = lambda value: 'remote' in value.lower()
+        remote = (category_mask('location', is_remote)[table.codes('location')[0]] |
+                  category_mask('job_type', is_remote)[table.codes('job_type')[0]])
+        
+        salary_codes, salary_categories = table.codes('salary')
+        salary_codes = salary_codes[category_mask('salary', bool)[salary_codes]]
         
-        # Count companies
-        companies = [job.get('company', 'Unknown') for job in jobs_data]
-        top_companies = Counter(companies).most_common(15)
+        return {
+            'titles': code_counts('title'),
+            'skills': Counter(table.skill_counts()),
+            'locations': code_counts('location'),
+            'companies': code_counts('company'),
+            'dates': code_counts('date_posted'),
+            'job_types': code_counts('job_type'),
+            'sources': code_counts('source'),
+            'data_quality': code_counts('data_quality'),
+            # Salaries in job order, decoded only as far as the samples need
+            'salaries': (salary_categories[code] for code in salary_codes.tolist()),
+            'salary_counts': Counter({salary: count for salary, count in code_counts('salary').items() if salary}),
+            'cross_posted': sum(1 for sources in table.extra_values('sources') if len(sources or ()) > 1),
+            'remote': int(remote.sum()),
+        }
+    
+    def analyze_history(self, skill=None, location=None, days=None):
+        """Analyze every stored posting matching skill/location from the last `days` days
         
-        # Analyze posting trends by date
-        posting_dates = [job.get('date_posted', datetime.now().strftime('%Y-%m-%d')) for job in jobs_data]
-        posting_trends = Counter(posting_dates)
+        Same output as analyze_trends(), computed with indexed queries on the
+        job store instead of scraping again.
+        """
+        if self.store is None:
+            return {}
         
-        # Analyze job types
-        job_types = [job.get('job_type', 'Full-time') for job in jobs_data]
-        job_type_distribution = Counter(job_types)
+        filters = {'skill': skill, 'location': location, 'days': days}
+        total_jobs = self.store.count(**filters)
+        if not total_jobs:
+            return {}
         
-        # Analyze salary information
-        salaries = [job.get('salary') for job in jobs_data if job.get('salary')]
-        salary_analysis = self._analyze_salaries(salaries)
+        print(f"📊 Analyzing {total_jobs} stored job listings...")
         
-        # Analyze sources
-        sources = [job.get('source', 'Unknown') for job in jobs_data]
-        source_distribution = Counter(sources)
+        # Missing values are counted under the defaults analyze_trends() uses
+        def count_by(field, limit=None, default='Unknown'):
+            return [(value or default, count) for value, count in self.store.count_by(field, limit, **filters)]
         
-        # Generate insights
-        insights = self._generate_insights(jobs_data, top_jobs, top_skills, top_cities)
+        top_jobs = count_by('title', 20)
+        top_skills = self.store.skill_counts(25, **filters)
+        top_cities = count_by('location', 15)
+        top_companies = count_by('company', 15)
+        salaries = self.store.salaries(**filters)
+        remote_jobs = self.store.count(remote=True, **filters)
         
         trends_data = {
             'total_jobs': total_jobs,
@@ -64,20 +246,33 @@ class JobDataAnalyzer:
             'top_skills': top_skills,
             'top_cities': top_cities,
             'top_companies': top_companies,
-            'posting_trends': dict(posting_trends),
-            'job_type_distribution': dict(job_type_distribution),
-            'salary_info': salary_analysis,
-            'sources': dict(source_distribution),
-            'insights': insights,
+            'posting_trends': dict(count_by('date_posted', default=datetime.now().strftime('%Y-%m-%d'))),
+            'job_type_distribution': dict(count_by('job_type', default='Full-time')),
+            'salary_info': self._analyze_salaries(salaries),
+            'sources': dict(count_by('source')),
+            'data_quality': dict(count_by('data_quality', default='live')),
+            'cross_posted': 0,
+            'insights': self._generate_insights(total_jobs, top_jobs, top_skills, top_cities,
+                                                remote_jobs, len(salaries)),
+            'history_days': days,
             'analysis_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
         
         print(f"   ✅ Analysis complete!")
         return trends_data
     
-    def _analyze_salaries(self, salaries):
-        """Analyze salary information"""
-        if not salaries:
+    def _analyze_salaries(self, salaries, counts=None):
+        """Analyze salary information
+        
+        `salaries` are the salary strings in job order (any iterable if
+        `counts`, a Counter of them, is given). Each distinct salary is
+        parsed once and weighted by how many jobs list it.
+        """
+        if counts is None:
+            salaries = list(salaries)
+            counts = Counter(salaries)
+        total_with_salary = sum(counts.values())
+        if not total_with_salary:
             return {
                 'total_with_salary': 0,
                 'sample_salaries': [],
@@ -85,63 +280,51 @@ class JobDataAnalyzer:
                 'average_salary': None
             }
         
-        # Extract numeric values from salary strings
-        salary_values = []
         salary_ranges = {'under_50k': 0, '50k_100k': 0, '100k_150k': 0, 'over_150k': 0}
-        
-        for salary in salaries:
-            if not salary:
+        salary_total = parsed_count = 0
+        for salary, count in counts.items():
+            value = parse_salary(salary)
+            if value is None:
                 continue
-                
-            # Extract numbers from salary string
-            numbers = re.findall(r'\d+', str(salary))
-            if numbers:
-                try:
-                    if len(numbers) >= 2:
-                        # Range like "$80k - $120k"
-                        avg_salary = (int(numbers[0]) + int(numbers[1])) / 2
-                    else:
-                        # Single value like "$100k"
-                        avg_salary = int(numbers[0])
-                    
-                    # Handle different formats (k, K, thousands)
-                    if 'k' in salary.lower() or 'K' in salary:
-                        avg_salary *= 1000
-                    
-                    salary_values.append(avg_salary)
-                    
-                    # Categorize salary ranges
-                    if avg_salary < 50000:
-                        salary_ranges['under_50k'] += 1
-                    elif avg_salary < 100000:
-                        salary_ranges['50k_100k'] += 1
-                    elif avg_salary < 150000:
-                        salary_ranges['100k_150k'] += 1
-                    else:
-                        salary_ranges['over_150k'] += 1
-                        
-                except ValueError:
-                    continue
-        
-        average_salary = sum(salary_values) / len(salary_values) if salary_values else None
+            salary_total += value * count
+            parsed_count += count
+            
+            # Categorize salary ranges
+            if value < 50000:
+                salary_ranges['under_50k'] += count
+            elif value < 100000:
+                salary_ranges['50k_100k'] += count
+            elif value < 150000:
+                salary_ranges['100k_150k'] += count
+            else:
+                salary_ranges['over_150k'] += count
+        
+        # The first salaries listed, and the first values for visualization
+        sample_salaries, salary_values = [], []
+        for salary in salaries:
+            if len(sample_salaries) < 10:
+                sample_salaries.append(salary)
+            value = parse_salary(salary)
+            if value is not None and len(salary_values) < 20:
+                salary_values.append(value)
+            if len(sample_salaries) == 10 and len(salary_values) == 20:
+                break
         
         return {
-            'total_with_salary': len(salaries),
-            'sample_salaries': salaries[:10],
+            'total_with_salary': total_with_salary,
+            'sample_salaries': sample_salaries,
             'salary_ranges': salary_ranges,
-            'average_salary': average_salary,
-            'salary_values': salary_values[:20]  # Sample for visualization
+            'average_salary': salary_total / parsed_count if parsed_count else None,
+            'salary_values': salary_values
         }
     
-    def _generate_insights(self, jobs_data, top_jobs, top_skills, top_cities):
+    def _generate_insights(self, total_jobs, top_jobs, top_skills, top_cities, remote_jobs, jobs_with_salary):
         """Generate market insights"""
         insights = []
         
-        if not jobs_data:
+        if not total_jobs:
             return insights
         
-        total_jobs = len(jobs_data)
-        
         # Job market size insight
         if total_jobs > 100:
             insights.append(f"Strong job market with {total_jobs} opportunities found")
@@ -169,14 +352,11 @@ class JobDataAnalyzer:
             insights.append(f"'{top_city}' has the highest concentration of jobs ({percentage:.1f}%)")
         
         # Remote work availability
-        remote_jobs = len([job for job in jobs_data if 'remote' in job.get('location', '').lower() or 
-                          'remote' in job.get('job_type', '').lower()])
         if remote_jobs > 0:
             remote_percentage = (remote_jobs / total_jobs) * 100
             insights.append(f"{remote_percentage:.1f}% of jobs offer remote work options")
         
         # Salary insights
-        jobs_with_salary = len([job for job in jobs_data if job.get('salary')])
         if jobs_with_salary > 0:
             salary_percentage = (jobs_with_salary / total_jobs) * 100
             insights.append(f"{salary_percentage:.1f}% of jobs include salary information")
@@ -196,7 +376,7 @@ class JobDataAnalyzer:
 Search Query: {search_query}
 Generated: {timestamp}
 Total Jobs Found: {trends_data.get('total_jobs', 0)}
-Data Sources: LinkedIn, Glassdoor, Indeed
+Data Sources: {', '.join(trends_data.get('sources', {})) or 'N/A'}
 
 {'='*80}
                            EXECUTIVE SUMMARY
@@ -326,6 +506,14 @@ URL: {job.get('url', 'Not available')}
             percentage = (count / max(trends_data.get('total_jobs', 1), 1)) * 100
             report += f"{source}: {count} jobs ({percentage:.1f}%)\n"
         
+        data_quality = trends_data.get('data_quality', {})
+        if data_quality.get('mock') or data_quality.get('degraded'):
+            report += (f"\nNote: {data_quality.get('mock', 0)} mock and {data_quality.get('degraded', 0)} "
+                       f"partially scraped listings are included because a source was unavailable.\n")
+        if trends_data.get('cross_posted'):
+            report += (f"Note: {trends_data['cross_posted']} postings were listed on several sources "
+                       f"and are counted once.\n")
+        
         report += f"""
 {'='*80}
                              METHODOLOGY
@@ -333,17 +521,17 @@ URL: {job.get('url', 'Not available')}
 
 Data Collection Process:
 1. Search performed for "{search_query}"
-2. Job listings scraped from LinkedIn, Glassdoor, and Indeed
+2. Job listings scraped from {', '.join(trends_data.get('sources', {})) or 'the selected job sources'}
 3. Data extracted: title, company, location, skills, posting date, salary
 4. Results aggregated and analyzed for trends
 5. Data exported to multiple formats (TXT, CSV, JSON)
 
 Ethical Scraping Practices:
-✓ Respectful request rates (2-4 second delays)
+✓ Respectful request rates (per-site rate limits, backing off on HTTP 429/503)
 ✓ robots.txt compliance awareness
 ✓ User-agent identification
 ✓ No personal data collection
-✓ Rate limiting to prevent server overload
+✓ Honors Retry-After to prevent server overload
 
 {'='*80}
                               DISCLAIMER
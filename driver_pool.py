@@ -0,0 +1,242 @@
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+import selenium
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
+from app_paths import get_data_path
+
+PROBE_CACHE_FILE = "chromedriver_probe.json"
+# How long a probe result is trusted; failures are re-checked sooner
+PROBE_TTL_AVAILABLE = 7 * 24 * 3600
+PROBE_TTL_UNAVAILABLE = 24 * 3600
+
+
+# Resources the scrapers never look at; blocked in fast-load mode
+BLOCKED_RESOURCE_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.css', '*.mp4', '*.webm',
+]
+
+
+def create_chrome_driver(fast_load=False):
+    """Start a headless Chrome configured for scraping
+
+    With fast_load the driver returns as soon as the DOM is ready (eager page
+    load strategy) and never downloads images, fonts, stylesheets or media.
+    """
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")  # Run in background
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    if fast_load:
+        chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        })
+
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+    if fast_load:
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_PATTERNS})
+        except WebDriverException:
+            pass  # CDP unavailable; image/font prefs above still apply
+    return driver
+
+
+def _probe_fingerprint():
+    """Identify the installed Selenium/Chrome setup so upgrades invalidate the cache"""
+    fingerprint = {'selenium': selenium.__version__}
+    for name in ('chromedriver', 'google-chrome', 'google-chrome-stable', 'chromium',
+                 'chromium-browser', 'chrome'):
+        path = shutil.which(name)
+        if path:
+            fingerprint[name] = [path, os.path.getmtime(path)]
+    return fingerprint
+
+
+def load_cached_probe():
+    """Return the cached ChromeDriver probe result, or None if missing or stale"""
+    try:
+        with open(get_data_path(PROBE_CACHE_FILE), encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    available = cached.get('available')
+    ttl = PROBE_TTL_AVAILABLE if available else PROBE_TTL_UNAVAILABLE
+    if cached.get('fingerprint') != _probe_fingerprint() or time.time() - cached.get('checked_at', 0) > ttl:
+        return None
+    return available
+
+
+def save_probe_result(available):
+    """Remember whether Chrome could be started"""
+    try:
+        with open(get_data_path(PROBE_CACHE_FILE), 'w', encoding='utf-8') as f:
+            json.dump({
+                'available': bool(available),
+                'checked_at': time.time(),
+                'fingerprint': _probe_fingerprint(),
+            }, f)
+    except OSError:
+        pass
+
+
+def probe_chromedriver(use_cache=True):
+    """Check whether headless Chrome can be started, using the cached result when fresh"""
+    if use_cache:
+        cached = load_cached_probe()
+        if cached is not None:
+            return cached
+
+    try:
+        create_chrome_driver().quit()
+        available = True
+    except Exception:
+        available = False
+
+    save_probe_result(available)
+    return available
+
+
+class PooledDriver:
+    """A WebDriver checked out of a WebDriverPool"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages_served = 0
+
+
+class WebDriverPool:
+    """Bounded pool of reusable WebDrivers
+
+    Drivers are started on demand up to `size`, handed out with checkout()
+    and returned with checkin(). Idle drivers are health-checked before reuse
+    and recycled after serving `max_pages_per_driver` pages, so Chrome's
+    startup cost is paid once per driver rather than once per page.
+    """
+
+    def __init__(self, size=2, max_pages_per_driver=25, driver_factory=create_chrome_driver,
+                 checkout_timeout=120):
+        self.size = size
+        self.max_pages_per_driver = max_pages_per_driver
+        self.driver_factory = driver_factory
+        self.checkout_timeout = checkout_timeout
+
+        self._idle = queue.LifoQueue()  # most recently used driver first
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+        self.stats = {'created': 0, 'recycled': 0, 'unhealthy': 0, 'checkouts': 0}
+
+    def _is_healthy(self, pooled):
+        try:
+            return pooled.driver.execute_script("return 1") == 1
+        except WebDriverException:
+            return False
+
+    def _discard(self, pooled):
+        with self._lock:
+            self._created -= 1
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+
+    def _try_reserve(self):
+        """Reserve a slot for a new driver if the pool is not full"""
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                return True
+            return False
+
+    def _create(self):
+        try:
+            driver = self.driver_factory()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+        self.stats['created'] += 1
+        return PooledDriver(driver)
+
+    def checkout(self, timeout=None):
+        """Take a healthy driver from the pool, starting one if there is room"""
+        if self._closed:
+            raise RuntimeError("WebDriver pool is closed")
+
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                if self._try_reserve():
+                    pooled = self._create()
+                else:
+                    # Wake up periodically: a discarded driver frees a slot without
+                    # putting anything back on the idle queue
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"No WebDriver available after {timeout}s")
+                    try:
+                        pooled = self._idle.get(timeout=min(remaining, 1.0))
+                    except queue.Empty:
+                        continue
+
+            if self._is_healthy(pooled):
+                self.stats['checkouts'] += 1
+                return pooled
+
+            self.stats['unhealthy'] += 1
+            self._discard(pooled)
+
+    def checkin(self, pooled, healthy=True):
+        """Return a driver to the pool, recycling it if it is worn out or broken"""
+        pooled.pages_served += 1
+
+        if self._closed or not healthy:
+            self._discard(pooled)
+        elif pooled.pages_served >= self.max_pages_per_driver:
+            self.stats['recycled'] += 1
+            self._discard(pooled)
+        else:
+            self._idle.put(pooled)
+
+    @contextmanager
+    def driver(self):
+        """Context manager yielding a checked-out WebDriver for one page"""
+        pooled = self.checkout()
+        healthy = True
+        try:
+            yield pooled.driver
+        except WebDriverException:
+            healthy = self._is_healthy(pooled)
+            raise
+        finally:
+            self.checkin(pooled, healthy)
+
+    def close(self):
+        """Quit every idle driver; checked-out drivers quit on checkin"""
+        self._closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
@@ -0,0 +1,149 @@
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from replay import ResponseArchive
+
+# Response headers describing the original transfer, not the archived body
+HOP_BY_HOP_HEADERS = {'connection', 'content-encoding', 'content-length', 'keep-alive',
+                      'transfer-encoding'}
+
+
+def fixture_url(base_url, url):
+    """Map a job-board URL onto a fixture server: https://host/path?q -> BASE/host/path?q"""
+    parts = urlsplit(url)
+    path = f"/{parts.netloc}{parts.path or '/'}"
+    if parts.query:
+        path += f"?{parts.query}"
+    return base_url.rstrip('/') + path
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        fixture = self.server.fixture
+        status, headers, body = fixture.respond(self.path)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer:
+    """Local HTTP server replaying a ResponseArchive as a fake job board
+
+    A request for /<host>/<path>?<query> is answered with the recording of
+    https://<host>/<path>?<query>. Every response waits `latency` seconds
+    plus up to `jitter` more, and a share `error_rate` of requests fail with
+    `error_status`, so the scraper's concurrency, retries and circuit
+    breakers can be load-tested offline. With a seed the injected delays and
+    errors are reproducible.
+    """
+
+    def __init__(self, archive, host='127.0.0.1', port=0, latency=0.0, jitter=0.0,
+                 error_rate=0.0, error_status=503, seed=None):
+        self.archive = archive
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.stats = {'requests': 0, 'served': 0, 'errors': 0, 'missing': 0}
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _FixtureHandler)
+        self._server.daemon_threads = True
+        self._server.fixture = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def rewrite(self, url):
+        """Map a job-board URL onto this server (use as AsyncFetchEngine rewrite_url)"""
+        return fixture_url(self.url, url)
+
+    def respond(self, path):
+        """Status, headers and body for a request path (runs on the handler threads)"""
+        with self._lock:
+            self.stats['requests'] += 1
+            delay = self.latency + self._random.uniform(0, self.jitter) if self.jitter else self.latency
+            fail = self.error_rate and self._random.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+
+        if fail:
+            return self._count('errors', self.error_status, b'Injected fixture error')
+
+        recorded = self.archive.lookup('https:/' + path)
+        if recorded is None:
+            return self._count('missing', 404, b'Not recorded')
+
+        headers = {name: value for name, value in recorded.headers.items()
+                   if name.lower() not in HOP_BY_HOP_HEADERS}
+        self._count('served')
+        return recorded.status_code, headers, recorded.content
+
+    def _count(self, outcome, status=None, body=b''):
+        with self._lock:
+            self.stats[outcome] += 1
+        return status, {'Content-Type': 'text/plain'}, body
+
+    def start(self):
+        """Serve in a background thread"""
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fixture-server',
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+# Example usage
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve recorded job-board responses locally")
+    parser.add_argument('archive', help='archive recorded with RealJobScraper(record_to=...)')
+    parser.add_argument('--port', type=int, default=8800)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='extra random latency, up to this')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='share of requests that fail')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    archive = ResponseArchive(args.archive)
+    server = FixtureServer(archive, port=args.port, latency=args.latency, jitter=args.jitter,
+                           error_rate=args.error_rate, seed=args.seed)
+    print(f"📼 Serving {len(archive)} recorded responses at {server.url}")
+    print(f"   Point the scraper at it with RealJobScraper(fixture_url='{server.url}')")
+    try:
+        server.start()
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        archive.close()
@@ -0,0 +1,47 @@
+import importlib.util
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Parser backends in order of preference (fastest first)
+PARSER_BACKENDS = ['lxml', 'html.parser']
+
+
+def available_backends():
+    """Return the parser backends that can be used in this environment"""
+    return [backend for backend in PARSER_BACKENDS
+            if backend == 'html.parser' or importlib.util.find_spec(backend) is not None]
+
+
+DEFAULT_BACKEND = available_backends()[0]
+
+
+def make_soup(markup, backend=None, parse_only=None):
+    """Parse HTML with the chosen backend, optionally keeping only some subtrees"""
+    return BeautifulSoup(markup, backend or DEFAULT_BACKEND, parse_only=parse_only)
+
+
+def container_strainer(*rules):
+    """Build a SoupStrainer that keeps only job-card containers
+
+    Each rule is (tag, attribute, value): tag may be None to match any tag,
+    value True only requires the attribute to be present, and 'class' values
+    match any one of the element's classes. Only the matching subtrees are
+    built, which skips most of a results page.
+    """
+    def match(name, attrs):
+        for tag, attribute, value in rules:
+            if tag and name != tag:
+                continue
+            actual = attrs.get(attribute)
+            if actual is None:
+                continue
+            if value is True:
+                return True
+            if attribute == 'class':
+                classes = actual.split() if isinstance(actual, str) else actual
+                if value in classes:
+                    return True
+            elif actual == value:
+                return True
+        return False
+
+    return SoupStrainer(match)
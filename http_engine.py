@@ -0,0 +1,217 @@
+import asyncio
+import threading
+import time
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from replay import ArchiveMiss
+
+# Sent with every request; set once per host session instead of per call
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+
+class FetchResult:
+    """Response returned by AsyncFetchEngine (mirrors the parts of requests.Response we use)"""
+
+    def __init__(self, url, status_code=None, content=b'', headers=None, error=None, elapsed=0.0,
+                 from_cache=None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.error = error
+        self.elapsed = elapsed
+        # 'hit' (served from the response cache), 'revalidated' (304),
+        # 'replay' (served from a ResponseArchive) or None
+        self.from_cache = from_cache
+        self.attempts = 1
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    @property
+    def ok(self):
+        return self.error is None and self.status_code is not None and 200 <= self.status_code < 400
+
+    def __repr__(self):
+        status = self.status_code if self.error is None else type(self.error).__name__
+        return f"<FetchResult {status} {self.url}>"
+
+
+class AsyncFetchEngine:
+    """Concurrent HTTP fetcher with one keep-alive connection pool per host
+
+    The engine owns an asyncio event loop running in a background thread, so
+    it can be shared by the scraper worker threads: every call from any thread
+    is scheduled onto the same loop and reuses the same pooled connections.
+    With a ResponseCache, fresh responses are served from disk and stale ones
+    are revalidated with conditional requests. With a HostRateLimiter, every
+    network request waits for its host's token and reports its status back.
+    With a RetryPolicy, transient failures are retried with backoff.
+    With a ResponseArchive, network responses are recorded, or every request
+    is answered from the archive in replay mode. rewrite_url(url) redirects
+    requests elsewhere (e.g. a local fixture server) while results, cache
+    keys and rate limits keep using the original URL.
+    """
+
+    def __init__(self, max_concurrency=32, per_host_limit=8, timeout=15, connect_timeout=5,
+                 headers=None, host_headers=None, cache=None, rate_limiter=None, retry_policy=None,
+                 archive=None, rewrite_url=None):
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.headers = dict(DEFAULT_HEADERS, **(headers or {}))
+        self.host_headers = host_headers or {}
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.archive = archive
+        self.rewrite_url = rewrite_url
+
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._sessions = {}  # host -> aiohttp.ClientSession
+        self._semaphore = None
+
+    def _ensure_loop(self):
+        """Start the background event loop on first use"""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever,
+                                                name='http-engine', daemon=True)
+                self._thread.start()
+        return self._loop
+
+    def _get_session(self, host):
+        """Return the pooled session for a host (runs on the engine loop)"""
+        session = self._sessions.get(host)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(limit=self.per_host_limit, ttl_dns_cache=300,
+                                             keepalive_timeout=30)
+            timeout = aiohttp.ClientTimeout(total=self.timeout, connect=self.connect_timeout)
+            headers = dict(self.headers, **self.host_headers.get(host, {}))
+            session = aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers)
+            self._sessions[host] = session
+        return session
+
+    async def fetch(self, url, headers=None, use_cache=True):
+        """Fetch a single URL; network errors are returned on the result, not raised"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        start = time.perf_counter()
+        if self.archive is not None:
+            if self.archive.replaying:
+                return await self._replay(url, start)
+            # Recording must see every response, so the cache is bypassed
+            use_cache = False
+
+        host = urlsplit(url).netloc
+        session = self._get_session(host)
+
+        cached = None
+        cache_key = None
+        if self.cache is not None and use_cache:
+            cache_key = self.cache.make_key(url, dict(self.headers, **self.host_headers.get(host, {}),
+                                                      **(headers or {})))
+            cached = await asyncio.to_thread(self.cache.lookup, cache_key)
+            if cached is not None and self.cache.is_fresh(cached):
+                self.cache.record('hits')
+                return self._cached_result(cached, 'hit', start)
+            if cached is not None:
+                headers = dict(headers or {}, **cached.validators())
+
+        attempt = 0
+        while True:
+            result = await self._send(session, host, url, headers, start)
+            if self.retry_policy is None or not self.retry_policy.should_retry(result, attempt):
+                break
+            await asyncio.sleep(self.retry_policy.delay(attempt))
+            attempt += 1
+        result.attempts = attempt + 1
+
+        if result.error is not None:
+            return result
+
+        if self.archive is not None:
+            await asyncio.to_thread(self.archive.record, url, result.url, result.status_code,
+                                    result.headers, result.content, result.elapsed)
+        if cache_key is not None:
+            if result.status_code == 304 and cached is not None:
+                self.cache.record('revalidated')
+                await asyncio.to_thread(self.cache.refresh, cache_key)
+                return self._cached_result(cached, 'revalidated', start)
+            self.cache.record('misses')
+            await asyncio.to_thread(self.cache.store, cache_key, result.url, result.status_code,
+                                    result.headers, result.content)
+        return result
+
+    async def _send(self, session, host, url, headers, start):
+        """Perform one network request (rate limited)"""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(host)
+
+        target = self.rewrite_url(url) if self.rewrite_url else url
+        async with self._semaphore:
+            try:
+                async with session.get(target, headers=headers) as response:
+                    content = await response.read()
+                    final_url = str(response.url) if target == url else url
+                    result = FetchResult(final_url, response.status, content,
+                                         dict(response.headers), elapsed=time.perf_counter() - start)
+                    retry_after = response.headers.get('Retry-After')
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                return FetchResult(url, error=e, elapsed=time.perf_counter() - start)
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.on_response(host, result.status_code, retry_after)
+        return result
+
+    async def _replay(self, url, start):
+        """Answer a request from the archive (replay mode)"""
+        recorded = await asyncio.to_thread(self.archive.lookup, url)
+        if recorded is None:
+            return FetchResult(url, error=ArchiveMiss(f"No recorded response for {url}"),
+                               elapsed=time.perf_counter() - start)
+        return FetchResult(recorded.url, recorded.status_code, recorded.content, recorded.headers,
+                           elapsed=time.perf_counter() - start, from_cache='replay')
+
+    def _cached_result(self, cached, outcome, start):
+        return FetchResult(cached.url, cached.status_code, cached.content, cached.headers,
+                           elapsed=time.perf_counter() - start, from_cache=outcome)
+
+    def submit(self, url, headers=None, use_cache=True):
+        """Schedule a fetch from any thread and return a concurrent.futures.Future"""
+        return asyncio.run_coroutine_threadsafe(self.fetch(url, headers, use_cache), self._ensure_loop())
+
+    async def _close_sessions(self):
+        pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for session in self._sessions.values():
+            await session.close()
+        self._sessions.clear()
+
+    def close(self):
+        """Close all pooled connections and stop the event loop"""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(self._close_sessions(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+        loop.close()
+        self._semaphore = None
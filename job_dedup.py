@@ -0,0 +1,319 @@
+import re
+import zlib
+from collections import defaultdict
+from functools import lru_cache
+
+import numpy as np
+
+from job_records import JobRecord
+
+# Title abbreviations expanded before comparing
+TITLE_ABBREVIATIONS = {
+    'sr': 'senior', 'snr': 'senior', 'jr': 'junior', 'jnr': 'junior', 'eng': 'engineer',
+    'engr': 'engineer', 'dev': 'developer', 'mgr': 'manager', 'mgmt': 'management',
+    'assoc': 'associate', 'admin': 'administrator', 'ops': 'operations', 'swe': 'software engineer',
+    'ii': '2', 'iii': '3', 'iv': '4',
+}
+# Words that say nothing about the job itself ("Python Developer - Remote (m/f/d)")
+TITLE_NOISE = {'remote', 'hybrid', 'onsite', 'on site', 'urgent', 'hiring', 'new', 'm f d', 'f m d',
+               'w m d', 'full time', 'part time', 'contract', 'temporary', 'us', 'usa'}
+# Legal and filler words dropped from company names
+COMPANY_SUFFIXES = {'inc', 'incorporated', 'llc', 'llp', 'ltd', 'limited', 'corp', 'corporation',
+                    'co', 'company', 'gmbh', 'plc', 'ag', 'sa', 'bv', 'group', 'holdings', 'the'}
+US_STATES = {
+    'alabama': 'al', 'alaska': 'ak', 'arizona': 'az', 'arkansas': 'ar', 'california': 'ca',
+    'colorado': 'co', 'connecticut': 'ct', 'delaware': 'de', 'florida': 'fl', 'georgia': 'ga',
+    'hawaii': 'hi', 'idaho': 'id', 'illinois': 'il', 'indiana': 'in', 'iowa': 'ia', 'kansas': 'ks',
+    'kentucky': 'ky', 'louisiana': 'la', 'maine': 'me', 'maryland': 'md', 'massachusetts': 'ma',
+    'michigan': 'mi', 'minnesota': 'mn', 'mississippi': 'ms', 'missouri': 'mo', 'montana': 'mt',
+    'nebraska': 'ne', 'nevada': 'nv', 'new hampshire': 'nh', 'new jersey': 'nj', 'new mexico': 'nm',
+    'new york': 'ny', 'north carolina': 'nc', 'north dakota': 'nd', 'ohio': 'oh', 'oklahoma': 'ok',
+    'oregon': 'or', 'pennsylvania': 'pa', 'rhode island': 'ri', 'south carolina': 'sc',
+    'south dakota': 'sd', 'tennessee': 'tn', 'texas': 'tx', 'utah': 'ut', 'vermont': 'vt',
+    'virginia': 'va', 'washington': 'wa', 'west virginia': 'wv', 'wisconsin': 'wi', 'wyoming': 'wy',
+    'district of columbia': 'dc',
+}
+COUNTRY_SUFFIXES = ('united states', 'united states of america', 'usa', 'us')
+# Better-quality records win when duplicates are merged
+QUALITY_RANK = {'live': 0, 'degraded': 1, 'mock': 2}
+
+_NON_WORD = re.compile(r'[^a-z0-9+#]+')
+_BRACKETS = re.compile(r'\([^)]*\)|\[[^\]]*\]')
+# Mersenne prime used by the MinHash permutations
+_PRIME = (1 << 31) - 1
+_COMPANY_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _words(text):
+    return _NON_WORD.sub(' ', (text or '').lower()).split()
+
+
+@lru_cache(maxsize=65536)
+def normalize_title(title):
+    """Lowercase title words with abbreviations expanded and noise dropped"""
+    text = ' '.join(_words(_BRACKETS.sub(' ', title or '')))
+    for noise in TITLE_NOISE:
+        if ' ' in noise:
+            text = re.sub(rf'\b{noise}\b', ' ', text)
+    words = [TITLE_ABBREVIATIONS.get(word, word) for word in text.split() if word not in TITLE_NOISE]
+    return ' '.join(words)
+
+
+@lru_cache(maxsize=65536)
+def normalize_company(company):
+    """Company name without legal suffixes ("Google LLC" -> "google")"""
+    words = [word for word in _words((company or '').replace('&', ' and ')) if word not in COMPANY_SUFFIXES]
+    return ' '.join(words)
+
+
+@lru_cache(maxsize=65536)
+def normalize_location(location):
+    """'city st' form of a location ("Austin, Texas, United States" -> "austin tx"); '' if unknown"""
+    text = ' '.join(_words(location))
+    for suffix in COUNTRY_SUFFIXES:
+        if text.endswith(' ' + suffix):
+            text = text[:-len(suffix) - 1]
+    if not text or text in ('unknown', 'unknown location', 'not specified'):
+        return ''
+    if 'remote' in text.split():
+        return 'remote'
+    for state, code in US_STATES.items():
+        if text.endswith(' ' + state):
+            text = text[:-len(state)] + code
+            break
+    return text
+
+
+class JobDeduplicator:
+    """Finds the same posting listed on several job boards and merges it
+
+    Titles, companies and locations are normalized first; jobs whose three
+    normalized fields are equal are duplicates outright. The remaining
+    distinct postings are compared with MinHash signatures over their
+    title words, and locality-sensitive hashing (`bands` bands of the
+    signature, keyed by company) only proposes pairs of the same company
+    that share a band, so the cost
+    grows linearly with the number of jobs instead of quadratically. A
+    proposed pair is merged when the companies match, the locations are
+    compatible (equal, or one is unknown) and the title words have a
+    Jaccard similarity of at least `threshold`.
+
+    Only listings from different sources are merged, or listings of one
+    source with the same posting_id: two postings a board lists separately
+    are two jobs, however alike they look.
+    """
+
+    def __init__(self, threshold=0.8, num_perm=64, bands=16, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, size=num_perm, dtype=np.uint64)
+        # Folds the rows of a band into one bucket key
+        self._band_mix = rng.integers(1, 1 << 63, size=num_perm // bands, dtype=np.uint64) | np.uint64(1)
+        self.stats = {'jobs': 0, 'exact_duplicates': 0, 'near_duplicates': 0, 'candidate_pairs': 0}
+
+    def _signatures(self, token_sets, chunk_elements=4_000_000):
+        """MinHash signature of every token set, computed a chunk of sets at a time"""
+        hashes = [np.fromiter((zlib.crc32(token.encode('utf-8')) for token in tokens),
+                              dtype=np.uint64, count=len(tokens)) if tokens else np.zeros(1, dtype=np.uint64)
+                  for tokens in token_sets]
+        signatures = np.empty((len(hashes), self.num_perm), dtype=np.uint64)
+        start = 0
+        while start < len(hashes):
+            stop, size = start, 0
+            while stop < len(hashes) and (size == 0 or (size + len(hashes[stop])) * self.num_perm <= chunk_elements):
+                size += len(hashes[stop])
+                stop += 1
+            flat = np.concatenate(hashes[start:stop])
+            permuted = (flat[:, None] * self._a + self._b) % _PRIME
+            offsets = np.cumsum([0] + [len(h) for h in hashes[start:stop - 1]])
+            signatures[start:stop] = np.minimum.reduceat(permuted, offsets, axis=0)
+            start = stop
+        return signatures
+
+    def find_clusters(self, jobs):
+        """Group job indices by posting; every job appears in exactly one group"""
+        self.stats['jobs'] += len(jobs)
+        parent = list(range(len(jobs)))
+
+        # source -> posting_id of the listings in each cluster, kept at its root
+        listings = [{job.get('source'): job.get('posting_id')} for job in jobs]
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def union(i, j, stat):
+            """Merge the clusters of i and j; False if they hold different postings of one source"""
+            root, other = find(i), find(j)
+            if root == other:
+                return True
+            ours, theirs = listings[root], listings[other]
+            if any(posting_id is None or ours[source] != posting_id
+                   for source, posting_id in theirs.items() if source in ours):
+                return False
+            parent[other] = root
+            ours.update(theirs)
+            listings[other] = None
+            self.stats[stat] += 1
+            return True
+
+        # Exact duplicates after normalization
+        postings = {}  # normalized fields -> (distinct postings, source -> first of them without it)
+        listed = {}    # (normalized fields, source, posting_id) -> first job
+        keys = []
+        representatives = []
+        for i, job in enumerate(jobs):
+            key = (normalize_title(job.get('title')), normalize_company(job.get('company')),
+                   normalize_location(job.get('location')))
+            source, posting_id = job.get('source'), job.get('posting_id')
+            if posting_id is not None:
+                first = listed.setdefault((key, source, posting_id), i)
+                if first != i and union(first, i, 'exact_duplicates'):
+                    continue
+            same, vacant = postings.setdefault(key, ([], {}))
+            # Postings only ever gain sources, so the search for one without this source resumes
+            start = vacant.get(source, 0)
+            while start < len(same) and source in listings[find(same[start])]:
+                start += 1
+            vacant[source] = start
+            if start == len(same) or not union(same[start], i, 'exact_duplicates'):
+                same.append(i)
+                keys.append(key)
+                representatives.append(i)
+
+        # Near duplicates among the distinct postings
+        if len(representatives) > 1:
+            title_words = [set(key[0].split()) for key in keys]
+            signatures = self._signatures(title_words)
+            # Only postings of the same company can share a bucket
+            companies = np.fromiter((zlib.crc32(key[1].encode('utf-8')) for key in keys),
+                                    dtype=np.uint64, count=len(keys)) * _COMPANY_MIX
+            rows = self.num_perm // self.bands
+            # Postings with equal signatures fall into the same bucket in every band
+            merged_buckets = set()
+            for band in range(self.bands):
+                band_keys = (signatures[:, band * rows:(band + 1) * rows] * self._band_mix).sum(
+                    axis=1, dtype=np.uint64) ^ companies
+                for members in self._buckets(band_keys):
+                    if members in merged_buckets:
+                        continue
+                    merged_buckets.add(members)
+                    self._merge_bucket(members, keys, title_words, representatives, union)
+
+        clusters = defaultdict(list)
+        for i in range(len(jobs)):
+            clusters[find(i)].append(i)
+        return list(clusters.values())
+
+    def _buckets(self, band_keys):
+        """Positions sharing a band key, for every key shared by two or more postings"""
+        order = np.argsort(band_keys, kind='stable')
+        sorted_keys = band_keys[order]
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        sizes = np.diff(np.r_[starts, len(sorted_keys)])
+        for start, size in zip(starts[sizes > 1].tolist(), sizes[sizes > 1].tolist()):
+            yield tuple(order[start:start + size].tolist())
+
+    def _merge_bucket(self, members, keys, title_words, representatives, union):
+        """Union the compatible postings of one LSH bucket
+
+        Each posting is compared with one representative per company and
+        location already seen in the bucket, so a large bucket stays linear.
+        A similar posting kept apart for coming from a source its
+        representative's cluster already lists takes over as representative.
+        """
+        anchors = defaultdict(dict)  # company -> {location: bucket position}
+        for position in members:
+            _, company, location = keys[position]
+            seen = anchors[company]
+            if location:
+                candidates = [seen[place] for place in (location, '') if place in seen]
+            else:
+                candidates = list(seen.values())
+            for anchor in candidates:
+                self.stats['candidate_pairs'] += 1
+                if self._similar(title_words[anchor], title_words[position]):
+                    if not union(representatives[anchor], representatives[position], 'near_duplicates'):
+                        seen[location] = position
+                    break
+            else:
+                seen.setdefault(location, position)
+
+    def _similar(self, first, second):
+        if not first or not second:
+            return first == second
+        return len(first & second) / len(first | second) >= self.threshold
+
+    def deduplicate(self, jobs):
+        """Jobs with every posting listed once; merged records list all their sources"""
+        merged = []
+        for cluster in self.find_clusters(jobs):
+            if len(cluster) == 1:
+                job = jobs[cluster[0]]
+                if 'sources' not in job:
+                    job['sources'] = [job.get('source', 'Unknown')]
+                merged.append(job)
+            else:
+                merged.append(merge_jobs([jobs[i] for i in cluster]))
+        return merged
+
+
+def merge_jobs(jobs):
+    """One record for a posting seen several times
+
+    The most complete live record is kept; missing fields are filled in from
+    the others, skills are combined and every source and URL is listed.
+    """
+    ranked = sorted(jobs, key=lambda job: (QUALITY_RANK.get(job.get('data_quality'), 0),
+                                           -len(job.get('description') or ''),
+                                           not job.get('salary')))
+    merged = JobRecord(ranked[0])
+    for job in ranked[1:]:
+        for field, value in job.items():
+            if value and not merged.get(field):
+                merged[field] = value
+
+    skills = {}
+    sources = {}
+    urls = {}
+    for job in ranked:
+        skills.update(dict.fromkeys(job.get('skills') or []))
+        sources.update(dict.fromkeys(job.get('sources') or [job.get('source', 'Unknown')]))
+        if job.get('url'):
+            urls[job['url']] = None
+    merged['skills'] = list(skills)
+    merged['sources'] = list(sources)
+    merged['urls'] = list(urls)
+    return merged
+
+
+def deduplicate_jobs(jobs, threshold=0.8):
+    """Merge cross-source duplicates with a default JobDeduplicator"""
+    return JobDeduplicator(threshold=threshold).deduplicate(jobs)
+
+
+# Example usage
+if __name__ == "__main__":
+    jobs = [
+        {'title': 'Sr. Python Developer', 'company': 'Acme Inc.', 'location': 'Austin, Texas',
+         'source': 'LinkedIn', 'skills': ['Python', 'Django'], 'url': 'https://linkedin.com/jobs/view/1'},
+        {'title': 'Senior Python Developer (Remote)', 'company': 'ACME', 'location': 'Austin, TX',
+         'source': 'Indeed', 'skills': ['Python', 'AWS'], 'salary': '$120k - $150k',
+         'url': 'https://indeed.com/viewjob?jk=1'},
+        {'title': 'Senior Python Developer', 'company': 'Acme LLC', 'location': '',
+         'source': 'Glassdoor', 'skills': ['Python'], 'url': 'https://glassdoor.com/job-listing/1'},
+        {'title': 'Senior Python Developer', 'company': 'Globex', 'location': 'Austin, TX',
+         'source': 'Indeed', 'skills': ['Python'], 'url': 'https://indeed.com/viewjob?jk=2'},
+    ]
+    deduplicator = JobDeduplicator()
+    for job in deduplicator.deduplicate(jobs):
+        print(f"   {job['title']} @ {job['company']} ({job['location'] or 'n/a'}) "
+              f"← {', '.join(job['sources'])} | {', '.join(job['skills'])} | {job.get('salary')}")
+    print(f"📊 {deduplicator.stats}")
@@ -0,0 +1,338 @@
+import json
+from datetime import datetime
+from urllib.parse import urljoin
+from html_parser import make_soup, container_strainer
+from selector_cache import SelectorCache
+from skill_matcher import default_matcher
+
+# Pure parse stage: raw HTML in, list of job dicts out. These functions hold no
+# state so RealJobScraper can run them in worker processes.
+
+LINKEDIN_CARD_SELECTOR = "[data-testid='job-search-card']"
+
+# Only the job-card subtrees of each results page are parsed
+LINKEDIN_CARDS = container_strainer(('div', 'class', 'job-search-card'))
+LINKEDIN_RENDERED_CARDS = container_strainer((None, 'data-testid', 'job-search-card'))
+GLASSDOOR_CARDS = container_strainer(
+    ('li', 'data-test', 'jobListing'),
+    (None, 'class', 'react-job-listing'),
+    (None, 'data-test', 'job-listing'),
+    (None, 'class', 'jobContainer'),
+)
+INDEED_CARDS = container_strainer(('div', 'class', 'job_seen_beacon'), ('a', 'data-jk', True))
+
+# Job detail pages: only the description, salary and structured data
+JOB_POSTING_SCRIPT = ('script', 'type', 'application/ld+json')
+DETAIL_STRAINERS = {
+    'LinkedIn': container_strainer(
+        ('div', 'class', 'show-more-less-html__markup'),
+        ('div', 'class', 'description__text'),
+        (None, 'class', 'compensation__salary'),
+        JOB_POSTING_SCRIPT,
+    ),
+    'Glassdoor': container_strainer(
+        ('div', 'class', 'jobDescriptionContent'),
+        (None, 'id', 'JobDescriptionContainer'),
+        (None, 'data-test', 'detailSalary'),
+        (None, 'class', 'salaryEstimate'),
+        JOB_POSTING_SCRIPT,
+    ),
+    'Indeed': container_strainer(
+        (None, 'id', 'jobDescriptionText'),
+        ('div', 'class', 'jobsearch-jobDescriptionText'),
+        (None, 'id', 'salaryInfoAndJobType'),
+        JOB_POSTING_SCRIPT,
+    ),
+}
+
+# schema.org employmentType values
+EMPLOYMENT_TYPES = {
+    'FULL_TIME': 'Full-time',
+    'PART_TIME': 'Part-time',
+    'CONTRACTOR': 'Contract',
+    'TEMPORARY': 'Temporary',
+    'INTERN': 'Internship',
+}
+CURRENCY_SYMBOLS = {'USD': '$', 'CAD': '$', 'AUD': '$', 'GBP': '£', 'EUR': '€', 'INR': '₹'}
+
+# Candidate selectors per source and field, most likely first
+SELECTORS = {
+    'LinkedIn': {
+        'cards': ['div.job-search-card'],
+        'title': ['h3'],
+        'company': ['h4'],
+        'location': ['span.job-search-card__location'],
+        'detail_description': ['div.show-more-less-html__markup', 'div.description__text'],
+        'detail_salary': ['.compensation__salary'],
+    },
+    'Glassdoor': {
+        'cards': ['li[data-test="jobListing"]', '.react-job-listing', '[data-test="job-listing"]', '.jobContainer'],
+        'title': ['[data-test="job-title"]', '.jobTitle', 'h2 a'],
+        'company': ['[data-test="employer-name"]', '.employerName', '.companyName'],
+        'location': ['[data-test="job-location"]', '.location', '.jobLocation'],
+        'salary': ['[data-test="detailSalary"]', '.salaryText', '.salary'],
+        'detail_description': ['div.jobDescriptionContent', '#JobDescriptionContainer'],
+        'detail_salary': ['[data-test="detailSalary"]', '.salaryEstimate'],
+    },
+    'Indeed': {
+        'cards': ['div.job_seen_beacon', 'a[data-jk]'],
+        'title': ['h2', 'span[title]'],
+        'company': ['span.companyName', 'a[data-testid="company-name"]'],
+        'location': ['div.companyLocation'],
+        'salary': ['span.salaryText'],
+        'detail_description': ['#jobDescriptionText', 'div.jobsearch-jobDescriptionText'],
+        'detail_salary': ['#salaryInfoAndJobType span'],
+    },
+}
+
+# One cache per process: each parse worker learns which selectors win
+SELECTOR_CACHE = SelectorCache()
+
+
+def _select_cards(source, soup):
+    return SELECTOR_CACHE.select(source, 'cards', soup, SELECTORS[source]['cards'])
+
+
+def _field_text(source, field, card):
+    return SELECTOR_CACHE.text(source, field, card, SELECTORS[source][field])
+
+
+def _linkedin_card_url(card):
+    """The /jobs/view/<id> link of a LinkedIn result card, or None"""
+    for link in card.find_all('a', href=True):
+        if '/jobs/view/' in link['href']:
+            return urljoin("https://www.linkedin.com", link['href'])
+    # Guest result cards also carry the id as data-entity-urn="urn:li:jobPosting:<id>"
+    job_id = (card.get('data-entity-urn') or '').rpartition(':')[2]
+    return f"https://www.linkedin.com/jobs/view/{job_id}" if job_id.isdigit() else None
+
+
+def parse_linkedin_page(html, page_url, location='', backend=None, restrict=True):
+    """Parse the job cards of a LinkedIn result page"""
+    jobs = []
+    soup = make_soup(html, backend, LINKEDIN_CARDS if restrict else None)
+
+    # LinkedIn's structure changes frequently, this is a basic attempt
+    job_cards = _select_cards('LinkedIn', soup)
+
+    for card in job_cards:
+        try:
+            title = _field_text('LinkedIn', 'title', card) or "Unknown Title"
+            company = _field_text('LinkedIn', 'company', card) or "Unknown Company"
+            job_location = _field_text('LinkedIn', 'location', card) or "Unknown Location"
+
+            jobs.append({
+                'title': title,
+                'company': company,
+                'location': job_location,
+                'skills': extract_skills_from_text(title),
+                'date_posted': datetime.now().strftime('%Y-%m-%d'),
+                'source': 'LinkedIn',
+                'salary': None,
+                'description': f"LinkedIn job posting for {title}",
+                'job_type': 'Full-time',
+                'url': _linkedin_card_url(card) or page_url
+            })
+
+        except Exception as e:
+            continue
+
+    return jobs
+
+
+def parse_linkedin_rendered_cards(html, backend=None, restrict=True):
+    """Extract card fields from rendered LinkedIn HTML in a single parse"""
+    soup = make_soup(html, backend, LINKEDIN_RENDERED_CARDS if restrict else None)
+    cards = []
+    for card in soup.select(LINKEDIN_CARD_SELECTOR):
+        title_elem = card.select_one("h3 a")
+        company_elem = card.select_one("h4 a")
+        location_elem = card.select_one("[data-testid='job-search-card-location']")
+        date_elem = card.select_one("time")
+        cards.append({
+            'title': title_elem.get_text(strip=True) if title_elem else None,
+            'url': title_elem.get('href') if title_elem else None,
+            'company': company_elem.get_text(strip=True) if company_elem else None,
+            'location': location_elem.get_text(strip=True) if location_elem else None,
+            'date_posted': date_elem.get('datetime') if date_elem else None,
+        })
+    return cards
+
+
+def linkedin_card_to_job(card):
+    """Build a job dict from the fields of a rendered LinkedIn card"""
+    title = card['title']
+    company = card['company']
+    return {
+        'title': title,
+        'company': company,
+        'location': card['location'],
+        'skills': extract_skills_from_text(title),
+        'date_posted': card.get('date_posted') or datetime.now().strftime('%Y-%m-%d'),
+        'source': 'LinkedIn',
+        'salary': None,  # LinkedIn rarely shows salary in search
+        'description': f"LinkedIn job posting for {title} at {company}",
+        'job_type': 'Full-time',
+        'url': card.get('url')
+    }
+
+
+def parse_glassdoor_page(html, page_url, location='', backend=None, restrict=True):
+    """Parse the job listings of a Glassdoor result page"""
+    jobs = []
+    soup = make_soup(html, backend, GLASSDOOR_CARDS if restrict else None)
+
+    # Look for job listings with various possible selectors
+    job_listings = _select_cards('Glassdoor', soup)
+
+    for listing in job_listings:
+        try:
+            title = _field_text('Glassdoor', 'title', listing) or "Unknown Title"
+            company = _field_text('Glassdoor', 'company', listing) or "Unknown Company"
+            job_location = _field_text('Glassdoor', 'location', listing) or location
+
+            # Salary is only shown on some listings
+            salary = _field_text('Glassdoor', 'salary', listing)
+
+            # Extract job URL
+            url_elem = listing.find('a')
+            job_url = urljoin("https://www.glassdoor.com", url_elem.get('href')) if url_elem else page_url
+
+            jobs.append({
+                'title': title,
+                'company': company,
+                'location': job_location,
+                'skills': extract_skills_from_text(title),
+                'date_posted': datetime.now().strftime('%Y-%m-%d'),
+                'source': 'Glassdoor',
+                'salary': salary,
+                'description': f"Glassdoor job posting for {title} at {company}",
+                'job_type': 'Full-time',
+                'url': job_url
+            })
+
+        except Exception as e:
+            print(f"   ⚠️ Error extracting Glassdoor job: {e}")
+            continue
+
+    return jobs
+
+
+def parse_indeed_page(html, page_url, location='', backend=None, restrict=True):
+    """Parse the job cards of an Indeed result page"""
+    jobs = []
+    soup = make_soup(html, backend, INDEED_CARDS if restrict else None)
+
+    # Look for job cards
+    job_cards = _select_cards('Indeed', soup)
+
+    for card in job_cards:
+        try:
+            title = _field_text('Indeed', 'title', card) or "Unknown Title"
+            company = _field_text('Indeed', 'company', card) or "Unknown Company"
+            job_location = _field_text('Indeed', 'location', card) or location
+
+            # Salary is only shown on some listings
+            salary = _field_text('Indeed', 'salary', card)
+
+            # Extract job URL
+            link_elem = card.find('a')
+            job_url = urljoin("https://www.indeed.com", link_elem.get('href')) if link_elem else page_url
+
+            jobs.append({
+                'title': title,
+                'company': company,
+                'location': job_location,
+                'skills': extract_skills_from_text(title),
+                'date_posted': datetime.now().strftime('%Y-%m-%d'),
+                'source': 'Indeed',
+                'salary': salary,
+                'description': f"Indeed job posting for {title} at {company}",
+                'job_type': 'Full-time',
+                'url': job_url
+            })
+
+        except Exception as e:
+            print(f"   ⚠️ Error extracting Indeed job: {e}")
+            continue
+
+    return jobs
+
+
+def extract_skills_from_text(text, limit=5):
+    """Extract potential skills from job title or description"""
+    return default_matcher().tag(text, limit)
+
+
+def _job_posting_data(soup):
+    """The schema.org JobPosting embedded in a detail page as JSON-LD, or None"""
+    for script in soup.find_all('script', attrs={'type': 'application/ld+json'}):
+        try:
+            data = json.loads(script.string or '')
+        except ValueError:
+            continue
+        items = data if isinstance(data, list) else data.get('@graph', [data])
+        for item in items:
+            if isinstance(item, dict) and item.get('@type') == 'JobPosting':
+                return item
+    return None
+
+
+def _format_salary(base_salary):
+    """Format a JobPosting baseSalary like the salaries shown on search pages"""
+    if not isinstance(base_salary, dict):
+        return None
+    value = base_salary.get('value')
+    if not isinstance(value, dict):
+        value = {'value': value}
+    low = value.get('minValue', value.get('value'))
+    high = value.get('maxValue')
+    if low is None:
+        return None
+
+    currency = base_salary.get('currency', 'USD')
+    symbol = CURRENCY_SYMBOLS.get(currency, currency + ' ')
+    unit = str(value.get('unitText') or base_salary.get('unitText') or 'YEAR').lower()
+
+    def amount(number):
+        number = float(number)
+        if unit == 'year' and number >= 1000:
+            return f"{symbol}{number / 1000:g}k"
+        return f"{symbol}{number:g}"
+
+    salary = amount(low) if high in (None, low) else f"{amount(low)} - {amount(high)}"
+    return salary if unit == 'year' else f"{salary} per {unit}"
+
+
+def parse_detail_page(source, html, title='', backend=None, restrict=True):
+    """Parse a job detail page into the fields it can fill in
+
+    Returns a dict with some of: description, salary, job_type, skills.
+    Skills are extracted from the title plus the full description.
+    """
+    soup = make_soup(html, backend, DETAIL_STRAINERS[source] if restrict else None)
+    posting = _job_posting_data(soup) or {}
+    fields = {}
+
+    description = None
+    element = SELECTOR_CACHE.select_one(source, 'detail_description', soup,
+                                        SELECTORS[source]['detail_description'])
+    if element is not None:
+        description = element.get_text(' ', strip=True)
+    elif posting.get('description'):
+        description = make_soup(posting['description'], backend).get_text(' ', strip=True)
+    if description:
+        fields['description'] = description
+        fields['skills'] = extract_skills_from_text(f"{title}\n{description}", limit=None)
+
+    salary = _field_text(source, 'detail_salary', soup) or _format_salary(posting.get('baseSalary'))
+    if salary:
+        fields['salary'] = salary
+
+    employment_type = posting.get('employmentType')
+    if isinstance(employment_type, list):
+        employment_type = employment_type[0] if employment_type else None
+    if employment_type in EMPLOYMENT_TYPES:
+        fields['job_type'] = EMPLOYMENT_TYPES[employment_type]
+
+    return fields
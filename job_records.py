@@ -0,0 +1,447 @@
+import sys
+from collections import Counter
+from collections.abc import Mapping, MutableMapping, Sequence
+
+import numpy as np
+
+# Fields every scraped job has, in display order
+JOB_FIELDS = ('title', 'company', 'location', 'skills', 'date_posted', 'source', 'salary',
+              'description', 'job_type', 'url', 'data_quality')
+# Fields with few distinct values: interned in records, dictionary-encoded in tables
+CATEGORICAL_FIELDS = ('title', 'company', 'location', 'date_posted', 'source', 'salary', 'job_type',
+                      'data_quality')
+# Fields that are (nearly) unique per job and stored as they are
+TEXT_FIELDS = ('description', 'url')
+
+# Marks rows of an extra-field column where the job has no such field (None is a real value)
+MISSING = object()
+
+
+def _object_array(values):
+    """1-d object array of values (np.array would nest list values)"""
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+class JobRecord(MutableMapping):
+    """One job, stored in slots instead of a per-job dict
+
+    Behaves like the job dicts the scrapers used to pass around (get,
+    item access, update, 'in', iteration, dict(job)), at a fraction of the
+    memory: the core fields live in slots, repeated strings such as
+    company, location and source are interned, and only fields outside
+    JOB_FIELDS (posting_id, sources, ...) go to a small overflow dict.
+    """
+
+    __slots__ = JOB_FIELDS + ('_extra',)
+
+    def __init__(self, fields=(), **kwargs):
+        self._extra = None
+        self.update(fields, **kwargs)
+
+    @classmethod
+    def from_dict(cls, job):
+        return job if isinstance(job, cls) else cls(job)
+
+    def __getitem__(self, field):
+        if field in _SLOT_FIELDS:
+            try:
+                return getattr(self, field)
+            except AttributeError:
+                raise KeyError(field) from None
+        if self._extra is None:
+            raise KeyError(field)
+        return self._extra[field]
+
+    def get(self, field, default=None):
+        # Mapping.get goes through __getitem__ and an exception per missing key
+        if field in _SLOT_FIELDS:
+            return getattr(self, field, default)
+        if self._extra is None:
+            return default
+        return self._extra.get(field, default)
+
+    def __setitem__(self, field, value):
+        if field in _SLOT_FIELDS:
+            if field in _INTERNED_FIELDS and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, field, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[field] = value
+
+    def __delitem__(self, field):
+        if field in _SLOT_FIELDS:
+            try:
+                delattr(self, field)
+            except AttributeError:
+                raise KeyError(field) from None
+        elif self._extra is not None and field in self._extra:
+            del self._extra[field]
+        else:
+            raise KeyError(field)
+
+    def __iter__(self):
+        for field in JOB_FIELDS:
+            if hasattr(self, field):
+                yield field
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for field in JOB_FIELDS if hasattr(self, field)) + len(self._extra or ())
+
+    def __contains__(self, field):
+        if field in _SLOT_FIELDS:
+            return hasattr(self, field)
+        return self._extra is not None and field in self._extra
+
+    def copy(self):
+        return JobRecord(self)
+
+    def to_dict(self):
+        return dict(self)
+
+    def __getstate__(self):
+        return dict(self)
+
+    def __setstate__(self, state):
+        self._extra = None
+        self.update(state)
+
+    def __repr__(self):
+        return f"JobRecord({dict(self)!r})"
+
+
+_SLOT_FIELDS = frozenset(JOB_FIELDS)
+_INTERNED_FIELDS = frozenset(CATEGORICAL_FIELDS)
+
+
+class Categorical:
+    """Dictionary-encoded column: int32 codes into a list of distinct values (-1: None)
+
+    `categories` may be any sequence (e.g. strings decoded lazily from a
+    memory-mapped snapshot); it is copied into a list, and the value -> code
+    index built, only when a new value is encoded.
+    """
+
+    def __init__(self, categories=None):
+        self.categories = categories if categories is not None else []
+        self._index = None
+
+    def code_of(self, value):
+        if value is None:
+            return -1
+        if self._index is None:
+            self.categories = list(self.categories)
+            self._index = {value: code for code, value in enumerate(self.categories)}
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.categories)
+            self.categories.append(value)
+        return code
+
+    def encode(self, values):
+        code_of = self.code_of
+        return np.fromiter((code_of(value) for value in values), dtype=np.int32)
+
+    def decode(self, code):
+        return None if code < 0 else self.categories[code]
+
+
+class JobView(Mapping):
+    """Dict-compatible view of one row of a JobTable
+
+    Reads go straight to the table's columns; assigning a field writes the
+    table (so code that enriches jobs in place keeps working).
+    """
+
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table, row):
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, field):
+        return self._table.value(self._row, field)
+
+    def __setitem__(self, field, value):
+        self._table.set_value(self._row, field, value)
+
+    def update(self, fields=(), **kwargs):
+        for field, value in dict(fields, **kwargs).items():
+            self[field] = value
+
+    def __iter__(self):
+        return self._table.fields_of(self._row)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def copy(self):
+        return dict(self)
+
+    def __repr__(self):
+        return f"JobView({dict(self)!r})"
+
+
+class JobTable(Sequence):
+    """Jobs stored column by column in NumPy arrays
+
+    Categorical fields (company, location, source, job_type, ...) are int32
+    codes into shared category lists, skills are int32 codes in one flat
+    array with per-job offsets, and description/url are object arrays.
+    Fields outside JOB_FIELDS are kept in object columns. Indexing returns
+    JobView rows that behave like the old job dicts, so the analyzer and
+    GUI work unchanged; vectorized code can use codes() and value_counts()
+    instead.
+    """
+
+    def __init__(self, codes, categories, text, skills, skill_offsets, skill_categories, extras=None):
+        self._codes = codes                # field -> int32 array
+        self._categories = categories      # field -> Categorical
+        self._text = text                  # field -> object array
+        self.skills = skills               # int32 skill codes of every job, concatenated
+        self.skill_offsets = skill_offsets # job i's skills: skills[offsets[i]:offsets[i + 1]]
+        self.skill_categories = skill_categories
+        self._extras = extras or {}        # field -> object array (MISSING where absent)
+        # Skill lists assigned after construction (e.g. by detail enrichment)
+        self._skill_overrides = {}
+
+    @classmethod
+    def from_jobs(cls, jobs):
+        """Build a table from job dicts (or records, or views)"""
+        jobs = list(jobs)
+        categories = {field: Categorical() for field in CATEGORICAL_FIELDS}
+        codes = {field: categories[field].encode(job.get(field) for job in jobs)
+                 for field in CATEGORICAL_FIELDS}
+        text = {field: _object_array([job.get(field) for job in jobs]) for field in TEXT_FIELDS}
+
+        skill_categories = Categorical()
+        counts = np.zeros(len(jobs) + 1, dtype=np.int64)
+        flat = []
+        for i, job in enumerate(jobs):
+            skills = job.get('skills') or []
+            if isinstance(skills, str):
+                skills = skills.split(', ')
+            flat.extend(skill_categories.code_of(skill) for skill in skills)
+            counts[i + 1] = len(skills)
+
+        extras = {}
+        for i, job in enumerate(jobs):
+            for field in job:
+                if field not in _SLOT_FIELDS:
+                    column = extras.get(field)
+                    if column is None:
+                        column = extras[field] = np.full(len(jobs), MISSING, dtype=object)
+                    column[i] = job[field]
+
+        return cls(codes, categories, text, np.array(flat, dtype=np.int32), np.cumsum(counts),
+                   skill_categories, extras)
+
+    @classmethod
+    def from_synthetic(cls, block, text=True):
+        """Build a table from a synthetic_data.SyntheticJobColumns block without per-job dicts
+
+        With text=False descriptions and URLs are left empty, which is much
+        faster for analysis-only tables.
+        """
+        from synthetic_data import SOURCE_URLS
+
+        columns, vocab = block.columns, block.vocab
+        count = len(block)
+        categories = {}
+        codes = {}
+        for field in ('title', 'company', 'location', 'source', 'job_type'):
+            categories[field] = Categorical(vocab[field])
+            codes[field] = columns[field].astype(np.int32)
+
+        dates, date_codes = np.unique(columns['date_posted'], return_inverse=True)
+        categories['date_posted'] = Categorical(np.datetime_as_string(dates, unit='D').tolist())
+        codes['date_posted'] = date_codes.astype(np.int32)
+
+        pairs, salary_codes = np.unique(np.stack([columns['salary_min'], columns['salary_max']], axis=1),
+                                        axis=0, return_inverse=True)
+        salaries = [f"${low}k - ${high}k" if low else None for low, high in pairs.tolist()]
+        salary_codes = np.asarray(salary_codes, dtype=np.int32).reshape(-1)
+        categories['salary'] = Categorical([salary for salary in salaries if salary is not None])
+        remap = np.array([categories['salary'].code_of(salary) for salary in salaries], dtype=np.int32)
+        codes['salary'] = remap[salary_codes]
+
+        categories['data_quality'] = Categorical(['mock'])
+        codes['data_quality'] = np.zeros(count, dtype=np.int32)
+
+        table = cls(codes, categories, {}, block.skills.astype(np.int32), block.skill_offsets.copy(),
+                    Categorical(vocab['skill']))
+        if not text:
+            table._text = {field: np.full(count, None, dtype=object) for field in TEXT_FIELDS}
+            return table
+        # Same wording and links as SyntheticJobColumns.to_jobs
+        url_formats = [SOURCE_URLS.get(source, 'https://jobs.example.com/{}') for source in vocab['source']]
+        urls = [url_formats[source].format(job_id)
+                for source, job_id in zip(columns['source'].tolist(), columns['job_id'].tolist())]
+        descriptions = [f"{job['company']} is hiring a {job['title']} in {job['location']}. "
+                        f"Experience with {', '.join(job['skills'])} is required." for job in table]
+        table._text = {'description': _object_array(descriptions), 'url': _object_array(urls)}
+        return table
+
+    def __len__(self):
+        return len(self.skill_offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(np.arange(len(self))[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('job index out of range')
+        return JobView(self, index)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield JobView(self, row)
+
+    @property
+    def fields(self):
+        return JOB_FIELDS + tuple(self._extras)
+
+    def fields_of(self, row):
+        yield from JOB_FIELDS
+        for field, column in self._extras.items():
+            if column[row] is not MISSING:
+                yield field
+
+    def value(self, row, field):
+        if field in self._codes:
+            return self._categories[field].decode(self._codes[field][row])
+        if field == 'skills':
+            if row in self._skill_overrides:
+                return list(self._skill_overrides[row])
+            names = self.skill_categories.categories
+            start, stop = self.skill_offsets[row], self.skill_offsets[row + 1]
+            return [names[code] for code in self.skills[start:stop].tolist()]
+        if field in self._text:
+            return self._text[field][row]
+        column = self._extras.get(field)
+        if column is None or column[row] is MISSING:
+            raise KeyError(field)
+        return column[row]
+
+    def set_value(self, row, field, value):
+        if field in self._codes:
+            self._codes[field][row] = self._categories[field].code_of(value)
+        elif field == 'skills':
+            self._skill_overrides[row] = list(value or [])
+        elif field in self._text:
+            self._writable(self._text, field)[row] = value
+        else:
+            if field not in self._extras:
+                self._extras[field] = np.full(len(self), MISSING, dtype=object)
+            self._writable(self._extras, field)[row] = value
+
+    @staticmethod
+    def _writable(columns, field):
+        """The column as an object array, copying read-only (memory-mapped) string columns"""
+        column = columns[field]
+        if not isinstance(column, np.ndarray):
+            column = columns[field] = _object_array(list(column))
+        return column
+
+    def take(self, rows):
+        """A new table with the given rows, in that order"""
+        rows = np.asarray(rows, dtype=np.int64)
+        starts, stops = self.skill_offsets[rows], self.skill_offsets[rows + 1]
+        lengths = stops - starts
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        positions = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+        table = JobTable({field: codes[rows] for field, codes in self._codes.items()},
+                         self._categories,
+                         {field: column[rows] for field, column in self._text.items()},
+                         self.skills[positions], offsets, self.skill_categories,
+                         {field: column[rows] for field, column in self._extras.items()})
+        for new_row, row in enumerate(rows.tolist()):
+            if row in self._skill_overrides:
+                table._skill_overrides[new_row] = self._skill_overrides[row]
+        return table
+
+    def codes(self, field):
+        """The int32 code column of a categorical field, and its category list"""
+        return self._codes[field], self._categories[field].categories
+
+    def value_counts(self, field):
+        """Counter-style {value: count} of a categorical field, computed with bincount"""
+        codes, categories = self.codes(field)
+        counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+        return {categories[code]: int(count) for code, count in enumerate(counts.tolist()) if count}
+
+    def skill_counts(self):
+        """{skill: number of jobs listing it}"""
+        if self._skill_overrides:
+            return dict(Counter(skill for job in self for skill in job['skills']))
+        counts = np.bincount(self.skills, minlength=len(self.skill_categories.categories))
+        names = self.skill_categories.categories
+        return {names[code]: int(count) for code, count in enumerate(counts.tolist()) if count}
+
+    def extra_values(self, field):
+        """Values of a field outside JOB_FIELDS, for the jobs that have it"""
+        column = self._extras.get(field)
+        if column is None:
+            return []
+        return [value for value in column if value is not MISSING]
+
+    def to_dicts(self):
+        return [dict(job) for job in self]
+
+    def to_records(self):
+        return [JobRecord(job) for job in self]
+
+    def memory_usage(self):
+        """Approximate bytes held by the table (arrays, categories and text)"""
+        total = self.skills.nbytes + self.skill_offsets.nbytes
+        total += sum(codes.nbytes for codes in self._codes.values())
+        for categorical in list(self._categories.values()) + [self.skill_categories]:
+            categories = categorical.categories
+            if hasattr(categories, 'nbytes'):
+                total += categories.nbytes  # memory-mapped
+            else:
+                total += sum(sys.getsizeof(value) for value in categories)
+        for column in list(self._text.values()) + list(self._extras.values()):
+            if not isinstance(column, np.ndarray):
+                total += column.nbytes  # memory-mapped; decoded on access
+                continue
+            total += column.nbytes + sum(sys.getsizeof(value) for value in column
+                                         if value is not None and value is not MISSING)
+        return total
+
+
+def to_records(jobs):
+    """Convert job dicts to JobRecords (records are passed through)"""
+    return [JobRecord.from_dict(job) for job in jobs]
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+
+    from synthetic_data import SyntheticJobGenerator
+
+    count = 100_000
+    for label, build in (
+        ('dicts', lambda: SyntheticJobGenerator(seed=0).generate(count)),
+        ('JobRecords', lambda: to_records(SyntheticJobGenerator(seed=0).generate(count))),
+        ('JobTable', lambda: JobTable.from_jobs(SyntheticJobGenerator(seed=0).generate(count))),
+        ('columns', lambda: JobTable.from_synthetic(SyntheticJobGenerator(seed=0).columns(count))),
+    ):
+        tracemalloc.start()
+        start = time.perf_counter()
+        jobs = build()
+        elapsed = time.perf_counter() - start
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"   {label:<10} {count:,} jobs: {current / 1024 / 1024:7.1f} MB "
+              f"({current / count:5.0f} bytes/job), built in {elapsed:.2f}s")
+        del jobs
@@ -1,493 +1,624 @@
-import requests
-from bs4 import BeautifulSoup
+import multiprocessing
+import os
+import queue
+import threading
 import time
-import random
-from datetime import datetime, timedelta
-import re
-from urllib.parse import quote_plus, urljoin
-import json
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from functools import partial
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+)
+from concurrent.futures.process import BrokenProcessPool
+from http_engine import AsyncFetchEngine
+from response_cache import ResponseCache
+from rate_limiter import HostRateLimiter
+from resilience import CircuitBreaker, RetryPolicy
+from app_paths import get_data_path
+from job_records import to_records
+from job_sources import available_sources, get_source, parse_source_detail, parse_source_page
+from replay import RECORD, REPLAY, ResponseArchive
+from seen_index import SeenIndex
+from job_store import JobStore
+from fixture_server import fixture_url as fixture_url_for
+from selector_cache import SelectorStats
+from driver_pool import WebDriverPool, create_chrome_driver, load_cached_probe, save_probe_result
+
+# Values of the 'data_quality' flag set on every job
+LIVE, DEGRADED, MOCK = 'live', 'degraded', 'mock'
 
 class RealJobScraper:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
-        self.driver = None
-        self.setup_selenium()
+    def __init__(self, max_concurrency=32, per_host_limit=8, timeout=15, max_parallel_pages=5,
+                 driver_pool_size=2, pages_per_driver=25, lazy_selenium=True, fast_load=True,
+                 scroll_timeout=2.0, max_scrolls=10, parser_backend=None, restrict_parsing=True,
+                 parse_workers=None, use_cache=True, cache_ttl=3600, cache_max_mb=200,
+                 rate_limits=None, retry_attempts=3, breaker_threshold=2, breaker_cooldown=300,
+                 detail_concurrency=8, sources=None, record_to=None, replay_from=None,
+                 fixture_url=None, track_seen=True, store_jobs=True):
+        # Job boards to search (registered JobSource names; default: all)
+        self.sources = {name: get_source(name) for name in (sources or available_sources())}
+        
+        # Raw responses can be recorded to an archive, or replayed from one
+        # instead of touching the network ($JOB_ANALYZER_RECORD / _REPLAY)
+        record_to = record_to or os.environ.get('JOB_ANALYZER_RECORD')
+        replay_from = replay_from or os.environ.get('JOB_ANALYZER_REPLAY')
+        self.archive = None
+        if replay_from:
+            self.archive = ResponseArchive(replay_from, REPLAY)
+        elif record_to:
+            self.archive = ResponseArchive(record_to, RECORD)
+        # Base URL of a fixture_server.FixtureServer standing in for the job boards
+        self.fixture_url = fixture_url
+        
+        # Postings scraped by earlier searches, so their detail pages are not fetched again
+        self.seen_index = SeenIndex(get_data_path('seen_postings.sqlite3')) if track_seen else None
+        # Every live posting scraped, kept for historical analysis (see JobDataAnalyzer.analyze_history)
+        self.job_store = JobStore(get_data_path('jobs.sqlite3')) if store_jobs else None
+        
+        # Responses are cached on disk so repeated queries are served locally
+        self.response_cache = None
+        if use_cache:
+            self.response_cache = ResponseCache(get_data_path('http_cache.sqlite3'), ttl=cache_ttl,
+                                                max_bytes=cache_max_mb * 1024 * 1024)
+        
+        # One rate limiter for every request (HTTP and Selenium) to each host;
+        # each source declares its host's politeness ceiling
+        host_limits = {source.host: source.rate_limit for source in self.sources.values()}
+        self.rate_limiter = HostRateLimiter(host_limits=dict(host_limits, **(rate_limits or {})))
+        
+        # Shared async fetcher; each job board host gets its own keep-alive pool
+        self.http = AsyncFetchEngine(max_concurrency=max_concurrency,
+                                     per_host_limit=per_host_limit, timeout=timeout,
+                                     cache=self.response_cache, rate_limiter=self.rate_limiter,
+                                     retry_policy=RetryPolicy(max_attempts=retry_attempts),
+                                     archive=self.archive,
+                                     rewrite_url=partial(fixture_url_for, fixture_url) if fixture_url else None)
+        
+        # A source that keeps failing is skipped (mock data) until its cooldown ends
+        self.circuit_breakers = {
+            name: CircuitBreaker(failure_threshold=breaker_threshold, cooldown=breaker_cooldown)
+            for name in self.sources
+        }
+        # Per-source performance counters (see performance_stats)
+        self.source_stats = {name: self._new_source_stats() for name in self.sources}
+        self._stats_lock = threading.Lock()
+        self.max_parallel_pages = max_parallel_pages
+        # Job detail pages fetched at once by enrich_jobs
+        self.detail_concurrency = detail_concurrency
+        self.driver_pool_size = driver_pool_size
+        self.pages_per_driver = pages_per_driver
+        self.fast_load = fast_load
+        self.scroll_timeout = scroll_timeout
+        self.max_scrolls = max_scrolls
+        # HTML parsing backend (None picks the fastest installed) and whether
+        # to build only the job-card subtrees of each page
+        self.parser_backend = parser_backend
+        self.restrict_parsing = restrict_parsing
+        # Result pages are parsed in a process pool (None: one worker per core,
+        # 0: parse inline in the scraping thread)
+        self.parse_workers = parse_workers
+        self._parse_executor = None
+        self._parse_lock = threading.Lock()
+        # Selector hit/miss statistics merged from every parse
+        self.selector_stats = SelectorStats()
+        self.driver_pool = None
+        # Chrome is started on the first browser-rendered request (or by warm_up_selenium)
+        self._selenium_lock = threading.Lock()
+        self._selenium_checked = False
+        if not lazy_selenium:
+            self._get_driver_pool()
+    
+    def scrape_sources(self, skill, location="", max_jobs=50, sources=None, on_source_done=None):
+        """Scrape several job sources concurrently, one worker per source
+        
+        on_source_done(source, jobs) is called from the worker pool as soon as
+        each source finishes, so callers can merge partial results early.
+        """
+        if sources is None:
+            sources = list(self.sources)
+        
+        all_jobs = []
+        if not sources:
+            return all_jobs
+        
+        with ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix='scraper') as executor:
+            futures = {
+                executor.submit(self.scrape_source, source, skill, location, max_jobs): source
+                for source in sources
+            }
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    jobs = future.result()
+                except Exception as e:
+                    print(f"   ❌ {source} worker failed: {e}")
+                    jobs = []
+                
+                all_jobs.extend(jobs)
+                if on_source_done:
+                    on_source_done(source, jobs)
+        
+        return all_jobs
+    
+    def iter_sources(self, skill, location="", max_jobs=50, sources=None):
+        """Scrape several job sources concurrently, yielding (source, jobs) batches
+        
+        A batch is yielded as soon as any source has parsed a result page, so
+        the first jobs arrive after about one page fetch instead of after the
+        slowest source has finished.
+        """
+        if sources is None:
+            sources = list(self.sources)
+        if not sources:
+            return
+        
+        batches = queue.Queue()
+        finished = object()
+        
+        def run(source):
+            try:
+                for jobs in self.iter_source(source, skill, location, max_jobs):
+                    batches.put((source, jobs))
+            except Exception as e:
+                print(f"   ❌ {source} worker failed: {e}")
+            finally:
+                batches.put((source, finished))
+        
+        with ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix='scraper') as executor:
+            for source in sources:
+                executor.submit(run, source)
+            
+            running = len(sources)
+            while running:
+                source, jobs = batches.get()
+                if jobs is finished:
+                    running -= 1
+                else:
+                    yield source, jobs
     
     def setup_selenium(self):
-        """Setup Selenium WebDriver for dynamic content"""
+        """Setup the Selenium WebDriver pool for dynamic content"""
+        if load_cached_probe() is False:
+            print("⚠️ Selenium unavailable (cached ChromeDriver check), using HTTP fallback")
+            self.driver_pool = None
+            return
+        
+        pool = WebDriverPool(size=self.driver_pool_size, max_pages_per_driver=self.pages_per_driver,
+                             driver_factory=partial(create_chrome_driver, fast_load=self.fast_load))
         try:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")  # Run in background
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            # Start one driver up front to check that Chrome is usable
+            pool.checkin(pool.checkout())
+            self.driver_pool = pool
+            save_probe_result(True)
             print("✅ Selenium WebDriver initialized successfully")
             
         except Exception as e:
             print(f"⚠️ Selenium setup failed: {e}")
             print("📝 Note: Install ChromeDriver for full functionality")
-            self.driver = None
+            save_probe_result(False)
+            pool.close()
+            self.driver_pool = None
+    
+    def _get_driver_pool(self):
+        """Return the WebDriver pool, setting up Selenium on first use"""
+        with self._selenium_lock:
+            if not self._selenium_checked:
+                self.setup_selenium()
+                self._selenium_checked = True
+        return self.driver_pool
+    
+    def warm_up_selenium(self):
+        """Start Chrome in a background thread so the first browser-rendered search is fast"""
+        thread = threading.Thread(target=self._get_driver_pool, name='selenium-warmup', daemon=True)
+        thread.start()
+        return thread
+    
+    def scrape_source(self, name, skill, location="", max_jobs=50):
+        """Scrape real jobs from one source"""
+        return [job for jobs in self.iter_source(name, skill, location, max_jobs) for job in jobs]
     
-    def scrape_linkedin(self, skill, location="", max_jobs=50):
-        """Scrape real jobs from LinkedIn"""
-        print(f"🔍 Scraping LinkedIn for '{skill}' jobs...")
-        jobs = []
+    def iter_source(self, name, skill, location="", max_jobs=50):
+        """Yield a source's jobs in batches, one per result page, as soon as each page is parsed
         
-        try:
-            # LinkedIn job search URL
-            base_url = "https://www.linkedin.com/jobs/search"
-            params = {
-                'keywords': skill,
-                'location': location,
-                'f_TPR': 'r604800',  # Past week
-                'f_JT': 'F',  # Full time
-                'start': 0
-            }
-            
-            # Build URL
-            url = f"{base_url}?keywords={quote_plus(skill)}"
-            if location:
-                url += f"&location={quote_plus(location)}"
-            
-            print(f"   🌐 Accessing: {url}")
-            
-            if self.driver:
-                jobs = self._scrape_linkedin_selenium(url, max_jobs)
+        The scrape runs behind the source's circuit breaker. Jobs are flagged
+        'live'; if a later result page fails, the jobs already yielded are
+        re-flagged 'degraded' in place. Mock data (flagged 'mock') is only
+        used when the source failed outright, found nothing, or its circuit
+        is open; an open circuit returns immediately instead of waiting for
+        timeouts. Only errors and failed fetches count against the breaker.
+        """
+        source = self.sources[name]
+        breaker = self.circuit_breakers[name]
+        if not breaker.allow_request():
+            if breaker.state == breaker.HALF_OPEN:
+                wait = "until its trial search finishes"
             else:
-                jobs = self._scrape_linkedin_requests(url, max_jobs)
-            
-            print(f"   ✅ Found {len(jobs)} LinkedIn jobs")
-            
-        except Exception as e:
-            print(f"   ❌ LinkedIn scraping error: {e}")
-            # Fallback to mock data for demonstration
-            jobs = self._generate_mock_linkedin_data(skill, location, max_jobs)
-        
-        return jobs
-    
-    def _scrape_linkedin_selenium(self, url, max_jobs):
-        """Scrape LinkedIn using Selenium"""
-        jobs = []
+                wait = f"for another {breaker.remaining_cooldown():.0f}s"
+            print(f"   ⏸️ {name} is failing, skipped {wait} (using mock data)")
+            self._count(name, circuit_open=1)
+            yield self._flag_jobs(source.generate_mock(skill, location, max_jobs), MOCK)
+            return
         
+        print(f"🔍 Scraping {name} for '{skill}' jobs...")
+        start = time.perf_counter()
+        self._count(name, searches=1)
+        found = []
+        settled = False  # whether the breaker has been told how this search went
         try:
-            self.driver.get(url)
-            time.sleep(random.uniform(3, 5))
-            
-            # Wait for job cards to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='job-search-card']"))
-            )
-            
-            # Scroll to load more jobs
-            for _ in range(3):
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-            
-            # Find job cards
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, "[data-testid='job-search-card']")
-            
-            for i, card in enumerate(job_cards[:max_jobs]):
-                try:
-                    # Extract job information
-                    title_elem = card.find_element(By.CSS_SELECTOR, "h3 a")
-                    title = title_elem.text.strip()
-                    job_url = title_elem.get_attribute('href')
-                    
-                    company_elem = card.find_element(By.CSS_SELECTOR, "h4 a")
-                    company = company_elem.text.strip()
-                    
-                    location_elem = card.find_element(By.CSS_SELECTOR, "[data-testid='job-search-card-location']")
-                    job_location = location_elem.text.strip()
-                    
-                    # Try to get posting date
-                    try:
-                        date_elem = card.find_element(By.CSS_SELECTOR, "time")
-                        date_posted = date_elem.get_attribute("datetime")
-                    except:
-                        date_posted = datetime.now().strftime('%Y-%m-%d')
-                    
-                    # Extract skills from title and description
-                    skills = self._extract_skills_from_text(title)
-                    
-                    jobs.append({
-                        'title': title,
-                        'company': company,
-                        'location': job_location,
-                        'skills': skills,
-                        'date_posted': date_posted,
-                        'source': 'LinkedIn',
-                        'salary': None,  # LinkedIn rarely shows salary in search
-                        'description': f"LinkedIn job posting for {title} at {company}",
-                        'job_type': 'Full-time',
-                        'url': job_url
-                    })
-                    
-                    # Add delay between extractions
-                    time.sleep(random.uniform(0.5, 1.0))
-                    
-                except Exception as e:
-                    print(f"   ⚠️ Error extracting job {i+1}: {e}")
-                    continue
-            
-        except TimeoutException:
-            print("   ⚠️ LinkedIn page load timeout, using fallback data")
-            return self._generate_mock_linkedin_data("skill", "", max_jobs)
+            for jobs in self._iter_pages(source, skill, location, max_jobs):
+                jobs = to_records(jobs)
+                if not found:
+                    breaker.record_success()
+                    settled = True
+                    self._count(name, first_page_seconds=time.perf_counter() - start)
+                found.extend(jobs)
+                self._count(name, pages=1, jobs=len(jobs))
+                self._observe(source, jobs)
+                self._store(self._flag_jobs(jobs, LIVE))
+                yield jobs
+            if not found:
+                # The source answered with no jobs: not a failure of the source
+                breaker.record_success()
+                settled = True
+        except Exception as e:
+            self._count(name, failed_pages=1)
+            if found:
+                print(f"   ⚠️ {name} result page failed: {e}")
+                print(f"   ✅ Found {len(found)} {name} jobs (some pages failed)")
+                self._store(self._flag_jobs(found, DEGRADED))
+                return
+            breaker.record_failure()
+            settled = True
+            print(f"   ❌ {name} scraping error: {e}")
+        finally:
+            self._count(name, seconds=time.perf_counter() - start)
+            if not settled:
+                # Closed or interrupted before any outcome: don't leave a trial half-open
+                breaker.release_trial()
         
-        return jobs
+        if not found:
+            self._count(name, mock_fallbacks=1)
+            print(f"   ⚠️ No {name} jobs found, using mock data")
+            yield self._flag_jobs(source.generate_mock(skill, location, max_jobs), MOCK)
+            return
+        
+        print(f"   ✅ Found {len(found)} {name} jobs")
     
-    def _scrape_linkedin_requests(self, url, max_jobs):
-        """Scrape LinkedIn using requests (limited functionality)"""
-        jobs = []
+    def _iter_pages(self, source, skill, location, max_jobs):
+        """Paginate a source with the browser pool or the HTTP engine"""
+        page_url = lambda page: source.search_url(skill, location, page)
+        print(f"   🌐 Accessing: {page_url(0)}")
         
-        try:
-            response = self.session.get(url)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # LinkedIn's structure changes frequently, this is a basic attempt
-                job_cards = soup.find_all('div', class_='job-search-card')
-                
-                for card in job_cards[:max_jobs]:
+        # Recorded, replayed and fixture runs only see HTTP traffic
+        offline = self.archive is not None or self.fixture_url
+        if source.uses_browser and not offline and self._get_driver_pool():
+            load_pages = self._browser_page_loader(source, page_url)
+            return self._iter_paginated(source, load_pages, max_jobs, self.driver_pool.size)
+        load_pages = self._http_page_loader(source, page_url, location)
+        return self._iter_paginated(source, load_pages, max_jobs)
+    
+    def _browser_page_loader(self, source, page_url):
+        """Build a page loader rendering result pages in parallel on the driver pool"""
+        def load_pages(pages):
+            executor = ThreadPoolExecutor(max_workers=self.driver_pool.size)
+            try:
+                futures = [executor.submit(self._render_page, source, page_url(page)) for page in pages]
+                for future in futures:
                     try:
-                        title_elem = card.find('h3')
-                        title = title_elem.get_text(strip=True) if title_elem else "Unknown Title"
-                        
-                        company_elem = card.find('h4')
-                        company = company_elem.get_text(strip=True) if company_elem else "Unknown Company"
-                        
-                        location_elem = card.find('span', class_='job-search-card__location')
-                        location = location_elem.get_text(strip=True) if location_elem else "Unknown Location"
-                        
-                        jobs.append({
-                            'title': title,
-                            'company': company,
-                            'location': location,
-                            'skills': self._extract_skills_from_text(title),
-                            'date_posted': datetime.now().strftime('%Y-%m-%d'),
-                            'source': 'LinkedIn',
-                            'salary': None,
-                            'description': f"LinkedIn job posting for {title}",
-                            'job_type': 'Full-time',
-                            'url': url
-                        })
-                        
+                        jobs = future.result()
                     except Exception as e:
-                        continue
-            
-        except Exception as e:
-            print(f"   ❌ LinkedIn requests error: {e}")
-        
-        # If no jobs found, use mock data
-        if not jobs:
-            jobs = self._generate_mock_linkedin_data("skill", "", max_jobs)
-        
+                        jobs = e
+                    yield jobs
+            finally:
+                # Pages nobody is waiting for any more are not rendered
+                executor.shutdown(wait=False, cancel_futures=True)
+        return load_pages
+    
+    def _render_page(self, source, url):
+        """Scrape a single result page with a pooled WebDriver"""
+        with self.driver_pool.driver() as driver:
+            self.rate_limiter.acquire_sync(url)
+            return source.scrape_rendered_page(driver, url, self.scroll_timeout, self.max_scrolls,
+                                               self.parser_backend, self.restrict_parsing)
+    
+    def _observe(self, source, jobs):
+        """Record scraped jobs in the seen-posting index"""
+        if self.seen_index is not None:
+            new = self.seen_index.observe(jobs)
+            self._count(source.name, new_postings=new, seen_postings=len(jobs) - new)
+    
+    def _store(self, jobs):
+        if self.job_store is not None:
+            self.job_store.add_jobs(jobs)
+    
+    def _flag_jobs(self, jobs, quality):
+        jobs = to_records(jobs)
+        for job in jobs:
+            job['data_quality'] = quality
         return jobs
     
-    def scrape_glassdoor(self, skill, location="", max_jobs=50):
-        """Scrape real jobs from Glassdoor"""
-        print(f"🔍 Scraping Glassdoor for '{skill}' jobs...")
-        jobs = []
+    def enrich_jobs(self, jobs, max_concurrency=None, reuse_details=True):
+        """Fetch each job's detail page and fill in description, salary and skills
         
+        A generator: every job is yielded once, as soon as its detail page has
+        been fetched and parsed (completion order, not input order). At most
+        max_concurrency detail pages are requested at a time, through the
+        shared response cache and rate limiter. Mock jobs and jobs without a
+        detail URL of their own (none, or only their search page) are
+        yielded first, unchanged; so are jobs whose detail page
+        could not be fetched. Postings enriched by an earlier search get their
+        stored details back without a fetch (unless reuse_details is False).
+        Enriched jobs are written back to the job store in batches.
+        """
+        enriched = []
         try:
-            # Glassdoor job search URL
-            base_url = "https://www.glassdoor.com/Job/jobs.htm"
-            url = f"{base_url}?sc.keyword={quote_plus(skill)}"
-            if location:
-                url += f"&locT=C&locId=1&locKeyword={quote_plus(location)}"
-            
-            print(f"   🌐 Accessing: {url}")
-            
-            # Add headers to avoid blocking
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            }
-            
-            response = self.session.get(url, headers=headers)
-            time.sleep(random.uniform(2, 4))
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for job listings with various possible selectors
-                job_selectors = [
-                    'li[data-test="jobListing"]',
-                    '.react-job-listing',
-                    '[data-test="job-listing"]',
-                    '.jobContainer'
-                ]
-                
-                job_listings = []
-                for selector in job_selectors:
-                    job_listings = soup.select(selector)
-                    if job_listings:
-                        break
-                
-                for listing in job_listings[:max_jobs]:
-                    try:
-                        # Extract job title
-                        title_selectors = ['[data-test="job-title"]', '.jobTitle', 'h2 a']
-                        title = self._extract_text_by_selectors(listing, title_selectors) or "Unknown Title"
-                        
-                        # Extract company name
-                        company_selectors = ['[data-test="employer-name"]', '.employerName', '.companyName']
-                        company = self._extract_text_by_selectors(listing, company_selectors) or "Unknown Company"
-                        
-                        # Extract location
-                        location_selectors = ['[data-test="job-location"]', '.location', '.jobLocation']
-                        job_location = self._extract_text_by_selectors(listing, location_selectors) or location
-                        
-                        # Extract salary if available
-                        salary_selectors = ['[data-test="detailSalary"]', '.salaryText', '.salary']
-                        salary = self._extract_text_by_selectors(listing, salary_selectors)
-                        
-                        # Extract job URL
-                        url_elem = listing.find('a')
-                        job_url = urljoin("https://www.glassdoor.com", url_elem.get('href')) if url_elem else url
-                        
-                        jobs.append({
-                            'title': title,
-                            'company': company,
-                            'location': job_location,
-                            'skills': self._extract_skills_from_text(title),
-                            'date_posted': datetime.now().strftime('%Y-%m-%d'),
-                            'source': 'Glassdoor',
-                            'salary': salary,
-                            'description': f"Glassdoor job posting for {title} at {company}",
-                            'job_type': 'Full-time',
-                            'url': job_url
-                        })
-                        
-                    except Exception as e:
-                        print(f"   ⚠️ Error extracting Glassdoor job: {e}")
-                        continue
-                
-                print(f"   ✅ Found {len(jobs)} Glassdoor jobs")
+            for job, updated in self._iter_enriched(jobs, max_concurrency, reuse_details):
+                if updated and self.job_store is not None:
+                    enriched.append(job)
+                    if len(enriched) >= self.job_store.batch_size:
+                        self._store(enriched)
+                        enriched = []
+                yield job
+        finally:
+            self._store(enriched)
+    
+    def _iter_enriched(self, jobs, max_concurrency, reuse_details):
+        """enrich_jobs() without the job store: yields (job, whether details were added)"""
+        max_concurrency = max_concurrency or self.detail_concurrency
+        waiting = deque()
+        for job in jobs:
+            source = self.sources.get(job.get('source'))
+            # A search page URL is not a detail link: its details would land on every job of the page
+            if (job.get('url') and job.get('data_quality') != MOCK and source and source.has_details
+                    and not source.is_search_url(job['url'])):
+                waiting.append(job)
             else:
-                print(f"   ❌ Glassdoor returned status code: {response.status_code}")
-                
-        except Exception as e:
-            print(f"   ❌ Glassdoor scraping error: {e}")
-        
-        # If no jobs found, use mock data
-        if not jobs:
-            jobs = self._generate_mock_glassdoor_data(skill, location, max_jobs)
+                if source:
+                    self._count(source.name, details_skipped=1)
+                yield job, False
         
-        return jobs
-    
-    def scrape_indeed(self, skill, location="", max_jobs=50):
-        """Scrape real jobs from Indeed"""
-        print(f"🔍 Scraping Indeed for '{skill}' jobs...")
-        jobs = []
+        if reuse_details and self.seen_index is not None and waiting:
+            stored = self.seen_index.known_details(job['posting_id'] for job in waiting
+                                                   if job.get('posting_id'))
+            if stored:
+                reused = [job for job in waiting if job.get('posting_id') in stored]
+                waiting = deque(job for job in waiting if job.get('posting_id') not in stored)
+                for job in reused:
+                    self._update_job(job, dict(stored[job['posting_id']]))
+                    self._count(job['source'], details_reused=1)
+                    yield job, True
         
-        try:
-            # Indeed job search URL
-            base_url = "https://www.indeed.com/jobs"
-            url = f"{base_url}?q={quote_plus(skill)}"
-            if location:
-                url += f"&l={quote_plus(location)}"
-            
-            print(f"   🌐 Accessing: {url}")
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-            }
+        fetching = {}  # fetch future -> job
+        parsing = {}   # parse future -> job
+        while waiting or fetching or parsing:
+            while waiting and len(fetching) < max_concurrency:
+                job = waiting.popleft()
+                fetching[self.http.submit(job['url'])] = job
             
-            response = self.session.get(url, headers=headers)
-            time.sleep(random.uniform(2, 4))
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for job cards
-                job_cards = soup.find_all('div', class_='job_seen_beacon') or soup.find_all('a', {'data-jk': True})
-                
-                for card in job_cards[:max_jobs]:
-                    try:
-                        # Extract job title
-                        title_elem = card.find('h2') or card.find('span', {'title': True})
-                        title = title_elem.get_text(strip=True) if title_elem else "Unknown Title"
-                        
-                        # Extract company
-                        company_elem = card.find('span', class_='companyName') or card.find('a', {'data-testid': 'company-name'})
-                        company = company_elem.get_text(strip=True) if company_elem else "Unknown Company"
-                        
-                        # Extract location
-                        location_elem = card.find('div', class_='companyLocation')
-                        job_location = location_elem.get_text(strip=True) if location_elem else location
-                        
-                        # Extract salary if available
-                        salary_elem = card.find('span', class_='salaryText')
-                        salary = salary_elem.get_text(strip=True) if salary_elem else None
-                        
-                        # Extract job URL
-                        link_elem = card.find('a')
-                        job_url = urljoin("https://www.indeed.com", link_elem.get('href')) if link_elem else url
-                        
-                        jobs.append({
-                            'title': title,
-                            'company': company,
-                            'location': job_location,
-                            'skills': self._extract_skills_from_text(title),
-                            'date_posted': datetime.now().strftime('%Y-%m-%d'),
-                            'source': 'Indeed',
-                            'salary': salary,
-                            'description': f"Indeed job posting for {title} at {company}",
-                            'job_type': 'Full-time',
-                            'url': job_url
-                        })
-                        
-                    except Exception as e:
-                        print(f"   ⚠️ Error extracting Indeed job: {e}")
+            done, _ = wait(list(fetching) + list(parsing), return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in fetching:
+                    job = fetching.pop(future)
+                    response = future.result()
+                    if response.status_code != 200:
+                        self._count(job['source'], details_failed=1)
+                        yield job, False
                         continue
+                    parse = self._submit_detail_parse(job, response.content)
+                    if isinstance(parse, Future):
+                        parsing[parse] = job
+                        continue
+                else:
+                    job = parsing.pop(future)
+                    parse = future
                 
-                print(f"   ✅ Found {len(jobs)} Indeed jobs")
-            else:
-                print(f"   ❌ Indeed returned status code: {response.status_code}")
-                
-        except Exception as e:
-            print(f"   ❌ Indeed scraping error: {e}")
+                yield job, self._apply_details(job, self._resolve_parse(parse))
+    
+    def _apply_details(self, job, fields):
+        """Merge the fields parsed from a job's detail page into the job; False if there were none"""
+        if isinstance(fields, Exception) or not fields:
+            self._count(job['source'], details_failed=1)
+            return False
+        if self.seen_index is not None and job.get('posting_id'):
+            self.seen_index.store_details(job['posting_id'], fields)
+        self._update_job(job, dict(fields))
+        self._count(job['source'], details_enriched=1)
+        return True
+    
+    def _update_job(self, job, fields):
+        # A salary already shown on the result card wins
+        if job.get('salary'):
+            fields.pop('salary', None)
+        job.update(fields)
+    
+    def _page_count(self, max_jobs, page_size):
+        """Number of result pages needed to collect max_jobs"""
+        return max(1, -(-max_jobs // page_size))
+    
+    def _new_jobs(self, source, page_jobs, seen, page):
+        """Give a page's jobs their posting ids and return those not seen on earlier pages"""
+        new_jobs = []
+        for index, job in enumerate(page_jobs):
+            job['posting_id'] = source.posting_id(job, (page, index))
+            if job['posting_id'] not in seen:
+                seen.add(job['posting_id'])
+                new_jobs.append(job)
+        return new_jobs
+    
+    def _http_page_loader(self, source, page_url, location=""):
+        """Build a page loader: fetch pages concurrently, then parse them in worker processes
         
-        # If no jobs found, use mock data
-        if not jobs:
-            jobs = self._generate_mock_indeed_data(skill, location, max_jobs)
+        Parses are submitted as fetches complete; pages are yielded in page
+        order, each as soon as it and the pages before it are parsed.
+        """
+        def load_pages(pages):
+            fetches = {self.http.submit(page_url(page)): i for i, page in enumerate(pages)}
+            parses = [None] * len(fetches)
+            next_page = 0
+            try:
+                for future in as_completed(fetches):
+                    parses[fetches[future]] = self._parse_response(source, future.result(), location)
+                    while next_page < len(parses) and parses[next_page] is not None:
+                        yield self._resolve_parse(parses[next_page])
+                        next_page += 1
+            finally:
+                # Pagination stopped early: drop the fetches nobody will read
+                for future in fetches:
+                    future.cancel()
+        return load_pages
+    
+    def _parse_response(self, source, response, location):
+        """Submit a fetched results page for parsing; fetch failures are returned as exceptions"""
+        if response.error:
+            return response.error
+        if response.status_code != 200:
+            return RuntimeError(f"{source.name} returned status code: {response.status_code}")
+        return self._submit_parse(source, response.content, response.url, location)
+    
+    def _resolve_parse(self, result):
+        """Wait for a parse, merge its selector statistics and return its result
         
+        Failures are returned like fetch errors.
+        """
+        if isinstance(result, Exception):
+            return result
+        try:
+            jobs, stats = result.result() if isinstance(result, Future) else result
+        except Exception as e:
+            return e
+        self.selector_stats.merge(stats)
         return jobs
     
-    def _extract_text_by_selectors(self, element, selectors):
-        """Try multiple CSS selectors to extract text"""
-        for selector in selectors:
-            try:
-                elem = element.select_one(selector)
-                if elem:
-                    return elem.get_text(strip=True)
-            except:
-                continue
-        return None
-    
-    def _extract_skills_from_text(self, text):
-        """Extract potential skills from job title or description"""
-        common_skills = [
-            'Python', 'JavaScript', 'Java', 'React', 'Node.js', 'Angular', 'Vue.js',
-            'AWS', 'Docker', 'Kubernetes', 'Git', 'SQL', 'MongoDB', 'PostgreSQL',
-            'Machine Learning', 'Data Science', 'DevOps', 'CI/CD', 'Agile', 'Scrum',
-            'HTML', 'CSS', 'TypeScript', 'C++', 'C#', '.NET', 'Spring', 'Django',
-            'Flask', 'Redis', 'Elasticsearch', 'GraphQL', 'REST API', 'Microservices'
-        ]
-        
-        found_skills = []
-        text_lower = text.lower()
+    def _get_parse_executor(self):
+        """Return the process pool used for parsing, creating it on first use"""
+        with self._parse_lock:
+            if self._parse_executor is None and self.parse_workers != 0:
+                # spawn: forking a process that runs the HTTP engine thread is unsafe
+                self._parse_executor = ProcessPoolExecutor(
+                    max_workers=self.parse_workers or os.cpu_count(),
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._parse_executor
+    
+    def _submit_parse(self, source, html, page_url, location):
+        """Parse a page off the GIL; returns a future, or the jobs if parsing inline"""
+        return self._submit_to_parse_pool(parse_source_page, source, html, page_url, location,
+                                          self.parser_backend, self.restrict_parsing)
+    
+    def _submit_detail_parse(self, job, html):
+        """Parse a job detail page off the GIL; returns a future, or the fields if parsing inline"""
+        return self._submit_to_parse_pool(parse_source_detail, self.sources[job['source']], html,
+                                          job['title'], self.parser_backend, self.restrict_parsing)
+    
+    def _submit_to_parse_pool(self, parse, *args):
+        """Run parse(*args) in the process pool, falling back to parsing inline
         
-        for skill in common_skills:
-            if skill.lower() in text_lower and skill not in found_skills:
-                found_skills.append(skill)
+        An inline parse that fails returns its exception, as a pool future would.
+        """
+        executor = self._get_parse_executor()
+        if executor is not None:
+            try:
+                return executor.submit(parse, *args)
+            except (BrokenProcessPool, RuntimeError) as e:
+                print(f"   ⚠️ Parse worker pool unavailable ({e}), parsing inline")
+                with self._parse_lock:
+                    self._parse_executor = None
+                    self.parse_workers = 0
+        try:
+            return parse(*args)
+        except Exception as e:
+            return e
+    
+    def _iter_paginated(self, source, load_pages, max_jobs, wave_size=None):
+        """Load result pages in parallel waves, yielding each page's new jobs
         
-        return found_skills[:5]  # Limit to 5 skills
-    
-    def _generate_mock_linkedin_data(self, skill, location, max_jobs):
-        """Generate mock LinkedIn data for demonstration"""
-        companies = ["Microsoft", "Google", "Amazon", "Meta", "Apple", "Netflix", "Uber", "Airbnb", "Spotify", "Tesla"]
-        job_titles = [
-            f"{skill} Developer", f"Senior {skill} Engineer", f"{skill} Specialist",
-            f"Lead {skill} Developer", f"{skill} Consultant", "Full Stack Developer",
-            "Software Engineer", "Data Scientist", "DevOps Engineer", "Product Manager"
-        ]
-        locations = [location] if location else ["New York, NY", "San Francisco, CA", "Seattle, WA", "Austin, TX", "Boston, MA", "Remote"]
+        load_pages(page_numbers) yields one job list (or exception) per page,
+        in page order. Pages are requested wave_size at a time; pagination
+        stops at the first empty or fully duplicated page, or once max_jobs
+        have been yielded. The error of the first failed page is raised.
+        """
+        seen = set()
+        count = 0
+        total_pages = self._page_count(max_jobs, source.page_size)
+        wave_size = wave_size or self.max_parallel_pages
+        page = 0
         
-        jobs = []
-        for i in range(min(max_jobs, random.randint(15, 25))):
-            jobs.append({
-                'title': random.choice(job_titles),
-                'company': random.choice(companies),
-                'location': random.choice(locations),
-                'skills': [skill] + random.sample(['JavaScript', 'Python', 'React', 'AWS', 'Docker'], 2),
-                'date_posted': (datetime.now() - timedelta(days=random.randint(1, 30))).strftime('%Y-%m-%d'),
-                'source': 'LinkedIn',
-                'salary': f"${random.randint(80, 150)}k - ${random.randint(120, 200)}k" if random.random() > 0.7 else None,
-                'description': f"We are looking for a skilled {skill} professional to join our team at {random.choice(companies)}...",
-                'job_type': random.choice(['Full-time', 'Contract', 'Remote']),
-                'url': f"https://linkedin.com/jobs/view/{random.randint(1000000, 9999999)}"
-            })
-        return jobs
+        while page < total_pages:
+            wave = range(page, min(page + wave_size, total_pages))
+            page += len(wave)
+            
+            for page_number, page_jobs in enumerate(load_pages(wave), wave.start):
+                if isinstance(page_jobs, Exception):
+                    raise page_jobs
+                
+                new_jobs = self._new_jobs(source, page_jobs, seen, page_number)[:max_jobs - count]
+                if not new_jobs:
+                    return
+                
+                count += len(new_jobs)
+                yield new_jobs
+                if count >= max_jobs:
+                    return
     
-    def _generate_mock_glassdoor_data(self, skill, location, max_jobs):
-        """Generate mock Glassdoor data for demonstration"""
-        companies = ["Salesforce", "Oracle", "IBM", "Intel", "Cisco", "Adobe", "VMware", "Slack", "Zoom", "Dropbox"]
-        job_titles = [
-            f"{skill} Engineer", f"Senior {skill} Developer", f"{skill} Architect",
-            f"Principal {skill} Engineer", f"{skill} Team Lead", "Backend Developer",
-            "Frontend Developer", "Technical Lead", "Staff Engineer"
-        ]
-        locations = [location] if location else ["Chicago, IL", "Los Angeles, CA", "Denver, CO", "Atlanta, GA", "Remote"]
-        
-        jobs = []
-        for i in range(min(max_jobs, random.randint(12, 20))):
-            jobs.append({
-                'title': random.choice(job_titles),
-                'company': random.choice(companies),
-                'location': random.choice(locations),
-                'skills': [skill] + random.sample(['TypeScript', 'Java', 'Docker', 'Kubernetes'], 2),
-                'date_posted': (datetime.now() - timedelta(days=random.randint(1, 30))).strftime('%Y-%m-%d'),
-                'source': 'Glassdoor',
-                'salary': f"${random.randint(70, 140)}k - ${random.randint(110, 180)}k" if random.random() > 0.5 else None,
-                'description': f"Join our innovative team working with {skill} technology at {random.choice(companies)}...",
-                'job_type': random.choice(['Full-time', 'Contract', 'Remote', 'Hybrid']),
-                'url': f"https://glassdoor.com/job-listing/{random.randint(1000000, 9999999)}"
-            })
-        return jobs
+    def _new_source_stats(self):
+        return {'searches': 0, 'pages': 0, 'jobs': 0, 'failed_pages': 0, 'mock_fallbacks': 0,
+                'circuit_open': 0, 'seconds': 0.0, 'first_page_seconds': 0.0,
+                'details_enriched': 0, 'details_failed': 0, 'details_skipped': 0,
+                'details_reused': 0, 'new_postings': 0, 'seen_postings': 0}
     
-    def _generate_mock_indeed_data(self, skill, location, max_jobs):
-        """Generate mock Indeed data for demonstration"""
-        companies = ["Accenture", "Deloitte", "PwC", "EY", "KPMG", "Capgemini", "TCS", "Infosys", "Wipro", "Cognizant"]
-        job_titles = [
-            f"{skill} Developer", f"Senior {skill} Programmer", f"{skill} Analyst",
-            f"Junior {skill} Developer", f"{skill} Contractor", "Software Developer",
-            "Application Developer", "Systems Analyst", "IT Specialist"
-        ]
-        locations = [location] if location else ["Dallas, TX", "Phoenix, AZ", "Philadelphia, PA", "Houston, TX", "Remote"]
-        
-        jobs = []
-        for i in range(min(max_jobs, random.randint(10, 18))):
-            jobs.append({
-                'title': random.choice(job_titles),
-                'company': random.choice(companies),
-                'location': random.choice(locations),
-                'skills': [skill] + random.sample(['SQL', 'Git', 'Linux', 'Agile'], 2),
-                'date_posted': (datetime.now() - timedelta(days=random.randint(1, 30))).strftime('%Y-%m-%d'),
-                'source': 'Indeed',
-                'salary': f"${random.randint(60, 120)}k" if random.random() > 0.6 else None,
-                'description': f"We are seeking a {skill} professional to work on exciting projects at {random.choice(companies)}...",
-                'job_type': random.choice(['Full-time', 'Part-time', 'Contract']),
-                'url': f"https://indeed.com/viewjob?jk={random.randint(100000000, 999999999)}"
-            })
-        return jobs
+    def _count(self, name, **increments):
+        """Add to a source's performance counters"""
+        with self._stats_lock:
+            stats = self.source_stats[name]
+            for counter, amount in increments.items():
+                stats[counter] += amount
+    
+    def performance_stats(self):
+        """Per-source, cache and parser statistics for reporting"""
+        with self._stats_lock:
+            sources = {}
+            for name, counters in self.source_stats.items():
+                searches = max(counters['searches'], 1)
+                sources[name] = dict(counters,
+                                     seconds=round(counters['seconds'], 3),
+                                     avg_first_page_seconds=round(counters['first_page_seconds'] / searches, 3),
+                                     circuit=self.circuit_breakers[name].snapshot())
+                del sources[name]['first_page_seconds']
+        stats = {
+            'sources': sources,
+            'selectors': self.selector_stats.fields,
+            'rate_limiter': dict(self.rate_limiter.stats, rates=self.rate_limiter.current_rates()),
+        }
+        if self.response_cache:
+            stats['http_cache'] = dict(self.response_cache.stats,
+                                       hit_rate=round(self.response_cache.hit_rate(), 3))
+        if self.archive is not None:
+            stats['archive'] = dict(self.archive.stats, mode=self.archive.mode)
+        if self.seen_index is not None:
+            stats['seen_index'] = dict(self.seen_index.stats)
+        if self.job_store is not None:
+            stats['job_store'] = dict(self.job_store.stats, seconds=round(self.job_store.stats['seconds'], 3))
+        return stats
     
     def close(self):
-        """Close the WebDriver"""
-        if self.driver:
-            self.driver.quit()
+        """Close the WebDriver pool, parse workers, pooled HTTP connections and caches"""
+        self.http.close()
+        if self.response_cache:
+            self.response_cache.close()
+        if self.archive is not None:
+            self.archive.close()
+        if self.seen_index is not None:
+            self.seen_index.close()
+        if self.job_store is not None:
+            self.job_store.close()
+        with self._parse_lock:
+            if self._parse_executor is not None:
+                self._parse_executor.shutdown()
+                self._parse_executor = None
+        with self._selenium_lock:
+            # Wait for a background warm-up to finish so its drivers get closed
+            self._selenium_checked = True
+        if self.driver_pool:
+            self.driver_pool.close()
             print("🔒 WebDriver closed")
 
 # Example usage
@@ -495,16 +626,15 @@ if __name__ == "__main__":
     scraper = RealJobScraper()
     
     try:
-        # Test scraping
-        linkedin_jobs = scraper.scrape_linkedin("Python", "New York", 10)
-        glassdoor_jobs = scraper.scrape_glassdoor("Python", "New York", 10)
-        indeed_jobs = scraper.scrape_indeed("Python", "New York", 10)
-        
-        total_jobs = len(linkedin_jobs) + len(glassdoor_jobs) + len(indeed_jobs)
+        # Test scraping (all sources run concurrently)
+        counts = {}
+        total_jobs = len(scraper.scrape_sources(
+            "Python", "New York", 10,
+            on_source_done=lambda source, jobs: counts.update({source: len(jobs)})
+        ))
         print(f"\n📊 Total jobs found: {total_jobs}")
-        print(f"   LinkedIn: {len(linkedin_jobs)}")
-        print(f"   Glassdoor: {len(glassdoor_jobs)}")
-        print(f"   Indeed: {len(indeed_jobs)}")
+        for source, count in counts.items():
+            print(f"   {source}: {count}")
         
     finally:
         scraper.close()
\ No newline at end of file
@@ -0,0 +1,194 @@
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+
+from job_records import CATEGORICAL_FIELDS, TEXT_FIELDS, Categorical, JobTable, MISSING
+
+MAGIC = b'JOBSNAP1'
+# Arrays start on 64-byte boundaries so every memory-mapped view is aligned
+ALIGNMENT = 64
+
+
+class StringColumn:
+    """Read-only strings stored as one UTF-8 buffer plus int64 offsets
+
+    String i is data[offsets[i]:offsets[i + 1]], decoded on access; rows
+    whose `valid` flag is 0 read as `missing`. With `decode`, each string is
+    passed through it (e.g. json.loads for extra fields).
+    """
+
+    def __init__(self, data, offsets, valid=None, missing=None, decode=None):
+        self.data = data
+        self.offsets = offsets
+        self.valid = valid
+        self.missing = missing
+        self.decode = decode
+        self._bytes = memoryview(data)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            if index < 0:
+                index += len(self)
+            if self.valid is not None and not self.valid[index]:
+                return self.missing
+            value = str(self._bytes[self.offsets[index]:self.offsets[index + 1]], 'utf-8')
+            return self.decode(value) if self.decode else value
+        rows = np.arange(len(self))[index]
+        values = np.empty(len(rows), dtype=object)
+        values[:] = [self[row] for row in rows.tolist()]
+        return values
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes + self.offsets.nbytes + (self.valid.nbytes if self.valid is not None else 0)
+
+
+def _encode_strings(values, missing=None, encode=None):
+    """(data, offsets, valid or None) arrays for a sequence of strings"""
+    values = list(values)
+    valid = np.fromiter((value is not missing for value in values), dtype=np.uint8, count=len(values))
+    encoded = [b'' if value is missing else (encode(value) if encode else str(value)).encode('utf-8')
+               for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+    data = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    return data, offsets, (None if valid.all() else valid)
+
+
+def save_snapshot(path, jobs, trends_data=None):
+    """Write jobs (a JobTable or any job dicts) and their trends_data to a snapshot file
+
+    Every column is a fixed-width array: categorical fields as int32 codes
+    with their string dictionaries, skills as int32 codes with offsets,
+    text and extra fields (JSON-encoded) as UTF-8 buffers with offsets.
+    The file is written next to `path` and then moved into place.
+    """
+    if not isinstance(jobs, JobTable) or jobs._skill_overrides:
+        jobs = JobTable.from_jobs(jobs)
+
+    arrays = {}
+    columns = {'categorical': {}, 'text': {}, 'extras': {}}
+
+    def add_strings(name, values, missing=None, encode=None):
+        data, offsets, valid = _encode_strings(values, missing, encode)
+        arrays[f'{name}.data'], arrays[f'{name}.offsets'] = data, offsets
+        if valid is not None:
+            arrays[f'{name}.valid'] = valid
+        return name
+
+    for field in CATEGORICAL_FIELDS:
+        codes, categories = jobs.codes(field)
+        arrays[f'{field}.codes'] = np.ascontiguousarray(codes, dtype=np.int32)
+        columns['categorical'][field] = add_strings(f'{field}.categories', categories)
+    for field in TEXT_FIELDS:
+        columns['text'][field] = add_strings(field, jobs._text[field])
+    for field, column in jobs._extras.items():
+        columns['extras'][field] = add_strings(f'extra.{field}', column, MISSING, json.dumps)
+    arrays['skills.codes'] = np.ascontiguousarray(jobs.skills, dtype=np.int32)
+    arrays['skills.offsets'] = np.ascontiguousarray(jobs.skill_offsets, dtype=np.int64)
+    columns['skills'] = add_strings('skills.categories', jobs.skill_categories.categories)
+
+    layout, offset = {}, 0
+    for name, array in arrays.items():
+        layout[name] = {'dtype': array.dtype.str, 'offset': offset, 'length': len(array)}
+        offset += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+
+    header = json.dumps({
+        'version': 1,
+        'count': len(jobs),
+        'created': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'columns': columns,
+        'arrays': layout,
+        'trends': trends_data or {},
+    }, default=str).encode('utf-8')
+    data_start = -(-(len(MAGIC) + 8 + len(header)) // ALIGNMENT) * ALIGNMENT
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(len(header).to_bytes(8, 'little'))
+        f.write(header)
+        for name, array in arrays.items():
+            f.seek(data_start + layout[name]['offset'])
+            f.write(array.tobytes())
+        f.truncate(data_start + offset)
+    os.replace(temp_path, path)
+    return len(jobs)
+
+
+def open_snapshot(path):
+    """Memory-map a snapshot; returns (JobTable, trends_data)
+
+    Nothing is read up front but the header: columns are views into the
+    mapped file and strings are decoded when accessed. The mapping is
+    copy-on-write, so the returned table can be edited without touching
+    the file.
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a job snapshot")
+        header_size = int.from_bytes(f.read(8), 'little')
+        header = json.loads(f.read(header_size))
+    data_start = -(-(len(MAGIC) + 8 + header_size) // ALIGNMENT) * ALIGNMENT
+
+    mapped = np.memmap(path, dtype=np.uint8, mode='c')
+    layout = header['arrays']
+
+    def array(name):
+        spec = layout[name]
+        dtype = np.dtype(spec['dtype'])
+        start = data_start + spec['offset']
+        return mapped[start:start + spec['length'] * dtype.itemsize].view(dtype)
+
+    def strings(name, missing=None, decode=None):
+        valid = array(f'{name}.valid') if f'{name}.valid' in layout else None
+        return StringColumn(array(f'{name}.data'), array(f'{name}.offsets'), valid, missing, decode)
+
+    columns = header['columns']
+    categorical = columns['categorical']
+    table = JobTable(
+        {field: array(f'{field}.codes') for field in categorical},
+        {field: Categorical(strings(name)) for field, name in categorical.items()},
+        {field: strings(name) for field, name in columns['text'].items()},
+        array('skills.codes'),
+        array('skills.offsets'),
+        Categorical(strings(columns['skills'])),
+        {field: strings(name, MISSING, json.loads) for field, name in columns['extras'].items()},
+    )
+    return table, header['trends']
+
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    from synthetic_data import SyntheticJobGenerator
+
+    count = 1_000_000
+    start = time.perf_counter()
+    jobs = JobTable.from_synthetic(SyntheticJobGenerator(seed=0).columns(count))
+    print(f"🧪 Generated {count:,} jobs in {time.perf_counter() - start:.1f}s")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'jobs.snapshot')
+        start = time.perf_counter()
+        save_snapshot(path, jobs, {'total_jobs': count})
+        print(f"💾 Saved {os.path.getsize(path) / 1024 / 1024:.0f} MB in {time.perf_counter() - start:.1f}s")
+
+        start = time.perf_counter()
+        table, trends = open_snapshot(path)
+        opened = time.perf_counter() - start
+        top_sources = table.value_counts('source')
+        print(f"📂 Opened {len(table):,} jobs in {opened * 1000:.1f} ms; sources {top_sources}")
+        print(f"   Job #{count // 2:,}: {table[count // 2]['title']} at {table[count // 2]['company']}")
+        del table
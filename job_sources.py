@@ -0,0 +1,328 @@
+import random
+import re
+from datetime import datetime, timedelta
+from urllib.parse import parse_qs, quote_plus, urlsplit
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from job_parsers import (
+    DETAIL_STRAINERS, LINKEDIN_CARD_SELECTOR, SELECTOR_CACHE, linkedin_card_to_job,
+    parse_detail_page, parse_glassdoor_page, parse_indeed_page, parse_linkedin_page,
+    parse_linkedin_rendered_cards
+)
+from response_cache import normalize_url
+
+# Collects the fields of every rendered LinkedIn job card in one round-trip
+LINKEDIN_CARDS_SCRIPT = """
+return Array.from(document.querySelectorAll(arguments[0])).map(card => {
+    const text = selector => {
+        const elem = card.querySelector(selector);
+        return elem ? elem.innerText.trim() : null;
+    };
+    const link = card.querySelector("h3 a");
+    const time = card.querySelector("time");
+    return {
+        title: link ? link.innerText.trim() : null,
+        url: link ? link.href : null,
+        company: text("h4 a"),
+        location: text("[data-testid='job-search-card-location']"),
+        date_posted: time ? time.getAttribute("datetime") : null
+    };
+});
+"""
+
+
+class JobSource:
+    """A job board RealJobScraper can search
+
+    Subclasses describe how to build search URLs and parse the board's
+    pages; the scraper supplies fetching, caching, rate limiting, retries,
+    circuit breaking and process-pool parsing to every registered source.
+    Sources are pickled into the parse worker processes, so keep instance
+    state small and define subclasses at module level.
+    """
+
+    name = None
+    # Host searched, with its politeness ceiling as (requests/sec, burst)
+    host = None
+    rate_limit = (1.0, 3)
+    # Jobs per search result page (used to compute page offsets)
+    page_size = 25
+    # Whether result pages are better rendered by a browser when one is available
+    uses_browser = False
+
+    def search_url(self, skill, location, page):
+        """URL of a search result page (page numbers start at 0)"""
+        raise NotImplementedError
+
+    def parse_page(self, html, page_url, location='', backend=None, restrict=True):
+        """Parse a search result page into job dicts"""
+        raise NotImplementedError
+
+    @property
+    def has_details(self):
+        return self.name in DETAIL_STRAINERS
+
+    def parse_detail(self, html, title='', backend=None, restrict=True):
+        """Parse a job detail page into the fields it fills in (see job_parsers.parse_detail_page)"""
+        return parse_detail_page(self.name, html, title, backend, restrict)
+
+    def posting_id(self, job, card=None):
+        """Stable id of a posting across searches (see seen_index.SeenIndex)
+
+        The board's own job id where the URL carries one, else the
+        canonical URL. Jobs without a posting URL of their own (none, or
+        the search page they were listed on) fall back to title, company
+        and location plus `card`, the (page, index) they were listed at:
+        cards whose fields could not be read all look alike, so only
+        their position tells them apart.
+        """
+        url = job.get('url')
+        if url and not self.is_search_url(url):
+            board_id = self._board_id(url)
+            return f"{self.name}:{board_id}" if board_id else normalize_url(url)
+        posting = f"{self.name}:{job.get('title')}|{job.get('company')}|{job.get('location')}"
+        return f"{posting}#{card[0]}.{card[1]}" if card else posting
+
+    def is_search_url(self, url):
+        """Whether a URL is one of this source's search result pages rather than a posting"""
+        search = urlsplit(self.search_url('', '', 0))
+        parts = urlsplit(url)
+        return parts.hostname == search.hostname and parts.path == search.path
+
+    def _board_id(self, url):
+        """The board's job id in a posting URL, or None"""
+        return None
+
+    def generate_mock(self, skill, location, max_jobs):
+        """Demonstration data used when the source cannot be scraped"""
+        return []
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name}>"
+
+
+_REGISTRY = {}
+
+
+def register_source(source_class):
+    """Class decorator adding a JobSource to the registry"""
+    source = source_class()
+    _REGISTRY[source.name] = source
+    return source_class
+
+
+def get_source(name):
+    return _REGISTRY[name]
+
+
+def available_sources():
+    """Names of the registered sources, in registration order"""
+    return list(_REGISTRY)
+
+
+def parse_source_page(source, html, page_url, location='', backend=None, restrict=True):
+    """Parse a result page and return (jobs, selector statistics) (process-pool entry point)"""
+    jobs = source.parse_page(html, page_url, location, backend, restrict)
+    return jobs, SELECTOR_CACHE.drain_stats()
+
+
+def parse_source_detail(source, html, title='', backend=None, restrict=True):
+    """Parse a detail page and return (fields, selector statistics) (process-pool entry point)"""
+    fields = source.parse_detail(html, title, backend, restrict)
+    return fields, SELECTOR_CACHE.drain_stats()
+
+
+@register_source
+class LinkedInSource(JobSource):
+    name = 'LinkedIn'
+    host = 'www.linkedin.com'
+    rate_limit = (1.0, 3)
+    page_size = 25
+    uses_browser = True
+
+    def search_url(self, skill, location, page):
+        url = f"https://www.linkedin.com/jobs/search?keywords={quote_plus(skill)}"
+        if location:
+            url += f"&location={quote_plus(location)}"
+        if page:
+            url += f"&start={page * self.page_size}"
+        return url
+
+    def parse_page(self, html, page_url, location='', backend=None, restrict=True):
+        return parse_linkedin_page(html, page_url, location, backend, restrict)
+
+    def _board_id(self, url):
+        # /jobs/view/1234567 or /jobs/view/python-developer-at-acme-1234567
+        match = re.search(r'/jobs/view/(?:[^/?]*-)?(\d+)', url)
+        return match.group(1) if match else None
+
+    def scrape_rendered_page(self, driver, url, scroll_timeout=2.0, max_scrolls=10,
+                             backend=None, restrict=True):
+        """Load a result page in a WebDriver and extract its job cards"""
+        driver.get(url)
+
+        # Wait for job cards to load
+        WebDriverWait(driver, 10, poll_frequency=0.2).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, LINKEDIN_CARD_SELECTOR))
+        )
+
+        # Scroll to load more jobs until the card count stops growing
+        card_count = self._card_count(driver)
+        for _ in range(max_scrolls):
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            try:
+                WebDriverWait(driver, scroll_timeout, poll_frequency=0.2).until(
+                    lambda d: self._card_count(d) > card_count
+                )
+            except TimeoutException:
+                break
+            card_count = self._card_count(driver)
+
+        # Pull every card's fields in one script execution instead of
+        # several WebDriver round-trips per card
+        try:
+            cards = driver.execute_script(LINKEDIN_CARDS_SCRIPT, LINKEDIN_CARD_SELECTOR) or []
+        except WebDriverException as e:
+            print(f"   ⚠️ Bulk card extraction failed ({e.msg}), parsing page source instead")
+            cards = parse_linkedin_rendered_cards(driver.page_source, backend, restrict)
+
+        jobs = []
+        for i, card in enumerate(cards):
+            if not (card.get('title') and card.get('company') and card.get('location')):
+                print(f"   ⚠️ Error extracting job {i+1}: incomplete job card")
+                continue
+            jobs.append(linkedin_card_to_job(card))
+
+        return jobs
+
+    def _card_count(self, driver):
+        """Number of job cards currently rendered"""
+        return driver.execute_script(
+            "return document.querySelectorAll(arguments[0]).length;", LINKEDIN_CARD_SELECTOR
+        )
+
+    def generate_mock(self, skill, location, max_jobs):
+        """Generate mock LinkedIn data for demonstration"""
+        companies = ["Microsoft", "Google", "Amazon", "Meta", "Apple", "Netflix", "Uber", "Airbnb", "Spotify", "Tesla"]
+        job_titles = [
+            f"{skill} Developer", f"Senior {skill} Engineer", f"{skill} Specialist",
+            f"Lead {skill} Developer", f"{skill} Consultant", "Full Stack Developer",
+            "Software Engineer", "Data Scientist", "DevOps Engineer", "Product Manager"
+        ]
+        locations = [location] if location else ["New York, NY", "San Francisco, CA", "Seattle, WA", "Austin, TX", "Boston, MA", "Remote"]
+
+        jobs = []
+        for i in range(min(max_jobs, random.randint(15, 25))):
+            jobs.append({
+                'title': random.choice(job_titles),
+                'company': random.choice(companies),
+                'location': random.choice(locations),
+                'skills': [skill] + random.sample(['JavaScript', 'Python', 'React', 'AWS', 'Docker'], 2),
+                'date_posted': (datetime.now() - timedelta(days=random.randint(1, 30))).strftime('%Y-%m-%d'),
+                'source': 'LinkedIn',
+                'salary': f"${random.randint(80, 150)}k - ${random.randint(120, 200)}k" if random.random() > 0.7 else None,
+                'description': f"We are looking for a skilled {skill} professional to join our team at {random.choice(companies)}...",
+                'job_type': random.choice(['Full-time', 'Contract', 'Remote']),
+                'url': f"https://linkedin.com/jobs/view/{random.randint(1000000, 9999999)}"
+            })
+        return jobs
+
+
+@register_source
+class GlassdoorSource(JobSource):
+    name = 'Glassdoor'
+    host = 'www.glassdoor.com'
+    rate_limit = (1.0, 3)
+    page_size = 30
+
+    def search_url(self, skill, location, page):
+        url = f"https://www.glassdoor.com/Job/jobs.htm?sc.keyword={quote_plus(skill)}"
+        if location:
+            url += f"&locT=C&locId=1&locKeyword={quote_plus(location)}"
+        if page:
+            url += f"&p={page + 1}"
+        return url
+
+    def parse_page(self, html, page_url, location='', backend=None, restrict=True):
+        return parse_glassdoor_page(html, page_url, location, backend, restrict)
+
+    def _board_id(self, url):
+        # ...-JV_IC1132348_KO0,16_KE17,23.htm?jl=1009123456789
+        return parse_qs(urlsplit(url).query).get('jl', [None])[0]
+
+    def generate_mock(self, skill, location, max_jobs):
+        """Generate mock Glassdoor data for demonstration"""
+        companies = ["Salesforce", "Oracle", "IBM", "Intel", "Cisco", "Adobe", "VMware", "Slack", "Zoom", "Dropbox"]
+        job_titles = [
+            f"{skill} Engineer", f"Senior {skill} Developer", f"{skill} Architect",
+            f"Principal {skill} Engineer", f"{skill} Team Lead", "Backend Developer",
+            "Frontend Developer", "Technical Lead", "Staff Engineer"
+        ]
+        locations = [location] if location else ["Chicago, IL", "Los Angeles, CA", "Denver, CO", "Atlanta, GA", "Remote"]
+
+        jobs = []
+        for i in range(min(max_jobs, random.randint(12, 20))):
+            jobs.append({
+                'title': random.choice(job_titles),
+                'company': random.choice(companies),
+                'location': random.choice(locations),
+                'skills': [skill] + random.sample(['TypeScript', 'Java', 'Docker', 'Kubernetes'], 2),
+                'date_posted': (datetime.now() - timedelta(days=random.randint(1, 30))).strftime('%Y-%m-%d'),
+                'source': 'Glassdoor',
+                'salary': f"${random.randint(70, 140)}k - ${random.randint(110, 180)}k" if random.random() > 0.5 else None,
+                'description': f"Join our innovative team working with {skill} technology at {random.choice(companies)}...",
+                'job_type': random.choice(['Full-time', 'Contract', 'Remote', 'Hybrid']),
+                'url': f"https://glassdoor.com/job-listing/{random.randint(1000000, 9999999)}"
+            })
+        return jobs
+
+
+@register_source
+class IndeedSource(JobSource):
+    name = 'Indeed'
+    host = 'www.indeed.com'
+    rate_limit = (2.0, 5)
+    page_size = 10
+
+    def search_url(self, skill, location, page):
+        url = f"https://www.indeed.com/jobs?q={quote_plus(skill)}"
+        if location:
+            url += f"&l={quote_plus(location)}"
+        if page:
+            url += f"&start={page * self.page_size}"
+        return url
+
+    def parse_page(self, html, page_url, location='', backend=None, restrict=True):
+        return parse_indeed_page(html, page_url, location, backend, restrict)
+
+    def _board_id(self, url):
+        # /viewjob?jk=4f3c2b1a0e9d8c7b or /rc/clk?jk=...
+        return parse_qs(urlsplit(url).query).get('jk', [None])[0]
+
+    def generate_mock(self, skill, location, max_jobs):
+        """Generate mock Indeed data for demonstration"""
+        companies = ["Accenture", "Deloitte", "PwC", "EY", "KPMG", "Capgemini", "TCS", "Infosys", "Wipro", "Cognizant"]
+        job_titles = [
+            f"{skill} Developer", f"Senior {skill} Programmer", f"{skill} Analyst",
+            f"Junior {skill} Developer", f"{skill} Contractor", "Software Developer",
+            "Application Developer", "Systems Analyst", "IT Specialist"
+        ]
+        locations = [location] if location else ["Dallas, TX", "Phoenix, AZ", "Philadelphia, PA", "Houston, TX", "Remote"]
+
+        jobs = []
+        for i in range(min(max_jobs, random.randint(10, 18))):
+            jobs.append({
+                'title': random.choice(job_titles),
+                'company': random.choice(companies),
+                'location': random.choice(locations),
+                'skills': [skill] + random.sample(['SQL', 'Git', 'Linux', 'Agile'], 2),
+                'date_posted': (datetime.now() - timedelta(days=random.randint(1, 30))).strftime('%Y-%m-%d'),
+                'source': 'Indeed',
+                'salary': f"${random.randint(60, 120)}k" if random.random() > 0.6 else None,
+                'description': f"We are seeking a {skill} professional to work on exciting projects at {random.choice(companies)}...",
+                'job_type': random.choice(['Full-time', 'Part-time', 'Contract']),
+                'url': f"https://indeed.com/viewjob?jk={random.randint(100000000, 999999999)}"
+            })
+        return jobs
@@ -0,0 +1,301 @@
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+from job_records import JobRecord
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS companies (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS locations (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS sources (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS skills (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    posting_id TEXT NOT NULL UNIQUE,
+    title TEXT,
+    company_id INTEGER REFERENCES companies(id),
+    location_id INTEGER REFERENCES locations(id),
+    source_id INTEGER REFERENCES sources(id),
+    job_type TEXT,
+    salary TEXT,
+    date_posted TEXT,
+    description TEXT,
+    url TEXT,
+    data_quality TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_skills (
+    job_id INTEGER NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+    skill_id INTEGER NOT NULL REFERENCES skills(id),
+    PRIMARY KEY (job_id, skill_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS job_skills_skill ON job_skills (skill_id, job_id);
+CREATE INDEX IF NOT EXISTS jobs_company ON jobs (company_id);
+CREATE INDEX IF NOT EXISTS jobs_location ON jobs (location_id);
+CREATE INDEX IF NOT EXISTS jobs_source ON jobs (source_id);
+CREATE INDEX IF NOT EXISTS jobs_date_posted ON jobs (date_posted);
+CREATE INDEX IF NOT EXISTS jobs_last_seen ON jobs (last_seen);
+"""
+
+# Job fields stored in a lookup table: field -> (table, jobs column)
+DIMENSIONS = {
+    'company': ('companies', 'company_id'),
+    'location': ('locations', 'location_id'),
+    'source': ('sources', 'source_id'),
+}
+# Fields count_by() can group on
+GROUP_FIELDS = ('title', 'company', 'location', 'source', 'job_type', 'date_posted', 'data_quality')
+
+_UPSERT = """
+INSERT INTO jobs (posting_id, title, company_id, location_id, source_id, job_type, salary,
+                  date_posted, description, url, data_quality, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(posting_id) DO UPDATE SET
+    title = excluded.title, company_id = excluded.company_id, location_id = excluded.location_id,
+    source_id = excluded.source_id, job_type = excluded.job_type,
+    salary = COALESCE(excluded.salary, salary), date_posted = excluded.date_posted,
+    description = excluded.description, url = excluded.url, data_quality = excluded.data_quality,
+    last_seen = excluded.last_seen
+"""
+
+
+def posting_key(job):
+    """The key a job is stored under: its posting id, or title, company and location"""
+    return job.get('posting_id') or (f"{job.get('source')}:{job.get('title')}|"
+                                     f"{job.get('company')}|{job.get('location')}")
+
+
+class JobStore:
+    """Every scraped job posting, kept in a normalized SQLite database
+
+    Companies, locations, sources and skills live in lookup tables; jobs
+    point at them by id and skills are linked through job_skills, with
+    indexes on each. Jobs are upserted in batches of `batch_size`, one
+    transaction per batch, keyed by posting id, so a posting scraped again
+    is updated rather than duplicated. The database runs in WAL mode, so
+    the analyzer can query it while a search is writing.
+
+    Mock jobs are never stored: they would skew historical trends.
+    """
+
+    def __init__(self, path, batch_size=500):
+        self.path = path
+        self.batch_size = batch_size
+        self.stats = {'stored': 0, 'batches': 0, 'skipped_mock': 0, 'seconds': 0.0}
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        # name -> id of each lookup table, filled as names are seen
+        self._ids = {table: {} for table in ('companies', 'locations', 'sources', 'skills')}
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def add_jobs(self, jobs):
+        """Insert or update scraped jobs; returns the number stored"""
+        jobs = list(jobs)
+        scraped = [job for job in jobs if job.get('data_quality') != 'mock']
+        start = time.perf_counter()
+        with self._lock:
+            for first in range(0, len(scraped), self.batch_size):
+                self._upsert(scraped[first:first + self.batch_size])
+            self.stats['stored'] += len(scraped)
+            self.stats['skipped_mock'] += len(jobs) - len(scraped)
+            self.stats['seconds'] += time.perf_counter() - start
+        return len(scraped)
+
+    def _upsert(self, batch):
+        """Write one batch in a single transaction (lock held)"""
+        # Later copies of a posting in the same batch win
+        batch = list({posting_key(job): job for job in batch}.items())
+        now = time.time()
+        with self._conn:
+            dimension_ids = {field: self._lookup_ids(table, (job.get(field) for _, job in batch))
+                             for field, (table, _) in DIMENSIONS.items()}
+            self._conn.executemany(_UPSERT, [
+                (key, job.get('title'),
+                 dimension_ids['company'].get(job.get('company')),
+                 dimension_ids['location'].get(job.get('location')),
+                 dimension_ids['source'].get(job.get('source')),
+                 job.get('job_type'), job.get('salary'), job.get('date_posted'),
+                 job.get('description'), job.get('url'), job.get('data_quality'), now, now)
+                for key, job in batch
+            ])
+
+            keys = [key for key, _ in batch]
+            job_ids = dict(self._conn.execute(
+                f"SELECT posting_id, id FROM jobs WHERE posting_id IN ({','.join('?' * len(keys))})", keys
+            ))
+            skill_lists = [(job_ids[key], _skill_list(job)) for key, job in batch]
+            skill_ids = self._lookup_ids('skills', (skill for _, skills in skill_lists for skill in skills))
+            self._conn.executemany("DELETE FROM job_skills WHERE job_id = ?",
+                                   [(job_id,) for job_id, _ in skill_lists])
+            self._conn.executemany("INSERT OR IGNORE INTO job_skills (job_id, skill_id) VALUES (?, ?)",
+                                   [(job_id, skill_ids[skill])
+                                    for job_id, skills in skill_lists for skill in skills])
+        self.stats['batches'] += 1
+
+    def _lookup_ids(self, table, names):
+        """name -> id in a lookup table, inserting the names not there yet"""
+        cache = self._ids[table]
+        missing = list({name for name in names if name and name not in cache})
+        if missing:
+            self._conn.executemany(f"INSERT OR IGNORE INTO {table} (name) VALUES (?)",
+                                   [(name,) for name in missing])
+            for first in range(0, len(missing), 500):
+                chunk = missing[first:first + 500]
+                cache.update(self._conn.execute(
+                    f"SELECT name, id FROM {table} WHERE name IN ({','.join('?' * len(chunk))})", chunk
+                ))
+        return cache
+
+    def _where(self, skill=None, location=None, company=None, source=None, since=None, until=None,
+               days=None, remote=False):
+        """SQL condition on `jobs` (and its parameters) for the query filters
+
+        skill, company and source match exactly (ignoring case), location
+        matches any location containing it; since/until bound date_posted
+        ('YYYY-MM-DD'), days keeps postings from the last `days` days.
+        """
+        conditions, params = [], []
+        if skill:
+            conditions.append("jobs.id IN (SELECT job_id FROM job_skills WHERE skill_id IN "
+                              "(SELECT id FROM skills WHERE name = ? COLLATE NOCASE))")
+            params.append(skill)
+        if location:
+            conditions.append("jobs.location_id IN (SELECT id FROM locations WHERE name LIKE ?)")
+            params.append(f"%{location}%")
+        if company:
+            conditions.append("jobs.company_id IN (SELECT id FROM companies WHERE name = ? COLLATE NOCASE)")
+            params.append(company)
+        if source:
+            conditions.append("jobs.source_id IN (SELECT id FROM sources WHERE name = ? COLLATE NOCASE)")
+            params.append(source)
+        if days:
+            since = max(since or '', (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d'))
+        if since:
+            conditions.append("jobs.date_posted >= ?")
+            params.append(since)
+        if until:
+            conditions.append("jobs.date_posted <= ?")
+            params.append(until)
+        if remote:
+            conditions.append("(jobs.location_id IN (SELECT id FROM locations WHERE name LIKE '%remote%') "
+                              "OR jobs.job_type LIKE '%remote%')")
+        return ' AND '.join(conditions) or '1', params
+
+    def _query(self, sql, params):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def count(self, **filters):
+        """Number of stored jobs matching the filters (see _where)"""
+        where, params = self._where(**filters)
+        return self._query(f"SELECT COUNT(*) FROM jobs WHERE {where}", params)[0][0]
+
+    def count_by(self, field, limit=None, **filters):
+        """[(value, jobs)] for a field, most common first"""
+        if field not in GROUP_FIELDS:
+            raise ValueError(f"Cannot group jobs by {field!r}")
+        where, params = self._where(**filters)
+        if field in DIMENSIONS:
+            table, column = DIMENSIONS[field]
+            sql = (f"SELECT {table}.name, COUNT(*) AS jobs FROM jobs "
+                   f"LEFT JOIN {table} ON {table}.id = jobs.{column} "
+                   f"WHERE {where} GROUP BY jobs.{column}")
+        else:
+            sql = f"SELECT jobs.{field}, COUNT(*) AS jobs FROM jobs WHERE {where} GROUP BY jobs.{field}"
+        sql += " ORDER BY jobs DESC"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return self._query(sql, params)
+
+    def skill_counts(self, limit=None, **filters):
+        """[(skill, jobs listing it)], most common first"""
+        where, params = self._where(**filters)
+        sql = ("SELECT skills.name, COUNT(*) AS jobs FROM job_skills "
+               "JOIN skills ON skills.id = job_skills.skill_id "
+               f"WHERE job_skills.job_id IN (SELECT id FROM jobs WHERE {where}) "
+               "GROUP BY job_skills.skill_id ORDER BY jobs DESC")
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return self._query(sql, params)
+
+    def salaries(self, **filters):
+        """Salary strings of the matching jobs that have one"""
+        where, params = self._where(**filters)
+        return [salary for (salary,) in self._query(
+            f"SELECT salary FROM jobs WHERE {where} AND salary IS NOT NULL AND salary != ''", params)]
+
+    def jobs(self, limit=None, **filters):
+        """The matching jobs as JobRecords, most recently scraped first"""
+        where, params = self._where(**filters)
+        sql = ("SELECT jobs.posting_id, jobs.title, companies.name, locations.name, sources.name, "
+               "jobs.job_type, jobs.salary, jobs.date_posted, jobs.description, jobs.url, "
+               "jobs.data_quality, jobs.first_seen, "
+               "(SELECT GROUP_CONCAT(skills.name, char(31)) FROM job_skills "
+               " JOIN skills ON skills.id = job_skills.skill_id WHERE job_skills.job_id = jobs.id) "
+               "FROM jobs LEFT JOIN companies ON companies.id = jobs.company_id "
+               "LEFT JOIN locations ON locations.id = jobs.location_id "
+               "LEFT JOIN sources ON sources.id = jobs.source_id "
+               f"WHERE {where} ORDER BY jobs.last_seen DESC, jobs.id")
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return [JobRecord(title=title, company=company, location=location,
+                          skills=skills.split('\x1f') if skills else [], date_posted=date_posted,
+                          source=source, salary=salary, description=description, job_type=job_type,
+                          url=url, data_quality=data_quality, posting_id=posting_id,
+                          first_seen=datetime.fromtimestamp(first_seen).strftime('%Y-%m-%d %H:%M:%S'))
+                for (posting_id, title, company, location, source, job_type, salary, date_posted,
+                     description, url, data_quality, first_seen, skills) in self._query(sql, params)]
+
+    def forget_older_than(self, days):
+        """Drop postings not scraped for `days` days"""
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM jobs WHERE last_seen < ?",
+                                      (time.time() - days * 86400,)).rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _skill_list(job):
+    skills = job.get('skills') or []
+    if isinstance(skills, str):
+        skills = skills.split(', ')
+    return list(dict.fromkeys(skill for skill in skills if skill))
+
+
+# Example usage
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    from synthetic_data import SyntheticJobGenerator
+
+    jobs = SyntheticJobGenerator(seed=0, as_of=datetime.now().strftime('%Y-%m-%d')).generate(100_000)
+    for i, job in enumerate(jobs):
+        job['posting_id'] = f"synthetic:{i}"
+        job['data_quality'] = 'live'
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = JobStore(os.path.join(temp_dir, 'jobs.sqlite3'))
+        start = time.perf_counter()
+        store.add_jobs(jobs)
+        print(f"💾 Stored {len(store):,} jobs in {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        top_skills = store.skill_counts(limit=5, location='New York', days=30)
+        python_jobs = store.count(skill='python', days=30)
+        print(f"🔎 Last 30 days: {python_jobs:,} Python jobs; top New York skills {top_skills} "
+              f"({(time.perf_counter() - start) * 1000:.0f} ms)")
+        store.close()
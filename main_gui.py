@@ -7,9 +7,14 @@ from datetime import datetime
 import json
 import csv
 from job_scraper import RealJobScraper
-from data_analyzer import JobDataAnalyzer
+from data_analyzer import JobDataAnalyzer, RunningTrends
+from job_dedup import JobDeduplicator
+from job_snapshot import open_snapshot, save_snapshot
 import webbrowser
 
+# Rows shown in the jobs listing (large snapshots would freeze the tree view)
+MAX_LISTED_JOBS = 5000
+
 class JobTrendAnalyzerGUI:
     def __init__(self, root):
         self.root = root
@@ -17,11 +22,16 @@ class JobTrendAnalyzerGUI:
         self.root.geometry("1200x800")
         self.root.configure(bg='#f0f0f0')
         
-        # Initialize components
+        # Initialize components (Chrome starts lazily, see warm_up_scraper)
         self.scraper = RealJobScraper()
-        self.analyzer = JobDataAnalyzer()
+        self.analyzer = JobDataAnalyzer(store=self.scraper.job_store)
+        self.deduplicator = JobDeduplicator()
         self.jobs_data = []
         self.trends_data = {}
+        self.job_rows = {}  # id(job) -> jobs tree item
+        # Live counters shown while a search is still running
+        self.running_trends = RunningTrends()
+        self.live_trends_changed = False
         
         # Queue for thread communication
         self.queue = queue.Queue()
@@ -31,6 +41,23 @@ class JobTrendAnalyzerGUI:
         
         # Start queue processing
         self.process_queue()
+        
+        # Warm up Selenium once the window is on screen
+        self.root.after(500, self.warm_up_scraper)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+    
+    def warm_up_scraper(self):
+        """Start Chrome in the background if a browser-rendered source is selected"""
+        if any(var.get() and self.scraper.sources[name].uses_browser
+               for name, var in self.source_vars.items()):
+            self.scraper.warm_up_selenium()
+    
+    def on_close(self):
+        """Release scraper resources and close the window"""
+        try:
+            self.scraper.close()
+        finally:
+            self.root.destroy()
     
     def create_widgets(self):
         """Create the main GUI interface"""
@@ -84,16 +111,12 @@ class JobTrendAnalyzerGUI:
         sources_frame = tk.LabelFrame(search_frame, text="Data Sources", bg='#f0f0f0')
         sources_frame.pack(fill='x', padx=10, pady=10)
         
-        self.linkedin_var = tk.BooleanVar(value=True)
-        self.glassdoor_var = tk.BooleanVar(value=True)
-        self.indeed_var = tk.BooleanVar(value=True)
-        
-        tk.Checkbutton(sources_frame, text="LinkedIn", variable=self.linkedin_var, 
-                      bg='#f0f0f0', font=('Arial', 10)).pack(anchor='w', padx=5, pady=2)
-        tk.Checkbutton(sources_frame, text="Glassdoor", variable=self.glassdoor_var, 
-                      bg='#f0f0f0', font=('Arial', 10)).pack(anchor='w', padx=5, pady=2)
-        tk.Checkbutton(sources_frame, text="Indeed", variable=self.indeed_var, 
-                      bg='#f0f0f0', font=('Arial', 10)).pack(anchor='w', padx=5, pady=2)
+        # One checkbox per registered job source
+        self.source_vars = {}
+        for name in self.scraper.sources:
+            self.source_vars[name] = tk.BooleanVar(value=True)
+            tk.Checkbutton(sources_frame, text=name, variable=self.source_vars[name], 
+                          bg='#f0f0f0', font=('Arial', 10)).pack(anchor='w', padx=5, pady=2)
         
         # Search options
         options_frame = tk.LabelFrame(search_frame, text="Search Options", bg='#f0f0f0')
@@ -103,15 +126,37 @@ class JobTrendAnalyzerGUI:
                 font=('Arial', 10), bg='#f0f0f0').pack(anchor='w', padx=5, pady=2)
         
         self.max_jobs_var = tk.StringVar(value="50")
-        max_jobs_spinbox = tk.Spinbox(options_frame, from_=10, to=200, 
+        max_jobs_spinbox = tk.Spinbox(options_frame, from_=10, to=1000, 
                                      textvariable=self.max_jobs_var, width=10)
         max_jobs_spinbox.pack(anchor='w', padx=5, pady=2)
         
+        self.fetch_details_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(options_frame, text="Fetch full job details (slower)",
+                      variable=self.fetch_details_var, bg='#f0f0f0',
+                      font=('Arial', 10)).pack(anchor='w', padx=5, pady=2)
+        
+        self.merge_duplicates_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(options_frame, text="Merge duplicate postings across sources",
+                      variable=self.merge_duplicates_var, bg='#f0f0f0',
+                      font=('Arial', 10)).pack(anchor='w', padx=5, pady=2)
+        
         # Search button
         self.search_button = tk.Button(search_frame, text="🔍 Start Analysis", 
                                       command=self.start_search, font=('Arial', 12, 'bold'),
                                       bg='#3498db', fg='white', height=2, width=20)
-        self.search_button.pack(pady=20)
+        self.search_button.pack(pady=(20, 5))
+        
+        # Trends over every posting stored by earlier searches, without scraping
+        history_frame = tk.Frame(search_frame, bg='#f0f0f0')
+        history_frame.pack(pady=(0, 10))
+        tk.Label(history_frame, text="Last", bg='#f0f0f0').pack(side='left')
+        self.history_days_var = tk.StringVar(value="30")
+        tk.Spinbox(history_frame, from_=1, to=365, textvariable=self.history_days_var,
+                  width=4).pack(side='left', padx=2)
+        tk.Label(history_frame, text="days", bg='#f0f0f0').pack(side='left')
+        self.history_button = tk.Button(history_frame, text="📚 Analyze History",
+                                       command=self.start_history, bg='#2980b9', fg='white')
+        self.history_button.pack(side='left', padx=(5, 0))
         
         # Export buttons
         export_frame = tk.LabelFrame(search_frame, text="Export Data", bg='#f0f0f0')
@@ -123,6 +168,10 @@ class JobTrendAnalyzerGUI:
                  bg='#95a5a6', fg='white', width=15).pack(pady=2)
         tk.Button(export_frame, text="📈 Generate Charts", command=self.generate_charts,
                  bg='#95a5a6', fg='white', width=15).pack(pady=2)
+        tk.Button(export_frame, text="💾 Save Snapshot", command=self.save_snapshot,
+                 bg='#95a5a6', fg='white', width=15).pack(pady=2)
+        tk.Button(export_frame, text="📂 Open Snapshot", command=self.open_snapshot,
+                 bg='#95a5a6', fg='white', width=15).pack(pady=2)
     
     def create_results_panel(self, parent):
         """Create the results display panel"""
@@ -160,9 +209,7 @@ class JobTrendAnalyzerGUI:
         self.summary_text.insert('1.0', "Welcome to Real-Time Job Trend Analyzer!\n\n"
                                         "Enter a skill and location, then click 'Start Analysis' to begin.\n\n"
                                         "This tool will scrape real job data from:\n"
-                                        "• LinkedIn Jobs\n"
-                                        "• Glassdoor\n"
-                                        "• Indeed\n\n"
+                                        + "".join(f"• {name}\n" for name in self.scraper.sources) + "\n"
                                         "And provide comprehensive analysis including:\n"
                                         "• Top job titles and companies\n"
                                         "• Required skills analysis\n"
@@ -277,8 +324,9 @@ class JobTrendAnalyzerGUI:
             messagebox.showerror("Error", "Please enter a skill to search for!")
             return
         
-        # Disable search button
+        # Disable search buttons
         self.search_button.config(state='disabled', text="🔄 Searching...")
+        self.history_button.config(state='disabled')
         
         # Clear previous results
         self.clear_results()
@@ -287,6 +335,42 @@ class JobTrendAnalyzerGUI:
         search_thread = threading.Thread(target=self.search_jobs, daemon=True)
         search_thread.start()
     
+    def start_history(self):
+        """Analyze the stored postings for the skill and location in a separate thread"""
+        if self.analyzer.store is None:
+            messagebox.showinfo("History", "Job storage is turned off; there is no history to analyze.")
+            return
+        
+        self.search_button.config(state='disabled')
+        self.history_button.config(state='disabled')
+        self.clear_results()
+        threading.Thread(target=self.analyze_history, daemon=True).start()
+    
+    def analyze_history(self):
+        """Analyze stored postings (runs in separate thread)"""
+        try:
+            skill = self.skill_var.get().strip()
+            location = self.location_var.get().strip()
+            days = int(self.history_days_var.get())
+            
+            self.queue.put(('status', f'Analyzing stored postings from the last {days} days...'))
+            self.queue.put(('progress', 20))
+            trends = self.analyzer.analyze_history(skill, location, days)
+            if not trends:
+                self.queue.put(('status', 'No stored postings match this search yet'))
+                return
+            
+            self.queue.put(('progress', 70))
+            jobs = self.analyzer.store.jobs(limit=1000, skill=skill, location=location, days=days)
+            self.queue.put(('results', (jobs, trends)))
+            self.queue.put(('progress', 100))
+            self.queue.put(('status', f"History analysis complete! {trends['total_jobs']} stored postings "
+                                      f"(showing the {len(jobs)} most recent)"))
+        except Exception as e:
+            self.queue.put(('error', str(e)))
+        finally:
+            self.queue.put(('search_complete', None))
+    
     def search_jobs(self):
         """Search for jobs (runs in separate thread)"""
         try:
@@ -298,27 +382,38 @@ class JobTrendAnalyzerGUI:
             self.queue.put(('status', 'Initializing job search...'))
             self.queue.put(('progress', 10))
             
-            all_jobs = []
+            # Scrape all selected sources concurrently
+            sources = [name for name, var in self.source_vars.items() if var.get()]
+            self.queue.put(('status', f"Scraping {', '.join(sources)} jobs..."))
+            self.queue.put(('progress', 20))
             
-            # Scrape from selected sources
-            if self.linkedin_var.get():
-                self.queue.put(('status', 'Scraping LinkedIn jobs...'))
-                self.queue.put(('progress', 20))
-                linkedin_jobs = self.scraper.scrape_linkedin(skill, location, max_jobs)
-                all_jobs.extend(linkedin_jobs)
-                self.queue.put(('progress', 40))
+            # Jobs are shown page by page as soon as any source has parsed one
+            all_jobs = []
+            expected_jobs = max(max_jobs * len(sources), 1)
+            for source, jobs in self.scraper.iter_sources(skill, location, max_jobs, sources):
+                all_jobs.extend(jobs)
+                self.queue.put(('partial_results', jobs))
+                self.queue.put(('status', f'{source}: +{len(jobs)} jobs ({len(all_jobs)} so far)'))
+                self.queue.put(('progress', 20 + 60 * min(len(all_jobs) / expected_jobs, 1)))
             
-            if self.glassdoor_var.get():
-                self.queue.put(('status', 'Scraping Glassdoor jobs...'))
-                glassdoor_jobs = self.scraper.scrape_glassdoor(skill, location, max_jobs)
-                all_jobs.extend(glassdoor_jobs)
-                self.queue.put(('progress', 60))
+            # The same posting is often listed on several boards; keep it once
+            # (before fetching details, so duplicates are not fetched twice)
+            if self.merge_duplicates_var.get() and all_jobs:
+                self.queue.put(('status', 'Merging duplicate postings...'))
+                merged_jobs = self.deduplicator.deduplicate(all_jobs)
+                if len(merged_jobs) < len(all_jobs):
+                    self.queue.put(('deduplicated', merged_jobs))
+                    self.queue.put(('status', f'Merged {len(all_jobs) - len(merged_jobs)} duplicate postings'))
+                all_jobs = merged_jobs
             
-            if self.indeed_var.get():
-                self.queue.put(('status', 'Scraping Indeed jobs...'))
-                indeed_jobs = self.scraper.scrape_indeed(skill, location, max_jobs)
-                all_jobs.extend(indeed_jobs)
-                self.queue.put(('progress', 80))
+            # Fetch detail pages for real descriptions, salaries and skills
+            if self.fetch_details_var.get() and all_jobs:
+                self.queue.put(('status', 'Fetching job details...'))
+                for done, job in enumerate(self.scraper.enrich_jobs(all_jobs), 1):
+                    self.queue.put(('job_details', job))
+                    if done % 10 == 0 or done == len(all_jobs):
+                        self.queue.put(('status', f'Fetched details for {done}/{len(all_jobs)} jobs'))
+                        self.queue.put(('progress', 80 + 10 * done / len(all_jobs)))
             
             # Analyze data
             self.queue.put(('status', 'Analyzing job trends...'))
@@ -328,7 +423,9 @@ class JobTrendAnalyzerGUI:
             # Update GUI with results
             self.queue.put(('results', (all_jobs, trends)))
             self.queue.put(('progress', 100))
-            self.queue.put(('status', f'Analysis complete! Found {len(all_jobs)} jobs'))
+            new_jobs = sum(1 for job in all_jobs if job.get('is_new'))
+            self.queue.put(('status', f'Analysis complete! Found {len(all_jobs)} jobs '
+                                      f'({new_jobs} not seen in earlier searches)'))
             
         except Exception as e:
             self.queue.put(('error', str(e)))
@@ -345,22 +442,39 @@ class JobTrendAnalyzerGUI:
                     self.status_var.set(data)
                 elif message_type == 'progress':
                     self.progress_var.set(data)
+                elif message_type == 'partial_results':
+                    self.add_jobs(data)
+                elif message_type == 'deduplicated':
+                    self.replace_jobs(data)
+                elif message_type == 'job_details':
+                    self.update_job_row(data)
                 elif message_type == 'results':
                     self.jobs_data, self.trends_data = data
+                    self.live_trends_changed = False
                     self.update_results()
                 elif message_type == 'error':
                     messagebox.showerror("Error", f"Search failed: {data}")
                 elif message_type == 'search_complete':
                     self.search_button.config(state='normal', text="🔍 Start Analysis")
+                    self.history_button.config(state='normal')
                     
         except queue.Empty:
             pass
         
+        if self.live_trends_changed:
+            self.refresh_live_trends()
+        
         # Schedule next check
         self.root.after(100, self.process_queue)
     
     def clear_results(self):
         """Clear all previous results"""
+        self.jobs_data = []
+        self.trends_data = {}
+        self.job_rows = {}
+        self.running_trends = RunningTrends()
+        self.live_trends_changed = False
+        
         # Clear summary
         self.summary_text.delete('1.0', tk.END)
         
@@ -398,6 +512,8 @@ class JobTrendAnalyzerGUI:
     
     def update_summary(self):
         """Update the summary tab"""
+        source_counts = "\n".join(f"{name} Jobs: {self.trends_data.get('sources', {}).get(name, 0)}"
+                                  for name in self.scraper.sources)
         summary = f"""
 REAL-TIME JOB TREND ANALYSIS SUMMARY
 {'='*50}
@@ -408,9 +524,9 @@ Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 OVERVIEW
 --------
 Total Jobs Found: {self.trends_data.get('total_jobs', 0)}
-LinkedIn Jobs: {self.trends_data.get('sources', {}).get('LinkedIn', 0)}
-Glassdoor Jobs: {self.trends_data.get('sources', {}).get('Glassdoor', 0)}
-Indeed Jobs: {self.trends_data.get('sources', {}).get('Indeed', 0)}
+{source_counts}
+Data Quality: {self.trends_data.get('data_quality', {}).get('live', 0)} live, {self.trends_data.get('data_quality', {}).get('degraded', 0)} degraded, {self.trends_data.get('data_quality', {}).get('mock', 0)} mock
+Cross-posted Jobs: {self.trends_data.get('cross_posted', 0)} (listed on several sources, counted once)
 
 TOP INSIGHTS
 ------------
@@ -434,20 +550,66 @@ JOB TYPE DISTRIBUTION
         
         self.summary_text.insert('1.0', summary)
     
+    def add_jobs(self, jobs):
+        """Merge a batch of jobs from one source into the listing"""
+        self.jobs_data.extend(jobs)
+        self.insert_job_rows(jobs)
+        self.running_trends.add(jobs)
+        self.live_trends_changed = True
+    
+    def replace_jobs(self, jobs):
+        """Show a new job list (e.g. after merging duplicates) while the search runs"""
+        self.jobs_data = list(jobs)
+        self.update_jobs_listing()
+        self.running_trends = RunningTrends()
+        self.running_trends.add(self.jobs_data)
+        self.live_trends_changed = True
+    
+    def refresh_live_trends(self):
+        """Show the running top titles and skills while the search continues"""
+        self.live_trends_changed = False
+        live = self.running_trends.snapshot()
+        self.top_jobs_listbox.delete(0, tk.END)
+        for job_title, count in live['top_jobs'][:10]:
+            self.top_jobs_listbox.insert(tk.END, f"{job_title} ({count})")
+        self.top_skills_listbox.delete(0, tk.END)
+        for skill, count in live['top_skills'][:10]:
+            self.top_skills_listbox.insert(tk.END, f"{skill} ({count})")
+    
     def update_jobs_listing(self):
         """Update the jobs listing tab"""
-        for job in self.jobs_data:
-            self.jobs_tree.insert('', 'end', values=(
-                job.get('title', 'N/A'),
-                job.get('company', 'N/A'),
-                job.get('location', 'N/A'),
-                job.get('source', 'N/A'),
-                job.get('salary', 'Not specified'),
-                job.get('date_posted', 'N/A')
-            ))
+        for item in self.jobs_tree.get_children():
+            self.jobs_tree.delete(item)
+        self.job_rows = {}
+        self.insert_job_rows(self.jobs_data[:MAX_LISTED_JOBS])
+    
+    def insert_job_rows(self, jobs):
+        """Append rows for the given jobs to the jobs tree"""
+        for job in jobs:
+            self.job_rows[id(job)] = self.jobs_tree.insert('', 'end', values=self.job_row_values(job))
+    
+    def update_job_row(self, job):
+        """Refresh the row of a job whose details were just fetched"""
+        item = self.job_rows.get(id(job))
+        if item is not None:
+            self.jobs_tree.item(item, values=self.job_row_values(job))
+    
+    def job_row_values(self, job):
+        return (
+            job.get('title', 'N/A'),
+            job.get('company', 'N/A'),
+            job.get('location', 'N/A'),
+            job.get('source', 'N/A'),
+            job.get('salary', 'Not specified'),
+            job.get('date_posted', 'N/A')
+        )
     
     def update_trends(self):
         """Update the trends tab"""
+        self.top_jobs_listbox.delete(0, tk.END)
+        self.top_skills_listbox.delete(0, tk.END)
+        self.trends_text.delete('1.0', tk.END)
+        
         # Update top jobs
         for job_title, count in self.trends_data.get('top_jobs', [])[:10]:
             self.top_jobs_listbox.insert(tk.END, f"{job_title} ({count})")
@@ -498,8 +660,9 @@ TOP 10 HIRING COMPANIES
                 'location': self.location_var.get(),
                 'max_jobs': self.max_jobs_var.get()
             },
-            'jobs_data': self.jobs_data[:5],  # Show first 5 jobs
-            'trends_data': self.trends_data
+            'jobs_data': [dict(job) for job in self.jobs_data[:5]],  # Show first 5 jobs
+            'trends_data': self.trends_data,
+            'scraper_stats': self.scraper.performance_stats()
         }, indent=2)
         
         self.raw_data_text.insert('1.0', raw_data)
@@ -521,7 +684,7 @@ JOB DETAILS
 Title: {job.get('title', 'N/A')}
 Company: {job.get('company', 'N/A')}
 Location: {job.get('location', 'N/A')}
-Source: {job.get('source', 'N/A')}
+Source: {', '.join(job.get('sources') or [job.get('source', 'N/A')])} ({job.get('data_quality', 'live')} data)
 Job Type: {job.get('job_type', 'N/A')}
 Date Posted: {job.get('date_posted', 'N/A')}
 Salary: {job.get('salary', 'Not specified')}
@@ -581,19 +744,60 @@ Job URL:
             try:
                 with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
                     fieldnames = ['title', 'company', 'location', 'skills', 'date_posted', 
-                                'source', 'salary', 'job_type', 'description', 'url']
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+                                'source', 'sources', 'salary', 'job_type', 'description', 'url', 'data_quality']
+                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
                     
                     writer.writeheader()
                     for job in self.jobs_data:
-                        job_copy = job.copy()
-                        job_copy['skills'] = ', '.join(job.get('skills', []))
-                        writer.writerow(job_copy)
+                        row = {field: job.get(field) for field in fieldnames}
+                        row['skills'] = ', '.join(job.get('skills') or [])
+                        row['sources'] = ', '.join(job.get('sources') or [job.get('source', '')])
+                        writer.writerow(row)
                 
                 messagebox.showinfo("Success", f"Data exported to {filename}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export: {e}")
     
+    def save_snapshot(self):
+        """Save the jobs and trends as a snapshot that reopens instantly"""
+        if not self.jobs_data:
+            messagebox.showwarning("Warning", "No data to save!")
+            return
+        
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".jobsnap",
+            filetypes=[("Job snapshots", "*.jobsnap"), ("All files", "*.*")],
+            title="Save job snapshot"
+        )
+        
+        if filename:
+            try:
+                save_snapshot(filename, self.jobs_data, self.trends_data)
+                messagebox.showinfo("Success", f"Snapshot saved to {filename}")
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to save snapshot: {e}")
+    
+    def open_snapshot(self):
+        """Show the jobs and trends of a saved snapshot (memory-mapped, nothing is parsed)"""
+        filename = filedialog.askopenfilename(
+            filetypes=[("Job snapshots", "*.jobsnap"), ("All files", "*.*")],
+            title="Open job snapshot"
+        )
+        
+        if filename:
+            try:
+                jobs, trends = open_snapshot(filename)
+                if not trends and len(jobs):
+                    trends = self.analyzer.analyze_trends(jobs)
+                self.clear_results()
+                self.jobs_data, self.trends_data = jobs, trends
+                self.update_results()
+                shown = min(len(jobs), MAX_LISTED_JOBS)
+                self.status_var.set(f"Opened {len(jobs)} jobs from {os.path.basename(filename)}"
+                                    + (f" (listing the first {shown})" if shown < len(jobs) else ""))
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to open snapshot: {e}")
+    
     def generate_charts(self):
         """Generate and display charts"""
         if not self.trends_data:
@@ -0,0 +1,124 @@
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+# Status codes that mean "slow down"
+THROTTLE_STATUSES = (429, 503)
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Token bucket whose rate adapts to server feedback
+
+    reserve() always takes a token and returns how long the caller has to
+    wait before using it, so concurrent callers queue up at the bucket's rate
+    instead of all retrying at once.
+    """
+
+    def __init__(self, rate, burst):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, now):
+        self._refill(now)
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.blocked_until - now)
+
+
+class HostRateLimiter:
+    """Per-host rate limiter shared by every scraper
+
+    Each host gets a token bucket with a configured requests/sec ceiling and
+    burst size. A 429/503 halves the host's rate and honours Retry-After;
+    every successful response adds back a slice of the ceiling (AIMD), so the
+    limiter settles at the highest rate the site tolerates.
+    """
+
+    def __init__(self, default_rate=2.0, default_burst=5, host_limits=None,
+                 min_rate=0.05, recovery_fraction=0.1):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.host_limits = host_limits or {}
+        self.min_rate = min_rate
+        self.recovery_fraction = recovery_fraction
+
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'throttled': 0, 'waited_seconds': 0.0}
+
+    @staticmethod
+    def host_of(url_or_host):
+        return urlsplit(url_or_host).netloc if '://' in url_or_host else url_or_host
+
+    def _bucket(self, host):
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate, burst = self.host_limits.get(host, (self.default_rate, self.default_burst))
+            bucket = self._buckets[host] = TokenBucket(rate, burst)
+        return bucket
+
+    def reserve(self, url_or_host):
+        """Take a token for a host; returns the seconds to wait before sending"""
+        host = self.host_of(url_or_host)
+        with self._lock:
+            wait = self._bucket(host).reserve(time.monotonic())
+            self.stats['requests'] += 1
+            self.stats['waited_seconds'] += wait
+        return wait
+
+    async def acquire(self, url_or_host):
+        """Wait (asynchronously) until a request to the host may be sent"""
+        wait = self.reserve(url_or_host)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, url_or_host):
+        """Block the calling thread until a request to the host may be sent"""
+        wait = self.reserve(url_or_host)
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_response(self, url_or_host, status_code, retry_after=None):
+        """Adapt the host's rate to a response status"""
+        host = self.host_of(url_or_host)
+        with self._lock:
+            bucket = self._bucket(host)
+            if status_code in THROTTLE_STATUSES:
+                self.stats['throttled'] += 1
+                bucket.rate = max(self.min_rate, bucket.rate / 2)
+                delay = parse_retry_after(retry_after)
+                if delay is None:
+                    delay = 1.0 / bucket.rate
+                bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
+                bucket.tokens = min(bucket.tokens, 0.0)
+            elif status_code is not None and 200 <= status_code < 400:
+                bucket.rate = min(bucket.max_rate, bucket.rate + bucket.max_rate * self.recovery_fraction)
+
+    def current_rates(self):
+        """Current requests/sec per host"""
+        with self._lock:
+            return {host: round(bucket.rate, 3) for host, bucket in self._buckets.items()}
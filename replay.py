@@ -0,0 +1,136 @@
+import json
+import sqlite3
+import threading
+import time
+
+from response_cache import normalize_url
+
+RECORD, REPLAY = 'record', 'replay'
+
+
+class ArchiveMiss(LookupError):
+    """A replayed request has no recorded response"""
+
+
+def archive_key(url):
+    """Archive key of a URL: its normalized form without the scheme
+
+    http and https requests for the same page share a recording, so the
+    fixture server can rebuild keys from plain-HTTP request paths.
+    """
+    return normalize_url(url).split('://', 1)[-1]
+
+
+class ArchivedResponse:
+    """A response stored in a ResponseArchive"""
+
+    def __init__(self, url, status_code, headers, content, elapsed, recorded_at):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.elapsed = elapsed
+        self.recorded_at = recorded_at
+
+
+class ResponseArchive:
+    """Raw job-board responses recorded by the scraper, for offline replay
+
+    In 'record' mode the HTTP engine stores every network response it gets
+    (the response cache is bypassed so nothing is missed). In 'replay' mode
+    the engine answers every request from the archive and never touches the
+    network; unrecorded URLs fail with ArchiveMiss. The archive is one SQLite
+    file, so a recorded session can be copied around and served again by
+    fixture_server.FixtureServer.
+    """
+
+    def __init__(self, path, mode=REPLAY):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown archive mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self.stats = {'recorded': 0, 'replayed': 0, 'missed': 0}
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                elapsed REAL NOT NULL,
+                recorded_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    @property
+    def recording(self):
+        return self.mode == RECORD
+
+    @property
+    def replaying(self):
+        return self.mode == REPLAY
+
+    def record(self, url, final_url, status_code, headers, content, elapsed=0.0):
+        """Store the response to a request (the latest recording of a URL wins)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, url, status, headers, body, elapsed, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (archive_key(url), final_url, status_code, json.dumps(headers), content, elapsed,
+                 time.time())
+            )
+            self._conn.commit()
+            self.stats['recorded'] += 1
+
+    def lookup(self, url):
+        """Return the recorded response to a request, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status, headers, body, elapsed, recorded_at FROM responses WHERE key = ?",
+                (archive_key(url),)
+            ).fetchone()
+            self.stats['replayed' if row else 'missed'] += 1
+        if row is None:
+            return None
+        url, status, headers, body, elapsed, recorded_at = row
+        return ArchivedResponse(url, status, json.loads(headers), body, elapsed, recorded_at)
+
+    def add_page(self, url, html, status_code=200, headers=None):
+        """Store a hand-made page (for building fixture archives without a live site)"""
+        if isinstance(html, str):
+            html = html.encode('utf-8')
+        headers = headers or {'Content-Type': 'text/html; charset=utf-8'}
+        self.record(url, url, status_code, headers, html)
+
+    def urls(self):
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT url FROM responses ORDER BY recorded_at")]
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# Example usage
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 2:
+        print("Usage: python replay.py ARCHIVE")
+        sys.exit(1)
+
+    archive = ResponseArchive(sys.argv[1])
+    try:
+        print(f"📼 {len(archive)} recorded responses in {archive.path}")
+        for url in archive.urls():
+            print(f"   {url}")
+    finally:
+        archive.close()
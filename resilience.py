@@ -0,0 +1,89 @@
+import asyncio
+import random
+import threading
+import time
+
+import aiohttp
+
+# Responses worth retrying: throttling and temporary server errors
+TRANSIENT_STATUSES = (429, 500, 502, 503, 504)
+TRANSIENT_ERRORS = (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError)
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for transient fetch failures"""
+
+    def __init__(self, max_attempts=3, base_delay=0.5, max_delay=8.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def is_transient(self, result):
+        if result.error is not None:
+            return isinstance(result.error, TRANSIENT_ERRORS)
+        return result.status_code in TRANSIENT_STATUSES
+
+    def should_retry(self, result, attempt):
+        """attempt is the zero-based number of the attempt that produced result"""
+        return attempt + 1 < self.max_attempts and self.is_transient(result)
+
+    def delay(self, attempt):
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """Stops calling a failing job source for a cooldown period
+
+    closed    - calls go through; consecutive failures are counted
+    open      - calls are refused until the cooldown has passed
+    half-open - one trial call is let through; success closes the circuit,
+                failure opens it again, and a trial given up without an
+                outcome (release_trial) lets the next call try again
+    """
+
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half-open'
+
+    def __init__(self, failure_threshold=3, cooldown=300):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow_request(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.cooldown:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def remaining_cooldown(self):
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def release_trial(self):
+        """Abandon a half-open trial that ended without success or failure"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                # opened_at is left as is: the cooldown has passed, so the next call is a new trial
+                self.state = self.OPEN
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def snapshot(self):
+        return {'state': self.state, 'failures': self.failures,
+                'cooldown_remaining': round(self.remaining_cooldown(), 1)}
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that never change the page content
+TRACKING_PARAMS = ('utm_', 'trk', 'refId', 'trackingId')
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+# Request headers that must not be part of the cache key
+CONDITIONAL_HEADERS = {'if-none-match', 'if-modified-since'}
+
+
+def normalize_url(url):
+    """Canonical form of a URL: lowercase host, no default port, no fragment,
+    tracking parameters dropped and query parameters sorted"""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if not name.startswith(TRACKING_PARAMS))
+    return urlunsplit((scheme, host, parts.path or '/', urlencode(query), ''))
+
+
+def _header(headers, name):
+    """Case-insensitive header lookup on a plain dict"""
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+class CachedResponse:
+    """A response stored in the ResponseCache"""
+
+    def __init__(self, key, url, status_code, headers, content, etag, last_modified, stored_at):
+        self.key = key
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+
+    def age(self):
+        return time.time() - self.stored_at
+
+    def validators(self):
+        """Conditional request headers for revalidating this response"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Persistent HTTP response cache backed by SQLite
+
+    Entries are keyed by normalized URL plus request headers. Entries younger
+    than `ttl` seconds are served directly; older ones are revalidated with
+    ETag/Last-Modified when the server supplied them. The total body size is
+    kept under `max_bytes` by evicting the least recently used entries.
+    """
+
+    def __init__(self, path, ttl=3600, max_bytes=200 * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)")
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def make_key(self, url, headers=None):
+        """Cache key for a request"""
+        header_items = sorted((name.lower(), value) for name, value in (headers or {}).items()
+                              if name.lower() not in CONDITIONAL_HEADERS)
+        raw = normalize_url(url) + '\n' + json.dumps(header_items)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def is_fresh(self, entry):
+        return entry.age() < self.ttl
+
+    def lookup(self, key):
+        """Return the cached response for a key (fresh or stale), or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status, headers, body, etag, last_modified, stored_at "
+                "FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+
+        url, status, headers, body, etag, last_modified, stored_at = row
+        return CachedResponse(key, url, status, json.loads(headers), body, etag, last_modified, stored_at)
+
+    def store(self, key, url, status_code, headers, content):
+        """Store a successful response, evicting old entries if over the size limit"""
+        if status_code != 200 or 'no-store' in (_header(headers, 'Cache-Control') or ''):
+            return
+        if len(content) > self.max_bytes:
+            return
+
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, status, headers, body, etag, last_modified, stored_at, last_access, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, status_code, json.dumps(headers), content, _header(headers, 'ETag'),
+                 _header(headers, 'Last-Modified'), now, now, len(content))
+            )
+            self._total_bytes += len(content) - (old[0] if old else 0)
+            self.stats['stores'] += 1
+            self._evict()
+            self._conn.commit()
+
+    def refresh(self, key):
+        """Mark a cached response as fresh again after a 304 Not Modified"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("UPDATE responses SET stored_at = ?, last_access = ? WHERE key = ?",
+                               (now, now, key))
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop least recently used entries until under max_bytes (lock held)"""
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_access LIMIT 32"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                break
+            for key, size in rows:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total_bytes -= size
+                self.stats['evictions'] += 1
+                if self._total_bytes <= self.max_bytes:
+                    break
+
+    def record(self, outcome):
+        """Count a lookup outcome: 'hits', 'revalidated' or 'misses'"""
+        with self._lock:
+            self.stats[outcome] += 1
+
+    def hit_rate(self):
+        """Share of lookups served without downloading the body again"""
+        served = self.stats['hits'] + self.stats['revalidated']
+        lookups = served + self.stats['misses']
+        return served / lookups if lookups else 0.0
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._total_bytes = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
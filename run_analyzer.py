@@ -30,7 +30,7 @@ import importlib.util
 def check_requirements():
     """Check if required packages are installed"""
     required_packages = [
-        'tkinter', 'requests', 'beautifulsoup4', 'selenium', 
+        'tkinter', 'aiohttp', 'beautifulsoup4', 'selenium', 
         'pandas', 'matplotlib', 'seaborn', 'numpy'
     ]
     
@@ -61,19 +61,10 @@ def install_requirements():
         return False
 
 def check_chromedriver():
-    """Check if ChromeDriver is available"""
+    """Check if ChromeDriver is available (result is cached between launches)"""
     try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        
-        options = Options()
-        options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        
-        driver = webdriver.Chrome(options=options)
-        driver.quit()
-        return True
+        from driver_pool import probe_chromedriver
+        return probe_chromedriver()
     except Exception:
         return False
 
@@ -0,0 +1,194 @@
+import hashlib
+import json
+import math
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+
+class BloomFilter:
+    """Set membership in a fixed bit array, with false positives but no false negatives
+
+    Sized for `capacity` keys at `error_rate` false positives; each key sets
+    `hash_count` bits derived from one BLAKE2 digest (double hashing).
+    """
+
+    def __init__(self, capacity=1_000_000, error_rate=0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, key):
+        bits = self._bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class SeenIndex:
+    """Persistent record of every job posting scraped, backed by SQLite
+
+    Postings are keyed by a stable posting id (see JobSource.posting_id)
+    and keep first-seen and last-seen timestamps plus the fields parsed
+    from their detail page, so a recurring search only fetches detail pages
+    for postings it has not seen before. A Bloom filter answers most "is
+    this new?" questions without touching the database: on a search full
+    of new postings almost no lookups reach SQLite. It is filled from the
+    stored keys in a background thread, so opening a large index doesn't
+    delay start-up; until then every lookup goes to SQLite.
+    """
+
+    def __init__(self, path, capacity=1_000_000, error_rate=0.001):
+        self.path = path
+        self.stats = {'new': 0, 'seen': 0, 'bloom_skips': 0, 'lookups': 0}
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS postings (
+                key TEXT PRIMARY KEY,
+                source TEXT,
+                url TEXT,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                times_seen INTEGER NOT NULL DEFAULT 1,
+                details TEXT
+            )
+        """)
+        self._conn.commit()
+
+        self._bloom = None
+        # New keys recorded while the filter is being filled, added to it once it is ready
+        self._added_while_loading = []
+        threading.Thread(target=self._load_bloom, args=(capacity, error_rate),
+                         name='seen-index-bloom', daemon=True).start()
+
+    def _load_bloom(self, capacity, error_rate):
+        """Fill the Bloom filter from the stored keys (background thread)"""
+        try:
+            conn = sqlite3.connect(self.path)
+            try:
+                count = conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+                bloom = BloomFilter(max(capacity, count * 2), error_rate)
+                for (key,) in conn.execute("SELECT key FROM postings"):
+                    bloom.add(key)
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"⚠️ Seen-posting filter not loaded, using the database only: {e}")
+            bloom = None
+        with self._lock:
+            if bloom is not None:
+                for key in self._added_while_loading:
+                    bloom.add(key)
+            self._added_while_loading = None
+            self._bloom = bloom
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+
+    def _lookup(self, keys):
+        """key -> (first_seen, details) for the keys already indexed (lock held)"""
+        bloom = self._bloom
+        maybe_known = keys if bloom is None else [key for key in keys if key in bloom]
+        self.stats['bloom_skips'] += len(keys) - len(maybe_known)
+        found = {}
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(maybe_known), 500):
+            chunk = maybe_known[start:start + 500]
+            self.stats['lookups'] += len(chunk)
+            rows = self._conn.execute(
+                f"SELECT key, first_seen, details FROM postings WHERE key IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            for key, first_seen, details in rows:
+                found[key] = (first_seen, details)
+        return found
+
+    def observe(self, jobs):
+        """Record a batch of scraped jobs; returns the number of new postings
+
+        Every job needs a 'posting_id'. Each job gets 'first_seen' (when the
+        posting was first scraped) and 'is_new' (first seen by this call).
+        """
+        now = time.time()
+        keys = list(dict.fromkeys(job['posting_id'] for job in jobs))
+        with self._lock:
+            known = self._lookup(keys)
+            new_keys = {key for key in keys if key not in known}
+            self._conn.executemany(
+                "INSERT INTO postings (key, source, url, first_seen, last_seen) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET last_seen = excluded.last_seen, "
+                "times_seen = times_seen + 1",
+                [(job['posting_id'], job.get('source'), job.get('url'), now, now)
+                 for job in {job['posting_id']: job for job in jobs}.values()]
+            )
+            self._conn.commit()
+            if self._bloom is not None:
+                for key in new_keys:
+                    self._bloom.add(key)
+            elif self._added_while_loading is not None:
+                self._added_while_loading.extend(new_keys)
+            self.stats['new'] += len(new_keys)
+            self.stats['seen'] += len(keys) - len(new_keys)
+
+        for job in jobs:
+            first_seen = known[job['posting_id']][0] if job['posting_id'] in known else now
+            job['first_seen'] = datetime.fromtimestamp(first_seen).strftime('%Y-%m-%d %H:%M:%S')
+            job['is_new'] = job['posting_id'] in new_keys
+        return len(new_keys)
+
+    def known_details(self, keys):
+        """key -> detail fields stored for the postings that have them"""
+        with self._lock:
+            found = self._lookup(list(keys))
+        return {key: json.loads(details) for key, (_, details) in found.items() if details}
+
+    def store_details(self, key, fields):
+        """Remember the fields parsed from a posting's detail page"""
+        with self._lock:
+            self._conn.execute("UPDATE postings SET details = ? WHERE key = ?", (json.dumps(fields), key))
+            self._conn.commit()
+
+    def forget_older_than(self, days):
+        """Drop postings not seen for `days` days (the Bloom filter keeps them until restart)"""
+        with self._lock:
+            deleted = self._conn.execute("DELETE FROM postings WHERE last_seen < ?",
+                                         (time.time() - days * 86400,)).rowcount
+            self._conn.commit()
+        return deleted
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# Example usage
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        index = SeenIndex(os.path.join(temp_dir, 'seen.sqlite3'))
+        first = [{'posting_id': f'indeed:{i}', 'source': 'Indeed'} for i in range(1000)]
+        second = [{'posting_id': f'indeed:{i}', 'source': 'Indeed'} for i in range(900, 1100)]
+        print(f"🆕 First search: {index.observe(first)} new postings")
+        print(f"🆕 Second search: {index.observe(second)} new postings of {len(second)}")
+        print(f"📊 {index.stats}")
+        index.close()
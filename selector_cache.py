@@ -0,0 +1,99 @@
+import threading
+import soupsieve
+
+
+class SelectorCache:
+    """Adaptive CSS selector strategy cache
+
+    Scrapers list several candidate selectors per field because each site's
+    markup varies. The cache compiles every selector once, remembers which
+    one last matched for each (source, field) and tries that one first.
+
+    Statistics per (source, field):
+      hits     - the remembered selector matched straight away
+      misses   - another candidate had to be tried (markup may have changed)
+      failures - no candidate matched at all
+    """
+
+    def __init__(self):
+        self._compiled = {}
+        self._winners = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def compile(self, selector):
+        """Return the compiled form of a selector, compiling it only once"""
+        pattern = self._compiled.get(selector)
+        if pattern is None:
+            pattern = self._compiled[selector] = soupsieve.compile(selector)
+        return pattern
+
+    def _candidates(self, key, selectors):
+        winner = self._winners.get(key)
+        if winner is None or winner == selectors[0]:
+            return selectors
+        return [winner] + [selector for selector in selectors if selector != winner]
+
+    def _record(self, key, selector, first_try):
+        with self._lock:
+            stats = self._stats.setdefault(key, {'hits': 0, 'misses': 0, 'failures': 0})
+            if selector is None:
+                stats['failures'] += 1
+                return
+            if first_try:
+                stats['hits'] += 1
+            else:
+                stats['misses'] += 1
+            self._winners[key] = selector
+
+    def select_one(self, source, field, element, selectors):
+        """Return the first element matched by the best candidate selector"""
+        key = (source, field)
+        for i, selector in enumerate(self._candidates(key, selectors)):
+            match = self.compile(selector).select_one(element)
+            if match is not None:
+                self._record(key, selector, i == 0)
+                return match
+        self._record(key, None, False)
+        return None
+
+    def select(self, source, field, element, selectors):
+        """Return all elements matched by the first candidate selector that matches"""
+        key = (source, field)
+        for i, selector in enumerate(self._candidates(key, selectors)):
+            matches = self.compile(selector).select(element)
+            if matches:
+                self._record(key, selector, i == 0)
+                return matches
+        self._record(key, None, False)
+        return []
+
+    def text(self, source, field, element, selectors):
+        """Return the stripped text of the first match, or None"""
+        match = self.select_one(source, field, element, selectors)
+        return match.get_text(strip=True) if match is not None else None
+
+    def drain_stats(self):
+        """Return the statistics gathered since the last drain and reset them"""
+        with self._lock:
+            stats = {f"{source}.{field}": dict(counts, winner=self._winners.get((source, field)))
+                     for (source, field), counts in self._stats.items()}
+            self._stats = {}
+        return stats
+
+
+class SelectorStats:
+    """Aggregates SelectorCache statistics drained from parse workers"""
+
+    def __init__(self):
+        self.fields = {}
+        self._lock = threading.Lock()
+
+    def merge(self, stats):
+        with self._lock:
+            for field, counts in stats.items():
+                total = self.fields.setdefault(field, {'hits': 0, 'misses': 0, 'failures': 0, 'winner': None})
+                for name in ('hits', 'misses', 'failures'):
+                    total[name] += counts[name]
+                if counts.get('winner'):
+                    total['winner'] = counts['winner']
@@ -0,0 +1,177 @@
+import json
+import os
+import re
+import threading
+
+# Bundled taxonomy; JOB_ANALYZER_SKILLS may point at a replacement file
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'skills_taxonomy.json')
+
+# Terms this short ("Go", "R", "AI", "SQL") only match with their exact case
+SHORT_TERM_LENGTH = 3
+
+# A skill may not be glued to other word characters; trailing + and # would
+# make "C" match inside "C++" and "C#"
+LEFT_BOUNDARY = r'(?<![A-Za-z0-9_])'
+RIGHT_BOUNDARY = r'(?![A-Za-z0-9_+#])'
+# Single letters also reject "C-level", "R&D" and "R's"
+SINGLE_LETTER_GUARD = r"(?![-&'])"
+
+# Spaces and hyphens inside a term match any run of spaces or hyphens, so
+# "machine learning", "Machine-Learning" and "machine  learning" are equal
+_SEPARATORS = re.compile(r'[\s\-]+')
+
+
+def _normalize(term):
+    return _SEPARATORS.sub(' ', term.strip())
+
+
+def load_taxonomy(path):
+    """Load a skills taxonomy JSON file
+
+    Format: {"categories": {category: {skill: [alias, ...]}},
+             "case_sensitive": [term, ...]}
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _trie_pattern(terms):
+    """Regex matching any of the terms, built from a character trie
+
+    Alternatives sharing a prefix are merged, so the regex engine walks each
+    position of the text once instead of trying every term in turn. Longer
+    terms are tried before their prefixes ("Java" before "JavaScript" can
+    never win).
+    """
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node, depth):
+        terminal = '' in node
+        branches = []
+        for char in sorted(key for key in node if key):
+            piece = r'[\s\-]+' if char == ' ' else re.escape(char)
+            branches.append(piece + build(node[char], depth + 1))
+        if not branches:
+            return SINGLE_LETTER_GUARD if depth == 1 else ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if not terminal:
+            return body
+        if depth == 1:
+            return '(?:' + body + '|' + SINGLE_LETTER_GUARD + ')'
+        return '(?:' + body + ')?'
+
+    return build(trie, 0)
+
+
+class SkillMatcher:
+    """Finds skills from a taxonomy in free text with one compiled regex
+
+    Every skill name and alias is normalized and inserted into a character
+    trie that is compiled into a single regular expression with word
+    boundaries, so "Java" no longer matches inside "JavaScript" and "Git"
+    no longer matches inside "Digital". Matches are mapped back to the
+    canonical skill name.
+    """
+
+    def __init__(self, taxonomy):
+        self.categories = {}
+        self._insensitive = {}  # lowercased normalized term -> skill
+        self._sensitive = {}    # normalized term -> skill
+        case_sensitive = {_normalize(term) for term in taxonomy.get('case_sensitive', [])}
+
+        for category, skills in taxonomy.get('categories', {}).items():
+            for skill, aliases in skills.items():
+                self.categories[skill] = category
+                for term in [skill] + list(aliases):
+                    self._add_term(_normalize(term), skill, case_sensitive)
+
+        insensitive = _trie_pattern(self._insensitive)
+        sensitive = _trie_pattern(self._sensitive)
+        alternatives = []
+        if self._insensitive:
+            alternatives.append(f'(?P<i>(?i:{insensitive}))')
+        if self._sensitive:
+            alternatives.append(f'(?P<s>{sensitive})')
+        self.pattern = re.compile(LEFT_BOUNDARY + '(?:' + '|'.join(alternatives or ['(?!)']) + ')'
+                                  + RIGHT_BOUNDARY)
+
+    def _add_term(self, term, skill, case_sensitive):
+        if term in case_sensitive or len(term) <= SHORT_TERM_LENGTH:
+            table, key = self._sensitive, term
+        else:
+            table, key = self._insensitive, term.lower()
+        existing = table.setdefault(key, skill)
+        if existing != skill:
+            raise ValueError(f"Skill term '{term}' is defined for both '{existing}' and '{skill}'")
+
+    @classmethod
+    def from_file(cls, path):
+        return cls(load_taxonomy(path))
+
+    @property
+    def skills(self):
+        return list(self.categories)
+
+    def category_of(self, skill):
+        return self.categories.get(skill)
+
+    def _skill_for(self, match):
+        text = _normalize(match.group())
+        if match.lastgroup == 'i':
+            return self._insensitive[text.lower()]
+        return self._sensitive[text]
+
+    def tag(self, text, limit=None):
+        """Skills mentioned in a text, unique and in order of first mention"""
+        found = []
+        if not text:
+            return found
+        seen = set()
+        for match in self.pattern.finditer(text):
+            skill = self._skill_for(match)
+            if skill not in seen:
+                seen.add(skill)
+                found.append(skill)
+                if limit is not None and len(found) >= limit:
+                    break
+        return found
+
+    def tag_many(self, texts, limit=None):
+        """Tag a batch of texts; returns one skill list per text"""
+        tag = self.tag
+        return [tag(text, limit) for text in texts]
+
+
+_default_matcher = None
+_default_lock = threading.Lock()
+
+
+def default_matcher():
+    """Shared matcher for the bundled taxonomy (or $JOB_ANALYZER_SKILLS), built on first use"""
+    global _default_matcher
+    if _default_matcher is None:
+        with _default_lock:
+            if _default_matcher is None:
+                path = os.environ.get('JOB_ANALYZER_SKILLS') or DEFAULT_TAXONOMY_PATH
+                _default_matcher = SkillMatcher.from_file(path)
+    return _default_matcher
+
+
+# Example usage
+if __name__ == "__main__":
+    matcher = default_matcher()
+    print(f"📚 Loaded {len(matcher.skills)} skills")
+
+    samples = [
+        "Senior JavaScript Engineer (React, Node.js) - Digital Agency",
+        "Java/Spring Boot developer with AWS, k8s and CI/CD experience",
+        "Machine-learning engineer: Python, PyTorch, scikit learn, C++ and Go",
+        "C-level reporting on R&D budgets in Excel",
+    ]
+    for sample, skills in zip(samples, matcher.tag_many(samples)):
+        print(f"   {sample}\n      → {', '.join(skills) or 'no skills'}")
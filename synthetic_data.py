@@ -0,0 +1,361 @@
+import json
+import time
+
+import numpy as np
+
+from skill_matcher import default_matcher
+
+# Most demanded skills first; the rest of the taxonomy follows in the long tail
+POPULAR_SKILLS = [
+    'Python', 'JavaScript', 'SQL', 'Java', 'AWS', 'React', 'Docker', 'TypeScript', 'Kubernetes',
+    'Git', 'Node.js', 'C#', 'Azure', 'Linux', 'Go', 'C++', 'PostgreSQL', 'Google Cloud', 'Terraform',
+    'Spring Boot', 'Django', 'Angular', 'Vue.js', 'MongoDB', 'Redis', 'Apache Kafka', 'Apache Spark',
+    'Machine Learning', 'REST API', 'GraphQL', 'Agile', 'CI/CD', 'Tableau', 'Excel', 'Pandas',
+    'TensorFlow', 'PyTorch', 'Flask', 'Ruby', 'PHP', 'Scala', 'Kotlin', 'Swift', 'Rust', 'Jenkins',
+    'Snowflake', 'Apache Airflow', 'MySQL', 'HTML', 'CSS',
+]
+# Skills that appear in job titles ("Senior Python Developer")
+TITLE_SKILL_COUNT = 40
+TITLE_LEVELS = {'': 1.0, 'Junior': 0.7, 'Senior': 1.3, 'Lead': 1.45, 'Principal': 1.6, 'Staff': 1.55}
+TITLE_LEVEL_WEIGHTS = [0.35, 0.1, 0.3, 0.1, 0.05, 0.1]
+TITLE_ROLES = ['Developer', 'Engineer', 'Architect', 'Consultant', 'Specialist', 'Analyst',
+               'Team Lead', 'Programmer']
+TITLE_ROLE_WEIGHTS = [0.3, 0.35, 0.06, 0.06, 0.07, 0.08, 0.04, 0.04]
+
+# Most common locations first
+DEFAULT_CITIES = [
+    'New York, NY', 'San Francisco, CA', 'Remote', 'Seattle, WA', 'Austin, TX', 'Boston, MA',
+    'Chicago, IL', 'Los Angeles, CA', 'Denver, CO', 'Atlanta, GA', 'Dallas, TX', 'Washington, DC',
+    'San Jose, CA', 'Raleigh, NC', 'Phoenix, AZ', 'Philadelphia, PA', 'Houston, TX', 'Minneapolis, MN',
+    'Portland, OR', 'San Diego, CA', 'Salt Lake City, UT', 'Pittsburgh, PA', 'Nashville, TN',
+    'Charlotte, NC', 'Detroit, MI', 'Columbus, OH', 'Miami, FL', 'Kansas City, MO', 'St. Louis, MO',
+    'Madison, WI',
+]
+DEFAULT_JOB_TYPES = {'Full-time': 0.68, 'Contract': 0.12, 'Remote': 0.08, 'Hybrid': 0.07, 'Part-time': 0.05}
+DEFAULT_SOURCES = {'LinkedIn': 0.45, 'Indeed': 0.35, 'Glassdoor': 0.2}
+SOURCE_URLS = {
+    'LinkedIn': 'https://www.linkedin.com/jobs/view/{}',
+    'Glassdoor': 'https://www.glassdoor.com/job-listing/{}',
+    'Indeed': 'https://www.indeed.com/viewjob?jk={}',
+}
+COMPANY_PREFIXES = [
+    'Acme', 'Blue', 'Bright', 'Cedar', 'Cloud', 'Core', 'Crimson', 'Delta', 'Echo', 'Evergreen',
+    'First', 'Globe', 'Golden', 'Granite', 'Harbor', 'Helix', 'Horizon', 'Iron', 'Keystone', 'Lumen',
+    'Maple', 'Meridian', 'Nimbus', 'North', 'Nova', 'Oak', 'Omni', 'Orbit', 'Pacific', 'Peak',
+    'Pioneer', 'Prime', 'Quantum', 'Red', 'River', 'Summit', 'Silver', 'Stellar', 'Vertex', 'Zenith',
+]
+COMPANY_SUFFIXES = [
+    'Analytics', 'Bank', 'Capital', 'Cloud', 'Consulting', 'Data', 'Digital', 'Dynamics', 'Energy',
+    'Financial', 'Foods', 'Games', 'Health', 'Holdings', 'Insurance', 'Labs', 'Logistics', 'Media',
+    'Medical', 'Mobility', 'Networks', 'Partners', 'Pharma', 'Retail', 'Robotics', 'Security',
+    'Software', 'Solutions', 'Systems', 'Technologies',
+]
+# Fixed reference date, so the same seed gives the same records on any day
+DEFAULT_AS_OF = '2025-01-01'
+
+# Columns stored for every record (besides the skill lists and vocabularies)
+COLUMNS = ('job_id', 'title', 'company', 'location', 'source', 'job_type', 'salary_min',
+           'salary_max', 'date_posted', 'duplicate_of')
+
+
+def _zipf_weights(count, exponent):
+    weights = 1.0 / np.arange(1, count + 1) ** exponent
+    return weights / weights.sum()
+
+
+def _normalized(weights):
+    weights = np.asarray(weights, dtype=np.float64)
+    return weights / weights.sum()
+
+
+class SyntheticJobColumns:
+    """A block of synthetic jobs stored column by column
+
+    Text fields are integer codes into the vocabularies in `vocab`; each
+    job's skills are skill codes in `skills[skill_offsets[i]:skill_offsets[i + 1]]`;
+    salaries are in thousands (0: no salary). Job dicts in the scraper's
+    format are only built on request by to_jobs().
+    """
+
+    def __init__(self, vocab, columns, skills, skill_offsets):
+        self.vocab = vocab
+        self.columns = columns
+        self.skills = skills
+        self.skill_offsets = skill_offsets
+
+    def __len__(self):
+        return len(self.columns['job_id'])
+
+    @classmethod
+    def concatenate(cls, blocks):
+        """Join blocks produced by the same generator into one"""
+        blocks = list(blocks)
+        columns = {name: np.concatenate([block.columns[name] for block in blocks]) for name in COLUMNS}
+        offsets = [np.zeros(1, dtype=np.int64)]
+        base = 0
+        for block in blocks:
+            offsets.append(block.skill_offsets[1:] + base)
+            base += block.skill_offsets[-1]
+        return cls(blocks[0].vocab, columns, np.concatenate([block.skills for block in blocks]),
+                   np.concatenate(offsets))
+
+    def to_jobs(self, start=0, stop=None):
+        """Job dicts (same fields as scraped jobs) for rows start:stop"""
+        stop = len(self) if stop is None else min(stop, len(self))
+        cols = {name: self.columns[name][start:stop] for name in COLUMNS}
+        vocab = self.vocab
+        titles = [vocab['title'][code] for code in cols['title'].tolist()]
+        companies = [vocab['company'][code] for code in cols['company'].tolist()]
+        locations = [vocab['location'][code] for code in cols['location'].tolist()]
+        sources = [vocab['source'][code] for code in cols['source'].tolist()]
+        job_types = [vocab['job_type'][code] for code in cols['job_type'].tolist()]
+        dates = np.datetime_as_string(cols['date_posted'], unit='D').tolist()
+        skill_names = vocab['skill']
+        offsets = (self.skill_offsets[start:stop + 1] - self.skill_offsets[start]).tolist()
+        flat = self.skills[self.skill_offsets[start]:self.skill_offsets[stop]].tolist()
+
+        jobs = []
+        for i, (job_id, salary_min, salary_max) in enumerate(zip(cols['job_id'].tolist(),
+                                                                  cols['salary_min'].tolist(),
+                                                                  cols['salary_max'].tolist())):
+            skills = [skill_names[code] for code in flat[offsets[i]:offsets[i + 1]]]
+            title, company, location, source = titles[i], companies[i], locations[i], sources[i]
+            jobs.append({
+                'title': title,
+                'company': company,
+                'location': location,
+                'skills': skills,
+                'date_posted': dates[i],
+                'source': source,
+                'salary': f"${salary_min}k - ${salary_max}k" if salary_min else None,
+                'description': f"{company} is hiring a {title} in {location}. "
+                               f"Experience with {', '.join(skills)} is required.",
+                'job_type': job_types[i],
+                'url': SOURCE_URLS.get(source, 'https://jobs.example.com/{}').format(job_id),
+                'data_quality': 'mock',
+            })
+        return jobs
+
+    def iter_jobs(self, batch_size=100_000):
+        """Yield job dict lists of up to batch_size jobs"""
+        for start in range(0, len(self), batch_size):
+            yield self.to_jobs(start, start + batch_size)
+
+    def save_npz(self, path, compressed=False):
+        """Write the columns and vocabularies to a NumPy .npz file"""
+        arrays = {name: self.columns[name] for name in COLUMNS}
+        arrays.update({f'vocab_{name}': np.array(values) for name, values in self.vocab.items()})
+        arrays['skills'] = self.skills
+        arrays['skill_offsets'] = self.skill_offsets
+        (np.savez_compressed if compressed else np.savez)(path, **arrays)
+
+    @classmethod
+    def load_npz(cls, path):
+        with np.load(path) as data:
+            vocab = {name[len('vocab_'):]: data[name].tolist() for name in data.files
+                     if name.startswith('vocab_')}
+            columns = {name: data[name] for name in COLUMNS}
+            return cls(vocab, columns, data['skills'], data['skill_offsets'])
+
+
+class SyntheticJobGenerator:
+    """Seeded, vectorized generator of realistic job records for load testing
+
+    Every field of a block of records is drawn with one NumPy call, so
+    millions of jobs take seconds. Skills, titles, cities and companies
+    follow Zipf-like popularity curves (`zipf` sets how steep); salaries are
+    log-normal around `salary_median` scaled by seniority; posting dates
+    decay exponentially over `days_back` days before `as_of`. A share
+    `duplicate_rate` of records re-post an earlier job of the same block
+    (same title, company, location and skills; new source, URL and date),
+    with `duplicate_of` pointing at the original's job_id.
+
+    The same seed and batch size always give the same records.
+    """
+
+    def __init__(self, seed=0, skills=None, skill_weights=None, cities=None, city_weights=None,
+                 companies=2000, job_types=None, sources=None, skills_per_job=(3, 8),
+                 salary_share=0.45, salary_median=115, salary_spread=0.25, days_back=60,
+                 duplicate_rate=0.05, zipf=1.05, as_of=DEFAULT_AS_OF):
+        self.seed = seed
+        self.skills_per_job = skills_per_job
+        self.salary_share = salary_share
+        self.salary_median = salary_median
+        self.salary_spread = salary_spread
+        self.days_back = days_back
+        self.duplicate_rate = duplicate_rate
+        self.as_of = np.datetime64(as_of, 'D')
+        self._rng = np.random.default_rng(seed)
+        self._next_id = 0
+
+        if skills is None:
+            taxonomy = default_matcher().skills
+            skills = [skill for skill in POPULAR_SKILLS if skill in taxonomy]
+            skills += [skill for skill in taxonomy if skill not in skills]
+        self.skill_names = list(skills)
+        self.skill_weights = (_normalized(skill_weights) if skill_weights is not None
+                              else _zipf_weights(len(self.skill_names), zipf))
+
+        self.cities = list(cities or DEFAULT_CITIES)
+        self.city_weights = (_normalized(city_weights) if city_weights is not None
+                             else _zipf_weights(len(self.cities), zipf))
+
+        if isinstance(companies, int):
+            companies = [f"{prefix} {suffix}" for suffix in COMPANY_SUFFIXES
+                         for prefix in COMPANY_PREFIXES][:companies]
+        self.companies = list(companies)
+        self.company_weights = _zipf_weights(len(self.companies), zipf)
+
+        job_types = job_types or DEFAULT_JOB_TYPES
+        self.job_types = list(job_types)
+        self.job_type_weights = _normalized(list(job_types.values()))
+        sources = sources or DEFAULT_SOURCES
+        self.sources = list(sources)
+        self.source_weights = _normalized(list(sources.values()))
+
+        # Title vocabulary: every level x title skill x role, weighted by all three
+        title_skills = min(TITLE_SKILL_COUNT, len(self.skill_names))
+        self.titles = [' '.join(part for part in (level, self.skill_names[skill], role) if part)
+                       for level in TITLE_LEVELS for skill in range(title_skills) for role in TITLE_ROLES]
+        self.title_weights = np.einsum('i,j,k->ijk', _normalized(TITLE_LEVEL_WEIGHTS),
+                                       _normalized(self.skill_weights[:title_skills]),
+                                       _normalized(TITLE_ROLE_WEIGHTS)).ravel()
+        codes = np.arange(len(self.titles))
+        self._title_skill = (codes // len(TITLE_ROLES)) % title_skills
+        self._title_pay = np.array(list(TITLE_LEVELS.values()))[codes // (title_skills * len(TITLE_ROLES))]
+
+    @property
+    def vocab(self):
+        return {'title': self.titles, 'company': self.companies, 'location': self.cities,
+                'source': self.sources, 'job_type': self.job_types, 'skill': self.skill_names}
+
+    def columns(self, count):
+        """Generate the next `count` records as a SyntheticJobColumns block"""
+        rng = self._rng
+        ids = np.arange(self._next_id, self._next_id + count, dtype=np.int64)
+        self._next_id += count
+
+        title = rng.choice(len(self.titles), size=count, p=self.title_weights).astype(np.int32)
+        company = rng.choice(len(self.companies), size=count, p=self.company_weights).astype(np.int32)
+        location = rng.choice(len(self.cities), size=count, p=self.city_weights).astype(np.int16)
+        source = rng.choice(len(self.sources), size=count, p=self.source_weights).astype(np.int8)
+        job_type = rng.choice(len(self.job_types), size=count, p=self.job_type_weights).astype(np.int8)
+        days_ago = np.minimum(rng.exponential(self.days_back / 4, size=count), self.days_back - 1).astype(np.int64)
+
+        # Salaries in $k: log-normal around the median, scaled by seniority
+        has_salary = rng.random(count) < self.salary_share
+        midpoint = self.salary_median * self._title_pay[title] * rng.lognormal(0.0, self.salary_spread, count)
+        salary_min = np.where(has_salary, np.round(midpoint * 0.9 / 5) * 5, 0).astype(np.int32)
+        salary_max = np.where(has_salary, np.round(midpoint * 1.15 / 5) * 5, 0).astype(np.int32)
+
+        # Skills: the title's skill first, then draws from the popularity curve
+        low, high = self.skills_per_job
+        max_skills = max(high, 1)
+        drawn = rng.choice(len(self.skill_names), size=(count, max_skills), p=self.skill_weights)
+        drawn[:, 0] = self._title_skill[title]
+        wanted = rng.integers(low, high + 1, size=count)
+        drawn[np.arange(max_skills) >= wanted[:, None]] = -1
+
+        # Re-posts copy an earlier record of the block
+        duplicate_of = np.full(count, -1, dtype=np.int64)
+        if self.duplicate_rate and count > 1:
+            is_duplicate = rng.random(count) < self.duplicate_rate
+            is_duplicate[0] = False
+            original = (rng.random(count) * np.arange(count)).astype(np.int64)
+            # Point re-posts of re-posts at the first posting
+            chained = is_duplicate & is_duplicate[original]
+            while chained.any():
+                original[chained] = original[original[chained]]
+                chained = is_duplicate & is_duplicate[original]
+            rows = np.flatnonzero(is_duplicate)
+            source_rows = original[rows]
+            for column in (title, company, location, job_type, salary_min, salary_max, drawn):
+                column[rows] = column[source_rows]
+            days_ago[rows] = np.maximum(days_ago[source_rows] - rng.integers(0, 4, size=len(rows)), 0)
+            duplicate_of[rows] = ids[source_rows]
+
+        # Drop repeated skills within a job, keeping first mentions in order
+        order = np.argsort(drawn, axis=1, kind='stable')
+        sorted_codes = np.take_along_axis(drawn, order, axis=1)
+        repeated = np.zeros_like(drawn, dtype=bool)
+        repeated_sorted = np.zeros_like(repeated)
+        repeated_sorted[:, 1:] = sorted_codes[:, 1:] == sorted_codes[:, :-1]
+        np.put_along_axis(repeated, order, repeated_sorted, axis=1)
+        keep = (drawn >= 0) & ~repeated
+        skills = drawn[keep].astype(np.int16 if len(self.skill_names) < 2 ** 15 else np.int32)
+        skill_offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(keep.sum(axis=1), out=skill_offsets[1:])
+
+        columns = {
+            'job_id': ids,
+            'title': title,
+            'company': company,
+            'location': location,
+            'source': source,
+            'job_type': job_type,
+            'salary_min': salary_min,
+            'salary_max': salary_max,
+            'date_posted': self.as_of - days_ago.astype('timedelta64[D]'),
+            'duplicate_of': duplicate_of,
+        }
+        return SyntheticJobColumns(self.vocab, columns, skills, skill_offsets)
+
+    def iter_columns(self, count, batch_size=100_000):
+        """Generate `count` records as blocks of up to batch_size records"""
+        for start in range(0, count, batch_size):
+            yield self.columns(min(batch_size, count - start))
+
+    def iter_jobs(self, count, batch_size=100_000):
+        """Generate `count` records as lists of job dicts"""
+        for block in self.iter_columns(count, batch_size):
+            yield block.to_jobs()
+
+    def generate(self, count, batch_size=100_000):
+        """Generate `count` job dicts in memory"""
+        return [job for jobs in self.iter_jobs(count, batch_size) for job in jobs]
+
+    def write_jsonl(self, path, count, batch_size=100_000):
+        """Write `count` job dicts to a JSON Lines file"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for jobs in self.iter_jobs(count, batch_size):
+                f.write('\n'.join(json.dumps(job) for job in jobs))
+                f.write('\n')
+
+    def write_npz(self, path, count, batch_size=100_000, compressed=False):
+        """Write `count` records to a columnar .npz file (see SyntheticJobColumns.load_npz)"""
+        block = SyntheticJobColumns.concatenate(self.iter_columns(count, batch_size))
+        block.save_npz(path, compressed)
+        return block
+
+
+def read_jsonl(path):
+    """Yield the jobs of a JSON Lines file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+# Example usage
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate synthetic job records for load testing")
+    parser.add_argument('count', type=int, help='number of jobs')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--duplicate-rate', type=float, default=0.05)
+    parser.add_argument('--out', help='output file (.jsonl or .npz); omit to generate in memory')
+    args = parser.parse_args()
+
+    generator = SyntheticJobGenerator(seed=args.seed, duplicate_rate=args.duplicate_rate)
+    start = time.perf_counter()
+    if args.out and args.out.endswith('.npz'):
+        generator.write_npz(args.out, args.count)
+    elif args.out:
+        generator.write_jsonl(args.out, args.count)
+    else:
+        block = SyntheticJobColumns.concatenate(generator.iter_columns(args.count))
+        print(f"   Sample: {block.to_jobs(0, 1)[0]}")
+    elapsed = time.perf_counter() - start
+    print(f"✅ Generated {args.count:,} jobs in {elapsed:.2f}s ({args.count / elapsed:,.0f} jobs/s)"
+          + (f" → {args.out}" if args.out else ""))